@@ -5,7 +5,29 @@ This module generates the actual shell commands from high-level
 service/client type and settings, hiding complexity from end users.
 """
 
-from typing import Any, Dict, Optional
+import functools
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# =============================================================================
+# SHARED SHELL SNIPPETS
+# =============================================================================
+
+
+def _start_progress_reporter(requests_file: str, total: Any, interval: int = 5) -> str:
+    """
+    Shell snippet that reports load-loop progress from a background subshell.
+
+    Progress is derived from the number of JSONL records written so far, so the
+    request loops themselves carry no per-iteration ``i % N`` bookkeeping. Pair
+    with ``_STOP_PROGRESS_REPORTER`` once the loops are done.
+    """
+    return f"""# Background progress reporter (counts JSONL records, header excluded)
+(while sleep {interval}; do echo "Progress: $(($(wc -l < {requests_file}) - 1))/{total} requests recorded"; done) &
+PROGRESS_PID=$!"""
+
+
+_STOP_PROGRESS_REPORTER = "kill $PROGRESS_PID 2>/dev/null"
 
 
 # =============================================================================
@@ -197,16 +219,14 @@ psql -h $SERVICE_HOSTNAME -p $SERVICE_PORT -U postgres -d $DB_NAME -c "
 echo "Table created successfully."
 echo ""
 
+{_start_progress_reporter('"$REQUESTS_FILE"', "$((NUM_INSERTS + NUM_SELECTS))")}
+
 # Insert phase
 echo "=== INSERT PHASE ==="
 INSERT_START=$(date +%s.%N)
 insert_errors=0
 
 for i in $(seq 1 $NUM_INSERTS); do
-  if [ $((i % 1000)) -eq 0 ]; then
-    echo "Inserted $i/$NUM_INSERTS records..."
-  fi
-  
   DATA="data_$i"
   VALUE=$((i % 1000))
   PAYLOAD="payload_text_for_record_$i"
@@ -248,10 +268,6 @@ SELECT_START=$(date +%s.%N)
 select_errors=0
 
 for i in $(seq 1 $NUM_SELECTS); do
-  if [ $((i % 1000)) -eq 0 ]; then
-    echo "Executed $i/$NUM_SELECTS selects..."
-  fi
-  
   start_time=$(date +%s.%N)
   start_timestamp=$(date +%s)
   QUERY_TYPE=$((i % 4))
@@ -292,6 +308,7 @@ for i in $(seq 1 $NUM_SELECTS); do
 done
 
 SELECT_END=$(date +%s.%N)
+{_STOP_PROGRESS_REPORTER}
 SELECT_DURATION=$(echo "$SELECT_END - $SELECT_START" | bc)
 SELECT_QPS=$(echo "scale=2; $NUM_SELECTS / $SELECT_DURATION" | bc)
 
@@ -316,12 +333,164 @@ curl -s $SERVICE_URL/api/v2/heartbeat | head -3
 echo 'ChromaDB service is reachable'"""
 
 
+# In-process ChromaDB load driver. Embeddings are generated once up front as a
+# float32 matrix and every request goes over one keep-alive HTTP connection, so
+# the insert/query loops no longer pay a python3 startup plus a fresh curl TCP
+# handshake per vector. numpy/orjson are used when the client node has them;
+# otherwise the stdlib fallbacks produce the same JSONL records.
+_CHROMA_STRESS_DRIVER = r"""
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import http.client
+from urllib.parse import urlsplit
+
+num_vectors, dim, num_queries, top_k, batch_size = (int(a) for a in sys.argv[1:6])
+collection_url = urlsplit(os.environ["API_BASE"] + "/collections/" + os.environ["COLLECTION_ID"])
+requests_file = os.environ["REQUESTS_FILE"]
+headers = {"Content-Type": "application/json"}
+conn = http.client.HTTPConnection(collection_url.hostname, collection_url.port, timeout=60)
+
+
+def random_vectors(n):
+    if np is not None:
+        return np.random.default_rng().random((n, dim), dtype=np.float32)
+    return [[random.random() for _ in range(dim)] for _ in range(n)]
+
+
+if orjson is not None:
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+else:
+    def dumps(obj):
+        return json.dumps(obj, default=lambda a: a.tolist()).encode()
+
+
+def post(path, body):
+    # Keep-alive: http.client reopens the socket by itself after close()
+    try:
+        conn.request("POST", collection_url.path + path, body, headers)
+        resp = conn.getresponse()
+        resp.read()
+        return resp.status
+    except (OSError, http.client.HTTPException):
+        conn.close()
+        return 0
+
+
+progress = {"phase": "", "done": 0, "total": 0}
+
+
+def report_progress():
+    while True:
+        time.sleep(5)
+        print(f"{progress['phase']}: {progress['done']}/{progress['total']}", flush=True)
+
+
+def run_phase(op, path, bodies, total, ok_codes, extra):
+    progress.update(phase=op.upper(), done=0, total=total)
+    errors = 0
+    phase_start = time.perf_counter()
+    with open(requests_file, "ab") as out:
+        for i, (body, count) in enumerate(bodies, 1):
+            start_ts = int(time.time())
+            t0 = time.perf_counter()
+            status = post(path, dumps(body))
+            latency = time.perf_counter() - t0
+            record = {
+                "timestamp_start": start_ts,
+                "timestamp_end": int(time.time()),
+                "latency_s": round(latency, 9),
+                "success": status in ok_codes,
+                "service_type": "chroma",
+                "request_id": f"{op}_{i}",
+                "operation_type": op,
+                "http_status": status,
+            }
+            if record["success"]:
+                record.update(extra(count))
+            else:
+                errors += 1
+                record["error"] = "http_error"
+            out.write(dumps(record) + b"\n")
+            progress["done"] = i
+    return time.perf_counter() - phase_start, errors
+
+
+threading.Thread(target=report_progress, daemon=True).start()
+
+print("")
+print("=== INSERT PHASE ===")
+embeddings = random_vectors(num_vectors)
+insert_bodies = (
+    (
+        {
+            "ids": [f"id_{j + 1}" for j in range(start, min(start + batch_size, num_vectors))],
+            "embeddings": embeddings[start:start + batch_size],
+        },
+        min(batch_size, num_vectors - start),
+    )
+    for start in range(0, num_vectors, batch_size)
+)
+insert_duration, insert_errors = run_phase(
+    "insert", "/add", insert_bodies, -(-num_vectors // batch_size), (200, 201),
+    lambda count: {"vectors": count, "dimension": dim},
+)
+insert_vps = num_vectors / insert_duration if insert_duration else 0.0
+print("Insert phase complete:")
+print(f"  Duration: {insert_duration:.3f}s")
+print(f"  VPS: {insert_vps:.2f}")
+print(f"  Errors: {insert_errors}")
+print("")
+
+print("=== QUERY PHASE ===")
+queries = random_vectors(num_queries)
+query_bodies = (
+    ({"query_embeddings": queries[i:i + 1], "n_results": top_k}, 1)
+    for i in range(num_queries)
+)
+query_duration, query_errors = run_phase(
+    "query", "/query", query_bodies, num_queries, (200,),
+    lambda count: {"top_k": top_k, "dimension": dim},
+)
+query_qps = num_queries / query_duration if query_duration else 0.0
+print("Query phase complete:")
+print(f"  Duration: {query_duration:.3f}s")
+print(f"  QPS: {query_qps:.2f}")
+print(f"  Errors: {query_errors}")
+print("")
+
+print("=== STRESS TEST COMPLETE ===")
+print(f"Insert VPS: {insert_vps:.2f}")
+print(f"Query QPS: {query_qps:.2f}")
+print(f"Total time: {insert_duration + query_duration:.3f}s")
+print(f"Total errors: {insert_errors + query_errors}")
+"""
+
+
 def build_chroma_stress_client_command(settings: Dict[str, Any]) -> str:
-    """Build ChromaDB stress test client command using curl with JSONL output (v2 API)."""
+    """Build ChromaDB stress test client command with JSONL output (v2 API).
+
+    Collection setup stays in shell; the insert/query loops run in a single
+    python3 process (see ``_CHROMA_STRESS_DRIVER``).
+    """
     num_vectors = settings.get("num_vectors", 1000)
     dim = settings.get("dim", 128)
     num_queries = settings.get("num_queries", 100)
     top_k = settings.get("top_k", 10)
+    batch_size = settings.get("batch_size", 1)
     warmup_delay = settings.get("warmup_delay", 5)
 
     # ChromaDB v2 API uses /api/v2/tenants/default_tenant/databases/default_database/collections
@@ -332,6 +501,7 @@ echo "Vectors: {num_vectors}"
 echo "Dimension: {dim}"
 echo "Queries: {num_queries}"
 echo "Top-K: {top_k}"
+echo "Insert batch size: {batch_size}"
 echo ""
 
 # Initialize JSONL output
@@ -368,112 +538,11 @@ if [ -z "$COLLECTION_ID" ]; then
   exit 1
 fi
 
-# Insert phase
-echo ""
-echo "=== INSERT PHASE ==="
-INSERT_START=$(date +%s.%N)
-insert_errors=0
-
-for i in $(seq 1 {num_vectors}); do
-  # Generate embedding using Python with proper JSON formatting
-  start_time=$(date +%s.%N)
-  start_timestamp=$(date +%s)
-  
-  EMBEDDING_JSON=$(python3 << EOF
-import random
-import json
-
-embedding = [random.random() for _ in range({dim})]
-payload = {{"ids": ["id_$i"], "embeddings": [embedding]}}
-print(json.dumps(payload))
-EOF
-)
-  
-  HTTP_CODE=$(curl -s -w "%{{http_code}}" -o /tmp/chroma_resp_$i.json -X POST "$API_BASE/collections/$COLLECTION_ID/add" \\
-    -H "Content-Type: application/json" \\
-    -d "$EMBEDDING_JSON")
-  
-  end_time=$(date +%s.%N)
-  latency=$(echo "$end_time - $start_time" | bc)
-  latency=$(printf "%.9f" $latency)
-  
-  if [ "$HTTP_CODE" = "200" ] || [ "$HTTP_CODE" = "201" ]; then
-    echo '{{"timestamp_start": '$start_timestamp', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": true, "service_type": "chroma", "request_id": "insert_'$i'", "operation_type": "insert", "http_status": '$HTTP_CODE', "vectors": 1, "dimension": {dim}}}' >> "$REQUESTS_FILE"
-  else
-    insert_errors=$((insert_errors + 1))
-    echo '{{"timestamp_start": '$start_timestamp', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": false, "service_type": "chroma", "request_id": "insert_'$i'", "operation_type": "insert", "http_status": '$HTTP_CODE', "error": "http_error"}}' >> "$REQUESTS_FILE"
-  fi
-  
-  if [ $((i % 100)) -eq 0 ]; then
-    echo "Inserted $i/{num_vectors} vectors..."
-  fi
-done
-
-INSERT_END=$(date +%s.%N)
-INSERT_DURATION=$(echo "$INSERT_END - $INSERT_START" | bc)
-INSERT_VPS=$(echo "scale=2; {num_vectors} / $INSERT_DURATION" | bc)
-
-echo "Insert phase complete:"
-echo "  Duration: ${{INSERT_DURATION}}s"
-echo "  VPS: ${{INSERT_VPS}}"
-echo "  Errors: $insert_errors"
-echo ""
-
-# Query phase
-echo "=== QUERY PHASE ==="
-QUERY_START=$(date +%s.%N)
-query_errors=0
-
-for i in $(seq 1 {num_queries}); do
-  # Generate query vector using Python with proper JSON formatting
-  start_time=$(date +%s.%N)
-  start_timestamp=$(date +%s)
-  
-  QUERY_JSON=$(python3 << EOF
-import random
-import json
-
-query_vec = [random.random() for _ in range({dim})]
-payload = {{"query_embeddings": [query_vec], "n_results": {top_k}}}
-print(json.dumps(payload))
-EOF
-)
-  
-  HTTP_CODE=$(curl -s -w "%{{http_code}}" -o /tmp/chroma_query_$i.json -X POST "$API_BASE/collections/$COLLECTION_ID/query" \\
-    -H "Content-Type: application/json" \\
-    -d "$QUERY_JSON")
-  
-  end_time=$(date +%s.%N)
-  latency=$(echo "$end_time - $start_time" | bc)
-  latency=$(printf "%.9f" $latency)
-  
-  if [ "$HTTP_CODE" = "200" ]; then
-    echo '{{"timestamp_start": '$start_timestamp', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": true, "service_type": "chroma", "request_id": "query_'$i'", "operation_type": "query", "http_status": '$HTTP_CODE', "top_k": {top_k}, "dimension": {dim}}}' >> "$REQUESTS_FILE"
-  else
-    query_errors=$((query_errors + 1))
-    echo '{{"timestamp_start": '$start_timestamp', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": false, "service_type": "chroma", "request_id": "query_'$i'", "operation_type": "query", "http_status": '$HTTP_CODE', "error": "http_error"}}' >> "$REQUESTS_FILE"
-  fi
-  
-  if [ $((i % 20)) -eq 0 ]; then
-    echo "Executed $i/{num_queries} queries..."
-  fi
-done
-
-QUERY_END=$(date +%s.%N)
-QUERY_DURATION=$(echo "$QUERY_END - $QUERY_START" | bc)
-QUERY_QPS=$(echo "scale=2; {num_queries} / $QUERY_DURATION" | bc)
-
-echo "Query phase complete:"
-echo "  Duration: ${{QUERY_DURATION}}s"
-echo "  QPS: ${{QUERY_QPS}}"
-echo "  Errors: $query_errors"
-echo ""
-
-echo "=== STRESS TEST COMPLETE ==="
-echo "Insert VPS: ${{INSERT_VPS}}"
-echo "Query QPS: ${{QUERY_QPS}}"
-echo "Total time: $(echo "$QUERY_END - $INSERT_START" | bc)s"
-echo "Total errors: $((insert_errors + query_errors))"
+# Insert and query phases run in one persistent python3 driver
+export API_BASE COLLECTION_ID REQUESTS_FILE
+python3 - {num_vectors} {dim} {num_queries} {top_k} {batch_size} << 'CHROMA_DRIVER_EOF'
+{_CHROMA_STRESS_DRIVER}
+CHROMA_DRIVER_EOF
 """
 
 
@@ -534,7 +603,7 @@ echo "vLLM smoke test completed successfully"
 
 
 def build_vllm_stress_client_command(settings: Dict[str, Any]) -> str:
-    """Build vLLM stress test client command using curl with JSONL output."""
+    """Build vLLM stress test client command using streamed curl requests with JSONL output."""
     model = settings.get("model", "facebook/opt-125m")
     num_requests = settings.get("num_requests", 50)
     max_tokens = settings.get("max_tokens", 64)
@@ -563,31 +632,34 @@ latency_sum=0
 errors=0
 success_count=0
 
+{_start_progress_reporter('"$REQUESTS_FILE"', num_requests)}
+
+# Streamed responses: TTFT comes from curl's time_starttransfer and the token
+# usage from the final SSE chunk (stream_options.include_usage)
+RESPONSE_FILE="/tmp/vllm_stream_$$.txt"
+
 for i in $(seq 1 {num_requests}); do
   echo "Request $i:"
-  start=$(date +%s.%N)
   start_timestamp=$(date +%s)
   
-  response=$(curl -s -X POST "$SERVICE_URL/v1/completions" \\
+  curl_metrics=$(curl -s -N -o "$RESPONSE_FILE" -w '%{{http_code}} %{{time_starttransfer}} %{{time_total}}' \\
+    -X POST "$SERVICE_URL/v1/completions" \\
     -H "Content-Type: application/json" \\
-    -d '{{"model": "{model}", "prompt": "Hello world", "max_tokens": {max_tokens}}}' \\
+    -d '{{"model": "{model}", "prompt": "Hello world", "max_tokens": {max_tokens}, "stream": true, "stream_options": {{"include_usage": true}}}}' \\
     2>/dev/null)
   
   if [ $? -eq 0 ]; then
-    end=$(date +%s.%N)
-    end_timestamp=$(date +%s)
-    latency=$(echo "$end - $start" | bc)
-    # Ensure latency has leading zero for valid JSON
-    latency=$(printf "%.9f" $latency)
+    read http_code ttft latency <<< "$curl_metrics"
     latency_sum=$(echo "$latency_sum + $latency" | bc)
     success_count=$((success_count + 1))
-    echo "  Latency: ${{latency}}s"
+    echo "  Latency: ${{latency}}s (TTFT: ${{ttft}}s)"
     
-    # Extract token count if available
-    tokens=$(echo "$response" | python3 -c "import sys, json; data=json.load(sys.stdin); print(data.get('usage', {{}}).get('completion_tokens', 0))" 2>/dev/null || echo "0")
+    # Token counts from the usage chunk (absent if the server ignores include_usage)
+    tokens=$(sed -n 's/.*"completion_tokens": *\\([0-9][0-9]*\\).*/\\1/p' "$RESPONSE_FILE" | tail -n 1)
+    prompt_tokens=$(sed -n 's/.*"prompt_tokens": *\\([0-9][0-9]*\\).*/\\1/p' "$RESPONSE_FILE" | tail -n 1)
     
     # Write request JSONL
-    echo '{{"timestamp_start": '$start_timestamp', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": true, "service_type": "vllm", "request_id": '$i', "http_status": 200, "output_tokens": '$tokens', "input_tokens": 5, "prompt": "Hello world", "model": "{model}"}}' >> "$REQUESTS_FILE"
+    echo '{{"timestamp_start": '$start_timestamp', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "ttft_s": '$ttft', "success": true, "service_type": "vllm", "request_id": '$i', "http_status": '$http_code', "output_tokens": '${{tokens:-0}}', "input_tokens": '${{prompt_tokens:-0}}', "prompt": "Hello world", "model": "{model}"}}' >> "$REQUESTS_FILE"
   else
     echo "  Failed"
     errors=$((errors + 1))
@@ -596,15 +668,13 @@ for i in $(seq 1 {num_requests}); do
     echo '{{"timestamp_start": '$start_timestamp', "timestamp_end": '$(date +%s)', "latency_s": 0, "success": false, "service_type": "vllm", "request_id": '$i', "http_status": null, "error": "curl_failed", "model": "{model}"}}' >> "$REQUESTS_FILE"
   fi
   
-  if [ $((i % 10)) -eq 0 ]; then
-    echo "Completed $i/{num_requests} requests..."
-  fi
-  
   # Add delay for concurrent requests > 1
   if [ {concurrent_requests} -gt 1 ]; then
     sleep 0.1
   fi
 done
+{_STOP_PROGRESS_REPORTER}
+rm -f "$RESPONSE_FILE"
 
 echo ""
 echo "=== STRESS TEST COMPLETE ==="
@@ -752,6 +822,8 @@ echo "=== INFERENCE PHASE ==="
 TOTAL_START=$(date +%s.%N)
 errors=0
 
+{_start_progress_reporter('"$REQUESTS_FILE"', num_requests)}
+
 for i in $(seq 1 {num_requests}); do
   PROMPT_IDX=$((($i - 1) % 5))
   PROMPT="${{PROMPTS[$PROMPT_IDX]}}"
@@ -777,10 +849,6 @@ for i in $(seq 1 {num_requests}); do
     prompt_eval_count=$(echo "$response" | python3 -c "import sys, json; data=json.load(sys.stdin); print(data.get('prompt_eval_count', 0))" 2>/dev/null || echo "0")
     
     echo '{{"timestamp_start": '$start_timestamp', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": true, "service_type": "ollama", "request_id": '$i', "http_status": 200, "output_tokens": '$eval_count', "input_tokens": '$prompt_eval_count', "model": "{model}"}}' >> "$REQUESTS_FILE"
-    
-    if [ $((i % 5)) -eq 0 ]; then
-      echo "Completed $i/{num_requests} requests... (latency: ${{latency}}s)"
-    fi
   else
     errors=$((errors + 1))
     echo '{{"timestamp_start": '$start_timestamp', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": false, "service_type": "ollama", "request_id": '$i', "http_status": null, "error": "inference_failed", "model": "{model}"}}' >> "$REQUESTS_FILE"
@@ -789,6 +857,7 @@ for i in $(seq 1 {num_requests}); do
 done
 
 TOTAL_END=$(date +%s.%N)
+{_STOP_PROGRESS_REPORTER}
 TOTAL_DURATION=$(echo "$TOTAL_END - $TOTAL_START" | bc)
 RPS=$(echo "scale=2; {num_requests} / $TOTAL_DURATION" | bc)
 
@@ -887,6 +956,8 @@ fi
 # Initialize JSONL output
 echo '{{"benchmark_id": "'$BENCHMARK_ID'", "service_type": "redis", "test_start": "'$(date -Iseconds)'"}}' > "$BENCHMARK_OUTPUT_DIR/requests.jsonl"
 
+{_start_progress_reporter("$BENCHMARK_OUTPUT_DIR/requests.jsonl", num_requests * 2)}
+
 echo ""
 echo "=== SET PHASE ==="
 SET_START=$(date +%s.%N)
@@ -910,10 +981,6 @@ for i in $(seq 1 {num_requests}); do
     set_errors=$((set_errors + 1))
     echo '{{"timestamp_start": '$start_ts', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": false, "service_type": "redis", "operation": "SET", "request_id": '$i', "error": "set_failed"}}' >> $BENCHMARK_OUTPUT_DIR/requests.jsonl
   fi
-  
-  if [ $((i % 1000)) -eq 0 ]; then
-    echo "SET: $i/{num_requests} completed"
-  fi
 done
 
 SET_END=$(date +%s.%N)
@@ -942,13 +1009,10 @@ for i in $(seq 1 {num_requests}); do
     get_errors=$((get_errors + 1))
     echo '{{"timestamp_start": '$start_ts', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": false, "service_type": "redis", "operation": "GET", "request_id": '$((i + {num_requests}))', "error": "get_failed"}}' >> $BENCHMARK_OUTPUT_DIR/requests.jsonl
   fi
-  
-  if [ $((i % 1000)) -eq 0 ]; then
-    echo "GET: $i/{num_requests} completed"
-  fi
 done
 
 GET_END=$(date +%s.%N)
+{_STOP_PROGRESS_REPORTER}
 GET_DURATION=$(echo "$GET_END - $GET_START" | bc)
 GET_OPS=$(echo "scale=2; {num_requests} / $GET_DURATION" | bc)
 
@@ -1039,6 +1103,8 @@ echo '{{"benchmark_id": "'$BENCHMARK_ID'", "service_type": "minio", "test_start"
 # Generate test file
 dd if=/dev/urandom of=/tmp/testfile bs={object_size} count=1 2>/dev/null
 
+{_start_progress_reporter("$BENCHMARK_OUTPUT_DIR/requests.jsonl", num_objects * 2)}
+
 echo ""
 echo "=== PUT PHASE ==="
 PUT_START=$(date +%s.%N)
@@ -1060,10 +1126,6 @@ for i in $(seq 1 {num_objects}); do
     put_errors=$((put_errors + 1))
     echo '{{"timestamp_start": '$start_ts', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": false, "service_type": "minio", "operation": "PUT", "request_id": '$i', "error": "put_failed"}}' >> $BENCHMARK_OUTPUT_DIR/requests.jsonl
   fi
-  
-  if [ $((i % 10)) -eq 0 ]; then
-    echo "PUT: $i/{num_objects} completed"
-  fi
 done
 
 PUT_END=$(date +%s.%N)
@@ -1093,13 +1155,10 @@ for i in $(seq 1 {num_objects}); do
     get_errors=$((get_errors + 1))
     echo '{{"timestamp_start": '$start_ts', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": false, "service_type": "minio", "operation": "GET", "request_id": '$((i + {num_objects}))', "error": "get_failed"}}' >> $BENCHMARK_OUTPUT_DIR/requests.jsonl
   fi
-  
-  if [ $((i % 10)) -eq 0 ]; then
-    echo "GET: $i/{num_objects} completed"
-  fi
 done
 
 GET_END=$(date +%s.%N)
+{_STOP_PROGRESS_REPORTER}
 GET_DURATION=$(echo "$GET_END - $GET_START" | bc)
 GET_OPS=$(echo "scale=2; {num_objects} / $GET_DURATION" | bc)
 GET_BPS=$(echo "scale=0; {num_objects} * {object_size} / $GET_DURATION" | bc)
@@ -1245,6 +1304,9 @@ echo ""
 echo "=== QUERY PHASE ==="
 QUERY_START=$(date +%s.%N)
 query_errors=0
+QUERY_TOTAL=$(($(wc -l < $BENCHMARK_OUTPUT_DIR/requests.jsonl) - 1 + {num_queries}))
+
+{_start_progress_reporter("$BENCHMARK_OUTPUT_DIR/requests.jsonl", "$QUERY_TOTAL")}
 
 for i in $(seq 1 {num_queries}); do
   # Generate random query vector using Python for proper JSON formatting
@@ -1274,13 +1336,10 @@ EOF
     query_errors=$((query_errors + 1))
     echo '{{"timestamp_start": '$start_ts', "timestamp_end": '$(date +%s)', "latency_s": '$latency', "success": false, "service_type": "qdrant", "operation": "QUERY", "request_id": '$((i + {num_points}))', "error": "query_failed"}}' >> $BENCHMARK_OUTPUT_DIR/requests.jsonl
   fi
-  
-  if [ $((i % 100)) -eq 0 ]; then
-    echo "Query: $i/{num_queries} completed"
-  fi
 done
 
 QUERY_END=$(date +%s.%N)
+{_STOP_PROGRESS_REPORTER}
 QUERY_DURATION=$(echo "$QUERY_END - $QUERY_START" | bc)
 QUERY_QPS=$(echo "scale=2; {num_queries} / $QUERY_DURATION" | bc)
 
@@ -1321,6 +1380,11 @@ CLIENT_BUILDERS = {
     "qdrant_stress": build_qdrant_stress_client_command,
 }
 
+# Bound once at import so dispatch is a single call on the registry dict.
+# The registries are only ever mutated in place, so these stay valid.
+_get_service_builder = SERVICE_BUILDERS.get
+_get_client_builder = CLIENT_BUILDERS.get
+
 
 def build_service_command(service_type: str, settings: Dict[str, Any]) -> Optional[str]:
     """
@@ -1333,7 +1397,7 @@ def build_service_command(service_type: str, settings: Dict[str, Any]) -> Option
     Returns:
         Generated command string, or None if type not found
     """
-    builder = SERVICE_BUILDERS.get(service_type)
+    builder = _get_service_builder(service_type)
     if builder:
         return builder(settings)
     return None
@@ -1350,7 +1414,7 @@ def build_client_command(client_type: str, settings: Dict[str, Any]) -> Optional
     Returns:
         Generated command string, or None if type not found
     """
-    builder = CLIENT_BUILDERS.get(client_type)
+    builder = _get_client_builder(client_type)
     if builder:
         return builder(settings)
     return None
@@ -1401,34 +1465,41 @@ def get_default_env(
 # =============================================================================
 
 
-def validate_service_type(service_type: str) -> None:
-    """Validate that service type is supported."""
-    if service_type not in SERVICE_BUILDERS:
-        supported = ", ".join(sorted(SERVICE_BUILDERS.keys()))
-        raise ValueError(
-            f"Unknown service type '{service_type}'. Supported types: {supported}"
-        )
-
+def _make_type_validator(builders: Dict[str, Callable], label: str) -> Callable[[str], None]:
+    """
+    Build a cached validator for one builder registry.
 
-def validate_client_type(client_type: str) -> None:
-    """Validate that client type is supported."""
-    if client_type not in CLIENT_BUILDERS:
-        supported = ", ".join(sorted(CLIENT_BUILDERS.keys()))
-        raise ValueError(
-            f"Unknown client type '{client_type}'. Supported types: {supported}"
-        )
+    The registry and label are captured in the closure, and results are
+    memoized per type name. Only successes are cached: a raised ValueError is
+    not, and invalidate_builder_caches() clears the cache when registries change.
 
+    Args:
+        builders: Registry mapping type names to builder functions
+        label: Kind of type, used in the error message (e.g. "service")
 
-def validate_settings(settings: Dict[str, Any], context: str = "") -> None:
+    Returns:
+        Validator raising ValueError for unsupported type names
     """
-    Validate settings values for sanity.
 
-    Args:
-        settings: Settings dictionary to validate
-        context: Context string for error messages (e.g., "service" or "client")
-    """
-    # Numeric fields that must be positive
-    positive_fields = [
+    @functools.lru_cache(maxsize=64)
+    def validate(type_name: str) -> None:
+        if type_name not in builders:
+            supported = ", ".join(sorted(builders))
+            raise ValueError(
+                f"Unknown {label} type '{type_name}'. Supported types: {supported}"
+            )
+
+    validate.__doc__ = f"Validate that {label} type is supported."
+    return validate
+
+
+validate_service_type = _make_type_validator(SERVICE_BUILDERS, "service")
+validate_client_type = _make_type_validator(CLIENT_BUILDERS, "client")
+
+
+# Numeric settings that must be non-negative, and the subset that must be >= 1
+_POSITIVE_FIELDS = frozenset(
+    {
         "num_inserts",
         "num_selects",
         "num_vectors",
@@ -1441,33 +1512,58 @@ def validate_settings(settings: Dict[str, Any], context: str = "") -> None:
         "dim",
         "max_tokens",
         "tensor_parallel_size",
-    ]
+    }
+)
+_AT_LEAST_ONE_FIELDS = frozenset(
+    {"num_inserts", "num_selects", "num_vectors", "num_queries", "num_requests"}
+)
+# Minimum accepted value per validated field
+_SETTING_MINIMA = {
+    field: 1 if field in _AT_LEAST_ONE_FIELDS else 0 for field in _POSITIVE_FIELDS
+}
+_NUMERIC_TYPES = (int, float)
+
 
-    for field in positive_fields:
-        if field in settings:
-            value = settings[field]
-            if not isinstance(value, (int, float)) or value < 0:
+def validate_settings(settings: Dict[str, Any], context: str = "") -> None:
+    """
+    Validate settings values for sanity.
+
+    Args:
+        settings: Settings dictionary to validate
+        context: Context string for error messages (e.g., "service" or "client")
+    """
+    # Walk the (small) settings dict and test membership, rather than
+    # probing the settings for every known numeric field
+    for field, value in settings.items():
+        minimum = _SETTING_MINIMA.get(field)
+        if minimum is None:
+            continue
+        # Exact type test: cheaper than isinstance and rejects YAML booleans
+        if type(value) not in _NUMERIC_TYPES or value < minimum:
+            if minimum:
                 raise ValueError(
-                    f"Invalid {context} setting '{field}': must be a non-negative number, got {value}"
+                    f"Invalid {context} setting '{field}': must be at least {minimum}, got {value}"
                 )
-            if field in [
-                "num_inserts",
-                "num_selects",
-                "num_vectors",
-                "num_queries",
-                "num_requests",
-            ]:
-                if value < 1:
-                    raise ValueError(
-                        f"Invalid {context} setting '{field}': must be at least 1, got {value}"
-                    )
-
-
-def get_supported_service_types() -> list:
-    """Return list of supported service types."""
-    return list(SERVICE_BUILDERS.keys())
-
-
-def get_supported_client_types() -> list:
-    """Return list of supported client types."""
-    return list(CLIENT_BUILDERS.keys())
+            raise ValueError(
+                f"Invalid {context} setting '{field}': must be a non-negative number, got {value}"
+            )
+
+
+@functools.lru_cache(maxsize=1)
+def get_supported_service_types() -> Tuple[str, ...]:
+    """Return supported service types as an (immutable, cached) tuple."""
+    return tuple(SERVICE_BUILDERS)
+
+
+@functools.lru_cache(maxsize=1)
+def get_supported_client_types() -> Tuple[str, ...]:
+    """Return supported client types as an (immutable, cached) tuple."""
+    return tuple(CLIENT_BUILDERS)
+
+
+def invalidate_builder_caches() -> None:
+    """Drop cached registry views and validation results; call after mutating the registries."""
+    get_supported_service_types.cache_clear()
+    get_supported_client_types.cache_clear()
+    validate_service_type.cache_clear()
+    validate_client_type.cache_clear()
@@ -10,5 +10,5 @@ Contains:
 
 from .manager import Manager
 from .collector import collect_benchmark_artifacts, auto_collect_if_complete
-from .aggregator import aggregate_benchmark, compare_summaries
+from .aggregator import aggregate_benchmark, aggregate_many, compare_summaries
 from .saturation import analyze_saturation
@@ -5,12 +5,96 @@ This module processes requests.jsonl files to generate summary.json with
 aggregated metrics like latency percentiles, throughput, and success rates.
 """
 
+import itertools
 import json
-import statistics
+import math
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-import numpy as np
+# Optional fast JSON serializer for summary.json; falls back to the json module
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+# NumPy is imported lazily: below this many samples its per-call dispatch
+# overhead outweighs the vectorized work, so plain Python is used instead
+_NUMPY_MIN_SAMPLES = 256
+
+# Above this many samples percentiles come from a single np.partition call
+_PARTITION_MIN_SAMPLES = 10_000
+
+
+def _percentiles_small(
+    values: Iterable[float], percentiles: List[float]
+) -> List[float]:
+    """
+    Percentiles of a small sample in plain Python.
+
+    Mirrors np.percentile's default "linear" method, including how it
+    interpolates between the two neighbouring order statistics, so both
+    paths return identical values.
+
+    Args:
+        values: Non-empty list or NumPy array
+        percentiles: Percentiles to calculate
+
+    Returns:
+        Percentile values, in the order requested
+    """
+    # Sorting Python floats is much cheaper than sorting NumPy scalars
+    ordered = sorted(values.tolist() if hasattr(values, "tolist") else values)
+    last = len(ordered) - 1
+    result = []
+    for p in percentiles:
+        index = last * (p / 100)
+        lower = math.floor(index)
+        gamma = index - lower
+        a = ordered[lower]
+        b = ordered[min(lower + 1, last)]
+        diff = b - a
+        result.append(float(a + diff * gamma if gamma < 0.5 else b - diff * (1 - gamma)))
+    return result
+
+
+def _percentiles_large(values: Any, percentiles: List[float]) -> Any:
+    """
+    Percentiles of a large sample via one partial sort.
+
+    np.percentile also partitions rather than fully sorting, but for a
+    handful of percentiles a single np.partition on exactly the order
+    statistics needed (the two neighbours of each percentile) skips its
+    generic setup. Interpolation is np.percentile's default "linear" method,
+    not "lower", so both paths return identical values.
+
+    Args:
+        values: Non-empty list or NumPy array of numeric values
+        percentiles: Percentiles to calculate
+
+    Returns:
+        NumPy array of percentile values, in the order requested
+    """
+    import numpy as np
+
+    # Always a private copy: partition reorders in place
+    arr = np.array(values, dtype=np.float64)
+    last = arr.size - 1
+    index = np.asarray(percentiles, dtype=np.float64) / 100 * last
+    lower = np.floor(index).astype(np.intp)
+    upper = np.minimum(lower + 1, last)
+    arr.partition(np.unique(np.concatenate((lower, upper))))
+
+    gamma = index - lower
+    a = arr[lower]
+    b = arr[upper]
+    diff = b - a
+    return np.where(gamma < 0.5, a + diff * gamma, b - diff * (1 - gamma))
 
 
 def calculate_percentiles(
@@ -20,92 +104,289 @@ def calculate_percentiles(
     Calculate percentiles for a list of values.
 
     Args:
-        values: List of numeric values
+        values: List (or NumPy array) of numeric values
         percentiles: List of percentiles to calculate (e.g., [50, 90, 95, 99])
 
     Returns:
         Dictionary mapping percentile to value
     """
-    if not values:
+    if len(values) == 0:
         return {f"p{p}": 0.0 for p in percentiles}
 
-    sorted_values = sorted(values)
-    result = {}
-
-    for p in percentiles:
-        # Use numpy for accurate percentile calculation
-        result[f"p{p}"] = float(np.percentile(sorted_values, p))
+    if len(values) < _NUMPY_MIN_SAMPLES:
+        quantiles = _percentiles_small(values, percentiles)
+    elif len(values) > _PARTITION_MIN_SAMPLES:
+        quantiles = _percentiles_large(values, percentiles)
+    else:
+        import numpy as np
 
-    return result
+        # One vectorized call for all percentiles; np.percentile selects
+        # internally, so no Python-side sort is needed
+        quantiles = np.percentile(np.asarray(values, dtype=np.float64), percentiles)
+    return {f"p{p}": float(q) for p, q in zip(percentiles, quantiles)}
 
 
-def aggregate_requests(requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _group_latencies_by_operation(
+    requests: List[Dict[str, Any]], operations: Iterable[Any]
+) -> List[Tuple[Any, int, Any]]:
     """
-    Aggregate a list of request dictionaries into summary metrics.
+    Bucket request latencies by operation with NumPy instead of per-record appends.
 
     Args:
-        requests: List of request dictionaries from requests.jsonl
+        requests: Successful request dictionaries
+        operations: Operation label of each request, in the same order
 
     Returns:
-        Summary metrics dictionary
+        (operation, request count, NumPy array of latencies > 0 in request
+        order) per operation, in order of first appearance
     """
-    if not requests:
-        return {
-            "total_requests": 0,
-            "successful_requests": 0,
-            "failed_requests": 0,
-            "success_rate": 0.0,
-            "latency_s": {
-                "avg": 0.0,
-                "min": 0.0,
-                "max": 0.0,
-                "p50": 0.0,
-                "p90": 0.0,
-                "p95": 0.0,
-                "p99": 0.0,
-            },
-            "requests_per_second": 0.0,
-            "errors": [],
-        }
+    import numpy as np
 
-    # Filter out test start entries and get actual requests
-    # Also filter out entries with literal $BENCHMARK_ID (malformed)
-    actual_requests = [
-        r
-        for r in requests
-        if ("request_id" in r or "operation_type" in r)
-        and r.get("benchmark_id") != "$BENCHMARK_ID"
+    n = len(requests)
+    codes: Dict[Any, int] = {}
+    inverse = np.fromiter(
+        (codes.setdefault(op, len(codes)) for op in operations), dtype=np.intp, count=n
+    )
+    latencies = np.fromiter(
+        (r.get("latency_s", 0) for r in requests), dtype=np.float64, count=n
+    )
+    num_ops = len(codes)
+    counts = np.bincount(inverse, minlength=num_ops)
+
+    # Stable sort of the timed requests by operation: each operation's
+    # latencies become one contiguous slice, still in request order
+    timed = latencies > 0
+    timed_ops = inverse[timed]
+    grouped = latencies[timed][np.argsort(timed_ops, kind="stable")]
+    timed_counts = np.bincount(timed_ops, minlength=num_ops)
+    ends = np.cumsum(timed_counts)
+    starts = ends - timed_counts
+
+    return [
+        (op, int(counts[i]), grouped[starts[i]:ends[i]])
+        for op, i in codes.items()
     ]
 
-    if not actual_requests:
-        return aggregate_empty_summary()
 
-    # Separate successful and failed requests
-    successful = [r for r in actual_requests if r.get("success", False)]
-    failed = [r for r in actual_requests if not r.get("success", False)]
+def _llm_metrics(
+    successful: List[Dict[str, Any]], duration: float, requests_per_second: float
+) -> Dict[str, Any]:
+    """Token throughput and time-to-first-token metrics for vLLM/Ollama."""
+    service_metrics: Dict[str, Any] = {}
+    # LLM-specific metrics
+    output_tokens = [r.get("output_tokens", 0) for r in successful]
+    input_tokens = [r.get("input_tokens", 0) for r in successful]
+
+    if output_tokens:
+        # Plain sum/len: statistics.mean goes through exact Fraction
+        # arithmetic, which is far slower and pointless for token counts
+        total_output_tokens = sum(output_tokens)
+        service_metrics = {
+            "tokens_per_second": total_output_tokens / duration
+            if duration > 0
+            else 0.0,
+            "avg_output_tokens": total_output_tokens / len(output_tokens),
+            "avg_input_tokens": sum(input_tokens) / len(input_tokens)
+            if input_tokens
+            else 0.0,
+        }
+
+    # Time-to-first-token (only recorded by streaming clients)
+    ttfts = [ttft for r in successful if (ttft := r.get("ttft_s", 0)) > 0]
+    if ttfts:
+        service_metrics["ttft_s"] = {
+            "avg": sum(ttfts) / len(ttfts),
+            **calculate_percentiles(ttfts, [50, 95, 99]),
+        }
+
+    return service_metrics
+
+
+def _postgres_metrics(
+    successful: List[Dict[str, Any]], duration: float, requests_per_second: float
+) -> Dict[str, Any]:
+    """Per-operation latency metrics for PostgreSQL."""
+    # Database-specific metrics, per operation
+    operations = {}
+    for op, count, op_latencies in _group_latencies_by_operation(
+        successful, (r.get("operation_type", "unknown") for r in successful)
+    ):
+        data = {"count": count, "latencies": op_latencies.tolist()}
+        if op_latencies.size:
+            data["avg_latency"] = float(op_latencies.mean())
+            data["p95_latency"] = calculate_percentiles(op_latencies, [95])["p95"]
+        operations[op] = data
+
+    service_metrics = {
+        "operations": operations,
+        "transactions_per_second": requests_per_second,  # Alias for DB
+    }
+
+    return service_metrics
+
+
+def _redis_metrics(
+    successful: List[Dict[str, Any]], duration: float, requests_per_second: float
+) -> Dict[str, Any]:
+    """Per-operation latency/throughput and payload metrics for Redis."""
+    # Redis-specific metrics with per-operation breakdown (Team10-style)
+    operations = {}
+    for op, count, op_latencies in _group_latencies_by_operation(
+        successful, (r.get("operation_type", "unknown").upper() for r in successful)
+    ):
+        data = {"count": count, "throughput": 0}
+        if op_latencies.size:
+            data["avg_latency"] = float(op_latencies.mean())
+            data["min_latency"] = float(op_latencies.min())
+            data["max_latency"] = float(op_latencies.max())
+            (
+                data["p50_latency"],
+                data["p95_latency"],
+                data["p99_latency"],
+            ) = calculate_percentiles(op_latencies, [50, 95, 99]).values()
+            if duration > 0:
+                data["throughput"] = data["count"] / duration
+        else:
+            # Raw latencies are only reported when there were none to summarize
+            data["latencies"] = []
+        operations[op] = data
+
+    # Collect payload sizes if available: running total and count, plus
+    # the distinct sizes in first-seen order (usually only a handful)
+    payload_total = 0
+    payload_count = 0
+    payload_sizes_seen: Dict[Any, None] = {}
+    for req in successful:
+        size = req.get("payload_size_bytes")
+        if size:
+            payload_total += size
+            payload_count += 1
+            payload_sizes_seen[size] = None
+
+    service_metrics = {
+        "operations": operations,
+        "transactions_per_second": requests_per_second,
+    }
+
+    # Add payload size info if collected
+    if payload_count:
+        service_metrics["avg_payload_size_bytes"] = payload_total / payload_count
+        service_metrics["payload_sizes_used"] = list(payload_sizes_seen)
+
+    return service_metrics
+
+
+def _no_service_metrics(
+    successful: List[Dict[str, Any]], duration: float, requests_per_second: float
+) -> Dict[str, Any]:
+    """Services without service-specific metrics."""
+    return {}
+
+
+# Service-specific metric builders, selected by service_type
+_SERVICE_METRICS = {
+    "vllm": _llm_metrics,
+    "ollama": _llm_metrics,
+    "postgres": _postgres_metrics,
+    "redis": _redis_metrics,
+}
 
-    # Extract latencies from successful requests
-    latencies = [r.get("latency_s", 0) for r in successful if r.get("latency_s", 0) > 0]
+
+def aggregate_requests(requests: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate request dictionaries into summary metrics.
+
+    The records are consumed in a single pass, so a streaming iterator (see
+    reporting.artifacts.iter_requests_jsonl) works as well as a list.
+
+    Args:
+        requests: Request dictionaries from requests.jsonl
+
+    Returns:
+        Summary metrics dictionary
+    """
+    # Single pass over the records: filter out test start entries and
+    # malformed ones (literal $BENCHMARK_ID), split successes from failures,
+    # and collect latencies, errors and the timestamp range as we go
+    total_requests = 0
+    successful = []
+    latencies = []
+    errors = []
+    first_req = None
+    min_start = math.inf
+    max_end = -math.inf
+
+    for r in requests:
+        # Literal-key `in` probes are the cheapest form of this filter: a
+        # keys() view, set intersection or module-level key constants per
+        # record all measured slower, and reordering the tests gains nothing
+        # since nearly every record passes both
+        if not ("request_id" in r or "operation_type" in r) or r.get(
+            "benchmark_id"
+        ) == "$BENCHMARK_ID":
+            continue
+        if first_req is None:
+            first_req = r
+        total_requests += 1
+
+        if r.get("success", False):
+            successful.append(r)
+            latency = r.get("latency_s", 0)
+            if latency > 0:
+                latencies.append(latency)
+        else:
+            errors.append(r.get("error", "unknown"))
+
+        # Running min/max of the timestamp range; a record without an end
+        # time ends at its start, as before, and one without either is skipped
+        start = r.get("timestamp_start")
+        if start and start < min_start:
+            min_start = start
+        end = r.get("timestamp_end") or start
+        if end and end > max_end:
+            max_end = end
+
+    if first_req is None:
+        return aggregate_empty_summary()
+
+    # Error histogram, counted by Counter's C fast path in one call
+    error_types = dict(Counter(errors))
 
     # Calculate basic metrics
-    total_requests = len(actual_requests)
     successful_requests = len(successful)
-    failed_requests = len(failed)
+    failed_requests = total_requests - successful_requests
     success_rate = (
         (successful_requests / total_requests * 100) if total_requests > 0 else 0
     )
 
-    # Calculate latency statistics
+    # Calculate latency statistics (vectorized reductions over one array,
+    # or plain Python for small samples)
     latency_stats = {}
-    if latencies:
+    if latencies and len(latencies) < _NUMPY_MIN_SAMPLES:
+        mean = math.fsum(latencies) / len(latencies)
         latency_stats = {
-            "avg": statistics.mean(latencies),
+            "avg": mean,
             "min": min(latencies),
             "max": max(latencies),
-            "std": statistics.stdev(latencies) if len(latencies) > 1 else 0.0,
+            "std": math.sqrt(
+                math.fsum((x - mean) ** 2 for x in latencies) / (len(latencies) - 1)
+            )
+            if len(latencies) > 1
+            else 0.0,
         }
-        # Add percentiles
         latency_stats.update(calculate_percentiles(latencies, [50, 90, 95, 99]))
+    elif latencies:
+        import numpy as np
+
+        latencies_arr = np.fromiter(latencies, dtype=np.float64, count=len(latencies))
+        latency_stats = {
+            "avg": float(latencies_arr.mean()),
+            "min": float(latencies_arr.min()),
+            "max": float(latencies_arr.max()),
+            "std": float(latencies_arr.std(ddof=1)) if latencies_arr.size > 1 else 0.0,
+        }
+        # Add percentiles
+        latency_stats.update(calculate_percentiles(latencies_arr, [50, 90, 95, 99]))
     else:
         latency_stats = {
             "avg": 0.0,
@@ -121,126 +402,27 @@ def aggregate_requests(requests: List[Dict[str, Any]]) -> Dict[str, Any]:
     # Calculate throughput (requests per second)
     requests_per_second = 0.0
     duration = 0.0
-    start_times = []
-    end_times = []
-
-    if actual_requests:
-        start_times = [
-            r.get("timestamp_start", 0)
-            for r in actual_requests
-            if r.get("timestamp_start")
-        ]
-        end_times = [
-            (r.get("timestamp_end") or r.get("timestamp_start") or 0)
-            for r in actual_requests
-            if (r.get("timestamp_end") or r.get("timestamp_start"))
-        ]
-
-        if start_times and end_times:
-            duration = max(end_times) - min(start_times)
-            
-            # Fix for sub-second tests where integer timestamps result in 0 duration
-            # Ensure duration is at least the maximum latency of any single request
-            if latency_stats and "max" in latency_stats:
-                duration = max(duration, latency_stats["max"])
-            else:
-                # Fallback epsilon if no latency stats
-                duration = max(duration, 0.000001)
-
-            if duration > 0:
-                requests_per_second = total_requests / duration
+    has_time_range = min_start != math.inf and max_end != -math.inf
 
-    # Calculate service-specific metrics
-    service_type = actual_requests[0].get("service_type", "unknown")
-    service_metrics = {}
-
-    if service_type in ["vllm", "ollama"]:
-        # LLM-specific metrics
-        output_tokens = [r.get("output_tokens", 0) for r in successful]
-        input_tokens = [r.get("input_tokens", 0) for r in successful]
-
-        if output_tokens:
-            service_metrics = {
-                "tokens_per_second": sum(output_tokens) / duration
-                if duration > 0
-                else 0.0,
-                "avg_output_tokens": statistics.mean(output_tokens),
-                "avg_input_tokens": statistics.mean(input_tokens)
-                if input_tokens
-                else 0.0,
-            }
-
-    elif service_type == "postgres":
-        # Database-specific metrics
-        operations = {}
-        for req in successful:
-            op = req.get("operation_type", "unknown")
-            if op not in operations:
-                operations[op] = {"count": 0, "latencies": []}
-            operations[op]["count"] += 1
-            if req.get("latency_s", 0) > 0:
-                operations[op]["latencies"].append(req.get("latency_s", 0))
-
-        # Calculate per-operation metrics
-        for op, data in operations.items():
-            if data["latencies"]:
-                data["avg_latency"] = statistics.mean(data["latencies"])
-                data["p95_latency"] = calculate_percentiles(data["latencies"], [95])[
-                    "p95"
-                ]
-
-        service_metrics = {
-            "operations": operations,
-            "transactions_per_second": requests_per_second,  # Alias for DB
-        }
+    if has_time_range:
+        duration = max_end - min_start
 
-    elif service_type == "redis":
-        # Redis-specific metrics with per-operation breakdown (Team10-style)
-        operations = {}
-        payload_sizes = []
-        
-        for req in successful:
-            op = req.get("operation_type", "unknown").upper()
-            if op not in operations:
-                operations[op] = {"count": 0, "latencies": [], "throughput": 0}
-            operations[op]["count"] += 1
-            if req.get("latency_s", 0) > 0:
-                operations[op]["latencies"].append(req.get("latency_s", 0))
-            
-            # Collect payload sizes if available
-            if req.get("payload_size_bytes"):
-                payload_sizes.append(req.get("payload_size_bytes"))
-
-        # Calculate per-operation metrics
-        for op, data in operations.items():
-            if data["latencies"]:
-                data["avg_latency"] = statistics.mean(data["latencies"])
-                data["min_latency"] = min(data["latencies"])
-                data["max_latency"] = max(data["latencies"])
-                percentiles = calculate_percentiles(data["latencies"], [50, 95, 99])
-                data["p50_latency"] = percentiles["p50"]
-                data["p95_latency"] = percentiles["p95"]
-                data["p99_latency"] = percentiles["p99"]
-                if duration > 0:
-                    data["throughput"] = data["count"] / duration
-                # Clean up raw latencies to save space
-                del data["latencies"]
+        # Fix for sub-second tests where integer timestamps result in 0 duration
+        # Ensure duration is at least the maximum latency of any single request
+        if latency_stats and "max" in latency_stats:
+            duration = max(duration, latency_stats["max"])
+        else:
+            # Fallback epsilon if no latency stats
+            duration = max(duration, 0.000001)
 
-        service_metrics = {
-            "operations": operations,
-            "transactions_per_second": requests_per_second,
-        }
-        
-        # Add payload size info if collected
-        if payload_sizes:
-            service_metrics["avg_payload_size_bytes"] = statistics.mean(payload_sizes)
-            service_metrics["payload_sizes_used"] = list(set(payload_sizes))
+        if duration > 0:
+            requests_per_second = total_requests / duration
 
-    # Collect error information
-    error_types = {}
-    for req in failed:
-        error = req.get("error", "unknown")
-        error_types[error] = error_types.get(error, 0) + 1
+    # Calculate service-specific metrics
+    service_type = first_req.get("service_type", "unknown")
+    service_metrics = _SERVICE_METRICS.get(service_type, _no_service_metrics)(
+        successful, duration, requests_per_second
+    )
 
     # Build summary
     summary = {
@@ -256,18 +438,16 @@ def aggregate_requests(requests: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
     # Add timestamp range
-    if start_times and end_times:
+    if has_time_range:
         summary["test_duration_s"] = duration
-        summary["test_start_time"] = min(start_times)
-        summary["test_end_time"] = max(end_times)
+        summary["test_start_time"] = min_start
+        summary["test_end_time"] = max_end
 
     # Extract parametric configuration (for scaling analysis)
     # These fields enable Team10-style plots: throughput vs clients, vs payload, etc.
     parametric_fields = {}
     
-    # Get configuration from first request (should be consistent across all)
-    first_req = actual_requests[0] if actual_requests else {}
-    
+    # Configuration comes from the first request (should be consistent across all)
     # Concurrency / client count
     if first_req.get("concurrent_requests"):
         parametric_fields["concurrent_requests"] = first_req.get("concurrent_requests")
@@ -337,8 +517,20 @@ def write_summary_json(benchmark_id: str, summary: Dict[str, Any]) -> Path:
     results_dir.mkdir(parents=True, exist_ok=True)
 
     summary_file = results_dir / "summary.json"
-    with open(summary_file, "w") as f:
-        json.dump(summary, f, indent=2)
+    if HAS_ORJSON:
+        # Non-str keys (e.g. a None error in error_summary) are stringified as json.dump does
+        with open(summary_file, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    summary,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+    else:
+        with open(summary_file, "w") as f:
+            json.dump(summary, f, indent=2)
 
     return summary_file
 
@@ -353,17 +545,18 @@ def aggregate_benchmark(benchmark_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Summary metrics dictionary, or None if requests file not found
     """
-    from reporting.artifacts import read_requests_jsonl
+    from reporting.artifacts import iter_requests_jsonl
 
-    # Load requests
-    requests = read_requests_jsonl(benchmark_id)
+    # Stream requests from disk instead of loading the whole file
+    requests = iter_requests_jsonl(benchmark_id)
+    first = next(requests, None)
 
-    if not requests:
+    if first is None:
         print(f"Warning: No requests found for benchmark {benchmark_id}")
         return None
 
     # Aggregate
-    summary = aggregate_requests(requests)
+    summary = aggregate_requests(itertools.chain((first,), requests))
 
     # Write summary
     write_summary_json(benchmark_id, summary)
@@ -371,12 +564,54 @@ def aggregate_benchmark(benchmark_id: str) -> Optional[Dict[str, Any]]:
     return summary
 
 
+def aggregate_many(
+    benchmark_ids: List[str], max_workers: Optional[int] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Aggregate several benchmarks in parallel worker processes.
+
+    Each benchmark is independent (its own requests.jsonl and summary.json),
+    so they are spread over a process pool to use all cores for the JSON
+    parsing and statistics.
+
+    Args:
+        benchmark_ids: Benchmark identifiers to aggregate
+        max_workers: Number of worker processes (default: one per CPU)
+
+    Returns:
+        Summary (or None, see aggregate_benchmark) per benchmark, in the
+        order of benchmark_ids
+    """
+    if len(benchmark_ids) <= 1:
+        # Not worth starting a pool for
+        return [aggregate_benchmark(benchmark_id) for benchmark_id in benchmark_ids]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Batches of IDs per task amortize the IPC cost for small benchmarks
+        return list(executor.map(aggregate_benchmark, benchmark_ids, chunksize=4))
+
+
 # Default regression thresholds (configurable)
-DEFAULT_REGRESSION_THRESHOLDS = {
+# Read-only so the shared defaults cannot be changed by a caller
+DEFAULT_REGRESSION_THRESHOLDS = MappingProxyType({
     "latency_pct": 10.0,       # Latency increase > 10% is a regression
     "throughput_pct": 10.0,    # Throughput decrease > 10% is a regression
     "success_rate_pct": 1.0,   # Success rate decrease > 1% is a regression
-}
+})
+
+
+# Metrics compared by compare_summaries: (path, path keys, label, type).
+# Paths are split once here rather than on every comparison.
+_COMPARED_METRICS = tuple(
+    (path, tuple(path.split(".")), label, metric_type)
+    for path, label, metric_type in (
+        ("success_rate", "Success Rate (%)", "success_rate"),
+        ("latency_s.avg", "Avg Latency (s)", "latency"),
+        ("latency_s.p95", "P95 Latency (s)", "latency"),
+        ("latency_s.p99", "P99 Latency (s)", "latency"),
+        ("requests_per_second", "Throughput (RPS)", "throughput"),
+    )
+)
 
 
 def compare_summaries(
@@ -404,10 +639,9 @@ def compare_summaries(
     Returns:
         Comparison results with PASS/FAIL verdict
     """
-    # Merge custom thresholds with defaults
-    config = DEFAULT_REGRESSION_THRESHOLDS.copy()
-    if thresholds:
-        config.update(thresholds)
+    # Merge custom thresholds with defaults into a plain dict in one step;
+    # it is returned in the (JSON-serializable) comparison
+    config = {**DEFAULT_REGRESSION_THRESHOLDS, **(thresholds or {})}
     
     comparison = {
         "baseline": summary1.get("service_type", "unknown"),
@@ -420,22 +654,12 @@ def compare_summaries(
     }
 
     # Compare key metrics
-    metrics_to_compare = [
-        ("success_rate", "Success Rate (%)", "success_rate"),
-        ("latency_s.avg", "Avg Latency (s)", "latency"),
-        ("latency_s.p95", "P95 Latency (s)", "latency"),
-        ("latency_s.p99", "P99 Latency (s)", "latency"),
-        ("requests_per_second", "Throughput (RPS)", "throughput"),
-    ]
-
-    for metric_path, label, metric_type in metrics_to_compare:
-        keys = metric_path.split(".")
-        val1 = summary1
-        val2 = summary2
-
-        for key in keys:
-            val1 = val1.get(key, 0) if isinstance(val1, dict) else 0
-            val2 = val2.get(key, 0) if isinstance(val2, dict) else 0
+    for metric_path, keys, label, metric_type in _COMPARED_METRICS:
+        val1 = summary1.get(keys[0], 0)
+        val2 = summary2.get(keys[0], 0)
+        if len(keys) > 1:
+            val1 = val1.get(keys[1], 0) if isinstance(val1, dict) else 0
+            val2 = val2.get(keys[1], 0) if isinstance(val2, dict) else 0
 
         delta = val2 - val1
         pct_change = (delta / val1 * 100) if val1 != 0 else 0
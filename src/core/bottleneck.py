@@ -14,6 +14,7 @@ Output includes:
 - Recommended next tuning actions
 """
 
+import math
 from typing import Any, Dict, List, Optional, Tuple
 
 
@@ -130,18 +131,15 @@ def classify_bottleneck(
         evidence.append("System operating within normal parameters")
 
     # Determine primary bottleneck
-    max_score = max(scores.values())
-    if max_score == 0:
-        primary = "unknown"
-    else:
-        primary = max(scores, key=scores.get)
+    top_category, max_score, second_score = _top_two(scores)
+    primary = top_category if max_score > 0 else "unknown"
 
     # Generate recommendations based on bottleneck type
     recommendations = _get_recommendations(primary, summary, evidence)
 
     return {
         "classification": primary,
-        "confidence": _calculate_confidence(scores),
+        "confidence": _calculate_confidence(max_score, second_score),
         "scores": scores,
         "evidence": evidence,
         "recommendations": recommendations,
@@ -149,12 +147,29 @@ def classify_bottleneck(
     }
 
 
-def _calculate_confidence(scores: Dict[str, int]) -> str:
-    """Calculate confidence level based on score distribution."""
-    values = list(scores.values())
-    max_score = max(values)
-    second_max = sorted(values, reverse=True)[1] if len(values) > 1 else 0
+def _top_two(scores: Dict[str, int]) -> Tuple[str, int, int]:
+    """
+    Find the top category and the two highest scores in one pass.
+
+    Args:
+        scores: Score per category
 
+    Returns:
+        (first category with the highest score, highest score, second
+        highest score or 0 if there is only one category)
+    """
+    best_key = None
+    best = second = -math.inf
+    for category, score in scores.items():
+        if score > best:
+            best_key, best, second = category, score, best
+        elif score > second:
+            second = score
+    return best_key, best, second if second != -math.inf else 0
+
+
+def _calculate_confidence(max_score: int, second_max: int) -> str:
+    """Calculate confidence level from the gap between the two top scores."""
     if max_score == 0:
         return "low"
     elif max_score - second_max >= 2:
@@ -261,50 +276,44 @@ def format_bottleneck_report(analysis: Dict[str, Any]) -> str:
     Returns:
         Markdown formatted string
     """
-    lines = [
-        "## Bottleneck Analysis (KF2)",
-        "",
-        f"**Classification:** {analysis['classification'].replace('_', ' ').title()}",
-        f"**Confidence:** {analysis['confidence'].title()}",
-        "",
-        "### Summary",
-        "",
-        analysis["summary"],
-        "",
+    sections = [
+        "## Bottleneck Analysis (KF2)\n"
+        "\n"
+        f"**Classification:** {analysis['classification'].replace('_', ' ').title()}\n"
+        f"**Confidence:** {analysis['confidence'].title()}\n"
+        "\n"
+        "### Summary\n"
+        "\n"
+        f"{analysis['summary']}\n"
     ]
 
     # Evidence section
     if analysis["evidence"]:
-        lines.extend([
-            "### Supporting Evidence",
-            "",
-        ])
-        for item in analysis["evidence"]:
-            lines.append(f"- {item}")
-        lines.append("")
+        evidence_md = "".join(f"- {item}\n" for item in analysis["evidence"])
+        sections.append(f"### Supporting Evidence\n\n{evidence_md}")
 
     # Recommendations section
     if analysis["recommendations"]:
-        lines.extend([
-            "### Recommended Actions",
-            "",
-        ])
-        for i, rec in enumerate(analysis["recommendations"], 1):
-            lines.append(f"{i}. {rec}")
-        lines.append("")
+        recs_md = "".join(
+            f"{i}. {rec}\n" for i, rec in enumerate(analysis["recommendations"], 1)
+        )
+        sections.append(f"### Recommended Actions\n\n{recs_md}")
 
     # Score breakdown (for debugging/transparency)
-    lines.extend([
-        "### Analysis Scores",
-        "",
-        "| Category | Score |",
-        "|----------|-------|",
-    ])
-    for category, score in sorted(analysis["scores"].items(), key=lambda x: -x[1]):
-        lines.append(f"| {category.replace('_', ' ').title()} | {score} |")
-    lines.append("")
-
-    return "\n".join(lines)
+    scores_md = "".join(
+        f"| {category.replace('_', ' ').title()} | {score} |\n"
+        for category, score in sorted(analysis["scores"].items(), key=lambda x: -x[1])
+    )
+    sections.append(
+        "### Analysis Scores\n"
+        "\n"
+        "| Category | Score |\n"
+        "|----------|-------|\n"
+        f"{scores_md}"
+    )
+
+    # Sections are separated by a blank line
+    return "\n".join(sections)
 
 
 def analyze_benchmark_bottleneck(
@@ -5,11 +5,124 @@ This module handles downloading JSONL files and other artifacts from
 the cluster after benchmark completion.
 """
 
+import json
 import os
+import shlex
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
-from infra.communicator import SSHCommunicator
+from infra.communicator import HAS_ASYNCSSH, AsyncSSHCommunicator, SSHCommunicator
+from infra.rsync import HAS_RSYNC, rsync_pull
+
+# Below this many bytes of JSONL, compressing costs more than it saves
+JSONL_COMPRESS_MIN_BYTES = 256 * 1024
+
+# Size and mtime of every remote file already collected, keyed by remote path
+# (stored in the local results directory)
+MANIFEST_FILENAME = ".collected.json"
+
+# find -printf format of one "<size> <mtime> <path>" file record
+_FIND_STAT_FORMAT = "'%s %Ts %p\\0'"
+
+# find arguments selecting the log files in a logs directory
+_FIND_LOGS = "-maxdepth 1 -type f \\( -name '*.out' -o -name '*.err' \\)"
+
+# "<client>=<hostname>" record per hostname file in $wd
+_HOSTNAMES_SCRIPT = """\
+for f in "$wd"/*.hostname; do
+  [ -f "$f" ] && printf '%s=%s\\0' "$(basename "$f" .hostname)" "$(cat "$f")"
+done
+true
+"""
+
+# Everything collection needs to know about the remote working directory,
+# gathered in one round trip: home directory, JSONL and log files as
+# "<size> <mtime> <path>", and "<client>=<hostname>" pairs, each section
+# after a marker record. Records are NUL-terminated, so file names with
+# spaces or newlines survive
+_PROBE_SCRIPT = f"""\
+wd="$HOME"/{{dirname}}
+printf '%s\\0' "$HOME"
+printf -- '---METRICS---\\0'
+find "$wd"/metrics -maxdepth 1 -type f -name '*.jsonl' -printf {_FIND_STAT_FORMAT} 2>/dev/null
+printf -- '---LOGS---\\0'
+find "$wd"/logs {_FIND_LOGS} -printf {_FIND_STAT_FORMAT} 2>/dev/null
+printf -- '---HOSTS---\\0'
+{_HOSTNAMES_SCRIPT}"""
+_PROBE_SECTIONS = ("---METRICS---", "---LOGS---", "---HOSTS---")
+
+
+def _parse_probe(stdout: str) -> Dict[str, List[str]]:
+    """
+    Split the output of _PROBE_SCRIPT into its sections.
+
+    Args:
+        stdout: Output of the probe script
+
+    Returns:
+        Non-empty records per section; the records before the first marker
+        are under "home"
+    """
+    sections: Dict[str, List[str]] = {"home": []}
+    sections.update((marker, []) for marker in _PROBE_SECTIONS)
+    current = sections["home"]
+    for record in stdout.split("\0"):
+        if record in sections:
+            current = sections[record]
+        elif record:
+            current.append(record)
+    return sections
+
+
+def _parse_stat_lines(lines: List[str]) -> Dict[str, List[int]]:
+    """
+    Parse "<size> <mtime> <path>" records from the probe.
+
+    Args:
+        lines: Records of a probe section
+
+    Returns:
+        [size, mtime] per remote path, in listing order
+    """
+    stats = {}
+    for line in lines:
+        parts = line.split(" ", 2)
+        if len(parts) == 3:
+            stats[parts[2]] = [int(parts[0]), int(parts[1])]
+    return stats
+
+
+def _load_manifest(local_results_dir: Path) -> Dict[str, List[int]]:
+    """
+    Load the size and mtime of the remote files collected so far.
+
+    Args:
+        local_results_dir: Local results directory
+
+    Returns:
+        [size, mtime] per remote path (empty if nothing was collected yet)
+    """
+    try:
+        with open(local_results_dir / MANIFEST_FILENAME, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _update_manifest(local_results_dir: Path, stats: Dict[str, List[int]]) -> None:
+    """
+    Record remote files as collected.
+
+    Args:
+        local_results_dir: Local results directory
+        stats: [size, mtime] per remote path that was just downloaded
+    """
+    if not stats:
+        return
+    manifest = _load_manifest(local_results_dir)
+    manifest.update(stats)
+    with open(local_results_dir / MANIFEST_FILENAME, "w") as f:
+        json.dump(manifest, f, indent=2)
 
 
 def collect_benchmark_artifacts(benchmark_id: str, target: Optional[str] = None) -> bool:
@@ -21,6 +134,9 @@ def collect_benchmark_artifacts(benchmark_id: str, target: Optional[str] = None)
     - Log files from services and clients
     - Updates client hostname information
 
+    Files whose remote size and mtime match the previous collection are not
+    downloaded again, so repeated calls only fetch what changed.
+
     Args:
         benchmark_id: Unique benchmark identifier
         target: SSH target for the cluster (auto-resolved if None)
@@ -45,55 +161,85 @@ def collect_benchmark_artifacts(benchmark_id: str, target: Optional[str] = None)
         # Get working directory
         working_dir = f"~/benchmark_{benchmark_id}"
 
-        # Resolve absolute path
-        result = communicator.execute_command("echo $HOME")
-        if not result.success:
+        # Probe the home directory, result files, logs and client hostnames
+        # in a single round trip
+        result = communicator.execute_command(
+            _PROBE_SCRIPT.format(dirname=shlex.quote(f"benchmark_{benchmark_id}"))
+        )
+        probe = _parse_probe(result.stdout) if result.success else {}
+        if not probe.get("home"):
             print("Error: Could not determine home directory")
             return False
 
-        home_dir = result.stdout.strip()
+        home_dir = probe["home"][0]
         abs_working_dir = working_dir.replace("~", home_dir)
 
         # Create local results directory
         local_results_dir = Path("results") / benchmark_id
         local_results_dir.mkdir(parents=True, exist_ok=True)
 
-        # Check if metrics directory exists on cluster
+        # JSONL files in the metrics directory on cluster, with sizes
         metrics_dir = f"{abs_working_dir}/metrics"
-        result = communicator.execute_command(
-            f"ls {metrics_dir}/*.jsonl 2>/dev/null || echo 'NO_FILES'"
-        )
-
-        if result.success and "NO_FILES" not in result.stdout:
-            # Download all JSONL files
-            jsonl_files = [
-                f.strip() for f in result.stdout.strip().split("\n") if f.strip()
-            ]
-
-            print(f"Found {len(jsonl_files)} JSONL file(s)")
-
-            for remote_file in jsonl_files:
-                filename = os.path.basename(remote_file)
-                local_file = local_results_dir / filename
-
-                print(f"  Downloading {filename}...")
-                if communicator.download_file(remote_file, local_file):
-                    print(f"    ✓ Downloaded to {local_file}")
-                else:
-                    print(f"    ✗ Failed to download {filename}")
+        jsonl_stats = _parse_stat_lines(probe["---METRICS---"])
+        jsonl_files = list(jsonl_stats)
+        total_bytes = sum(size for size, _ in jsonl_stats.values())
+
+        manifest = _load_manifest(local_results_dir)
+        if (
+            jsonl_files
+            and (local_results_dir / "requests.jsonl").exists()
+            and all(manifest.get(path) == stat for path, stat in jsonl_stats.items())
+        ):
+            # The merged file already holds exactly these client files
+            print(f"{len(jsonl_files)} JSONL file(s) unchanged, skipping download")
+
+        elif jsonl_files:
+            # Download all JSONL files (the merge consumed any earlier
+            # copies, so a single change means fetching them all again)
+
+            print(f"Found {len(jsonl_files)} JSONL file(s), {total_bytes} bytes")
+
+            downloaded = set(
+                download_files(
+                    communicator,
+                    metrics_dir,
+                    jsonl_files,
+                    local_results_dir,
+                    compress=total_bytes >= JSONL_COMPRESS_MIN_BYTES,
+                )
+            )
 
             # Merge all requests.jsonl files into one
             merge_requests_jsonl(benchmark_id, local_results_dir)
+            _update_manifest(
+                local_results_dir,
+                {
+                    path: stat
+                    for path, stat in jsonl_stats.items()
+                    if os.path.basename(path) in downloaded
+                },
+            )
 
         else:
             print("No JSONL files found on cluster")
             print(f"Checked: {metrics_dir}")
         
         # Download logs from cluster
-        download_logs(benchmark_id, abs_working_dir, local_results_dir, communicator)
-        
+        download_logs(
+            benchmark_id,
+            abs_working_dir,
+            local_results_dir,
+            communicator,
+            log_stats=_parse_stat_lines(probe["---LOGS---"]),
+        )
+
         # Update client hostnames from hostname files on cluster
-        update_client_hostnames(benchmark_id, abs_working_dir, communicator)
+        update_client_hostnames(
+            benchmark_id,
+            abs_working_dir,
+            communicator,
+            hostnames=_parse_hostnames(probe["---HOSTS---"]),
+        )
         
         return True
 
@@ -101,6 +247,89 @@ def collect_benchmark_artifacts(benchmark_id: str, target: Optional[str] = None)
         communicator.disconnect()
 
 
+def download_files(
+    communicator: SSHCommunicator,
+    remote_dir: str,
+    remote_files: List[str],
+    local_dir: Path,
+    compress: bool = True,
+) -> List[str]:
+    """
+    Download files from one remote directory, keeping their names.
+
+    Uses a single rsync transfer for all files when rsync is available (one
+    SSH session instead of an SFTP round trip per file), else a single tar
+    stream over the existing connection. If neither works, the files are
+    fetched concurrently over SFTP: through a separate asyncssh connection
+    when asyncssh is installed (its pipelined SFTP is several times faster
+    than Paramiko's), else through the communicator itself.
+
+    Args:
+        communicator: Connected SSHCommunicator
+        remote_dir: Remote directory containing the files
+        remote_files: Remote file paths (inside remote_dir)
+        local_dir: Local destination directory
+        compress: Compress the rsync or tar transfer (not used by SFTP)
+
+    Returns:
+        Names of the files that were downloaded
+    """
+    filenames = [os.path.basename(remote_file) for remote_file in remote_files]
+
+    if HAS_RSYNC:
+        print(f"  Downloading {len(filenames)} file(s) with rsync...")
+        if rsync_pull(
+            communicator.target,
+            remote_dir,
+            filenames,
+            local_dir,
+            ssh_command=communicator.ssh_command(),
+            compress=compress,
+        ):
+            print(f"    ✓ Downloaded to {local_dir}")
+            return filenames
+        print("    rsync failed, falling back")
+
+    if hasattr(communicator, "download_directory_tar"):
+        print(f"  Downloading {len(filenames)} file(s) as a tar stream...")
+        if communicator.download_directory_tar(
+            remote_dir, local_dir, members=filenames, compress=compress
+        ):
+            print(f"    ✓ Downloaded to {local_dir}")
+            return filenames
+        print("    tar stream failed, falling back to SFTP")
+
+    pairs = [
+        (remote_file, local_dir / filename)
+        for remote_file, filename in zip(remote_files, filenames)
+    ]
+    print(f"  Downloading {len(pairs)} file(s) over SFTP...")
+    results = None
+    if HAS_ASYNCSSH:
+        async_communicator = AsyncSSHCommunicator(
+            communicator.target, user=communicator.user, port=communicator.port
+        )
+        if async_communicator.connect():
+            try:
+                results = async_communicator.download_files(pairs)
+            finally:
+                async_communicator.disconnect()
+        else:
+            print("    asyncssh connection failed, using Paramiko")
+    if results is None:
+        results = communicator.download_files(pairs)
+
+    downloaded = []
+    for (_, local_file), filename, ok in zip(pairs, filenames, results):
+        if ok:
+            print(f"    ✓ Downloaded {filename} to {local_file}")
+            downloaded.append(filename)
+        else:
+            print(f"    ✗ Failed to download {filename}")
+
+    return downloaded
+
+
 def merge_requests_jsonl(benchmark_id: str, results_dir) -> Optional[Path]:
     """
     Merge multiple requests.jsonl files from different clients into one.
@@ -112,8 +341,8 @@ def merge_requests_jsonl(benchmark_id: str, results_dir) -> Optional[Path]:
     Returns:
         Path to merged requests.jsonl file, or None if no files found
     """
-    import json
-    
+    from reporting.artifacts import _parse_json_line
+
     # Ensure results_dir is a Path object
     results_dir = (
         Path(results_dir) if not isinstance(results_dir, Path) else results_dir
@@ -122,11 +351,12 @@ def merge_requests_jsonl(benchmark_id: str, results_dir) -> Optional[Path]:
     merged_file = results_dir / "requests.jsonl"
     
     # Clear existing merged file to avoid contamination from old data
-    if merged_file.exists():
-        merged_file.unlink()
+    merged_file.unlink(missing_ok=True)
 
-    # Find all requests_*.jsonl files (client-specific files)
-    jsonl_files = list(results_dir.glob("requests_*.jsonl"))
+    # Find all requests_*.jsonl files (client-specific files), in a fixed
+    # order so the merged file is reproducible. They share one directory, so
+    # sorting by name is enough and cheaper than comparing Path objects
+    jsonl_files = sorted(results_dir.glob("requests_*.jsonl"), key=lambda p: p.name)
 
     if not jsonl_files:
         print("No requests.jsonl files to merge")
@@ -135,39 +365,64 @@ def merge_requests_jsonl(benchmark_id: str, results_dir) -> Optional[Path]:
     # Merge files
     print(f"Merging {len(jsonl_files)} JSONL files...")
 
-    all_lines = []
-
-    # Read all files and filter by benchmark_id
-    for jsonl_file in sorted(jsonl_files):
-        with open(jsonl_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                # Validate and filter by benchmark_id
-                try:
-                    data = json.loads(line)
-                    # Only include lines that match this benchmark_id
-                    line_bid = data.get("benchmark_id")
-                    if line_bid and line_bid != benchmark_id:
-                        continue  # Skip lines from other benchmarks
-                    all_lines.append(line + "\n")
-                except json.JSONDecodeError:
-                    # Keep malformed lines but warn
-                    all_lines.append(line + "\n")
-
-        # Remove individual file after merging
-        jsonl_file.unlink()
-
-    # Write merged file
-    with open(merged_file, "w") as f:
-        f.writelines(all_lines)
-
-    print(f"✓ Merged into {merged_file} ({len(all_lines)} lines)")
+    # Byte-level shortcuts that decide a line without parsing it. The quoted
+    # key cannot occur inside a JSON string value (its quotes would be
+    # escaped), so a line without it has no benchmark_id, and a line with
+    # exactly one occurrence followed by this benchmark's ID belongs to it.
+    # Every other line is parsed.
+    key = b'"benchmark_id"'
+    own_id = json.dumps(benchmark_id).encode()
+    own_marker = key + b": " + own_id
+    own_marker_compact = key + b":" + own_id
+
+    # Stream every file into the merged one line by line, filtering by
+    # benchmark_id, so memory stays constant however large the run
+    line_count = 0
+    with open(merged_file, "wb") as merged:
+        for jsonl_file in jsonl_files:
+            with open(jsonl_file, "rb") as f:
+                for line in f:
+                    # Lines normally come as '{...}\n' and are written as
+                    # they are; anything else is stripped and re-terminated
+                    if line[:1] != b"{" or line[-2:] != b"}\n":
+                        line = line.strip()
+                        if not line:
+                            continue
+                        line += b"\n"
+                    key_count = line.count(key)
+                    if key_count > 1 or (
+                        key_count == 1
+                        and own_marker not in line
+                        and own_marker_compact not in line
+                    ):
+                        # Validate and filter by benchmark_id
+                        try:
+                            data = _parse_json_line(line)
+                            # Only include lines that match this benchmark_id
+                            line_bid = data.get("benchmark_id")
+                            if line_bid and line_bid != benchmark_id:
+                                continue  # Skip lines from other benchmarks
+                        except ValueError:
+                            # Keep malformed lines
+                            pass
+                    merged.write(line)
+                    line_count += 1
+
+            # Remove individual file after merging (tolerating a concurrent
+            # cleanup)
+            jsonl_file.unlink(missing_ok=True)
+
+    print(f"✓ Merged into {merged_file} ({line_count} lines)")
     return merged_file
 
 
-def download_logs(benchmark_id: str, abs_working_dir: str, local_results_dir: Path, communicator) -> bool:
+def download_logs(
+    benchmark_id: str,
+    abs_working_dir: str,
+    local_results_dir: Path,
+    communicator,
+    log_stats: Optional[Dict[str, List[int]]] = None,
+) -> bool:
     """
     Download log files from the cluster for a benchmark.
 
@@ -176,6 +431,9 @@ def download_logs(benchmark_id: str, abs_working_dir: str, local_results_dir: Pa
         abs_working_dir: Absolute working directory on cluster
         local_results_dir: Local results directory
         communicator: Connected SSHCommunicator
+        log_stats: [size, mtime] per remote log file, if already known
+            (listed on the cluster otherwise). Logs whose size and mtime
+            match the previous collection are skipped
 
     Returns:
         True if logs were downloaded successfully
@@ -184,48 +442,123 @@ def download_logs(benchmark_id: str, abs_working_dir: str, local_results_dir: Pa
     local_logs_dir = local_results_dir / "logs"
     local_logs_dir.mkdir(parents=True, exist_ok=True)
 
-    # Find all log files on cluster
-    result = communicator.execute_command(
-        f"ls {logs_dir}/*.out {logs_dir}/*.err 2>/dev/null || echo 'NO_FILES'"
-    )
+    if log_stats is None:
+        # Find all log files on cluster
+        result = communicator.execute_command(
+            f"find {shlex.quote(logs_dir)} {_FIND_LOGS} "
+            f"-printf {_FIND_STAT_FORMAT} 2>/dev/null; true"
+        )
+        log_stats = _parse_stat_lines(result.stdout.split("\0"))
+
+    if log_stats:
+        print(f"Found {len(log_stats)} log file(s)")
 
-    if result.success and "NO_FILES" not in result.stdout:
+        manifest = _load_manifest(local_results_dir)
         log_files = [
-            f.strip() for f in result.stdout.strip().split("\n") if f.strip()
+            path
+            for path, stat in log_stats.items()
+            if manifest.get(path) != stat
+            or not (
+                local_logs_dir / _simplify_log_name(os.path.basename(path))
+            ).exists()
         ]
-        print(f"Found {len(log_files)} log file(s)")
-
-        for remote_file in log_files:
-            filename = os.path.basename(remote_file)
-            # Simplify log filename for easier viewing (remove job ID from filename)
-            # e.g., redis-cache_3940121.out -> redis-cache_service.out
-            if "_" in filename:
-                parts = filename.rsplit("_", 1)
-                name_part = parts[0]
-                ext = "." + filename.split(".")[-1] if "." in filename else ""
-                # Determine if this is a service or client log
-                if "client" in name_part.lower():
-                    simple_name = f"{name_part}_client{ext}"
-                else:
-                    simple_name = f"{name_part}_service{ext}"
-            else:
-                simple_name = filename
-
-            local_file = local_logs_dir / simple_name
-
-            print(f"  Downloading {filename} -> {simple_name}...")
-            if communicator.download_file(remote_file, local_file):
-                print(f"    ✓ Downloaded to {local_file}")
-            else:
-                print(f"    ✗ Failed to download {filename}")
-
+        if len(log_files) < len(log_stats):
+            print(f"  {len(log_stats) - len(log_files)} log file(s) unchanged")
+        if not log_files:
+            return True
+
+        # Download under the original names (compressed: logs are plain
+        # text), then rename locally
+        downloaded = download_files(
+            communicator, logs_dir, log_files, local_logs_dir, compress=True
+        )
+        for filename in downloaded:
+            simple_name = _simplify_log_name(filename)
+            if simple_name != filename:
+                print(f"  {filename} -> {simple_name}")
+                os.replace(local_logs_dir / filename, local_logs_dir / simple_name)
+
+        downloaded = set(downloaded)
+        _update_manifest(
+            local_results_dir,
+            {
+                path: log_stats[path]
+                for path in log_files
+                if os.path.basename(path) in downloaded
+            },
+        )
         return True
     else:
         print("No log files found on cluster")
         return False
 
 
-def update_client_hostnames(benchmark_id: str, abs_working_dir: str, communicator) -> None:
+def _simplify_log_name(filename: str) -> str:
+    """
+    Simplify a log filename for easier viewing by removing the job ID.
+
+    e.g., redis-cache_3940121.out -> redis-cache_service.out, and for job
+    array tasks client-2_3940130_2.out -> client-2_client.out
+
+    Args:
+        filename: Log filename as written by Slurm
+
+    Returns:
+        Simplified filename
+    """
+    if "_" not in filename:
+        return filename
+
+    name_part, _, task = filename.rsplit(".", 1)[0].rpartition("_")
+    ext = "." + filename.split(".")[-1] if "." in filename else ""
+    # Job array tasks: "<prefix>-<i>_<array job id>_<i>"
+    head, _, array_job_id = name_part.rpartition("_")
+    if array_job_id.isdigit() and head.endswith(f"-{task}"):
+        name_part = head
+    # Determine if this is a service or client log
+    if "client" in name_part.lower():
+        return f"{name_part}_client{ext}"
+    return f"{name_part}_service{ext}"
+
+
+def _parse_hostnames(records: List[str]) -> Dict[str, str]:
+    """
+    Parse "<client>=<hostname>" records from _HOSTNAMES_SCRIPT.
+
+    Args:
+        records: Records printed by the script
+
+    Returns:
+        Hostname per client name
+    """
+    return dict(record.partition("=")[::2] for record in records if record)
+
+
+def _read_client_hostnames(abs_working_dir: str, communicator) -> Dict[str, str]:
+    """
+    Read all client hostname files from the cluster in one round trip.
+
+    Args:
+        abs_working_dir: Absolute working directory on cluster
+        communicator: Connected SSHCommunicator
+
+    Returns:
+        Hostname per client name
+    """
+    result = communicator.execute_command(
+        f"wd={shlex.quote(abs_working_dir)}\n{_HOSTNAMES_SCRIPT}"
+    )
+    if not result.success:
+        return {}
+    return _parse_hostnames(result.stdout.split("\0"))
+
+
+def update_client_hostnames(
+    benchmark_id: str,
+    abs_working_dir: str,
+    communicator,
+    hostnames: Optional[Dict[str, str]] = None,
+) -> None:
     """
     Update client hostnames in storage by reading hostname files from cluster.
     
@@ -235,54 +568,60 @@ def update_client_hostnames(benchmark_id: str, abs_working_dir: str, communicato
         benchmark_id: Unique benchmark identifier
         abs_working_dir: Absolute working directory on cluster
         communicator: Connected SSHCommunicator
+        hostnames: Hostname per client name, if already read (read from the
+            clients' hostname files otherwise)
     """
-    import json
     from infra.storage import get_storage_manager
+    from reporting.artifacts import read_run_json, update_run_json
     
     storage = get_storage_manager()
     
     # Load all clients from storage
-    clients = storage.load_all_entities(benchmark_id, "client")
-    
+    clients = [
+        (client.get("name") or client.get("_id"), client)
+        for client in storage.load_all_entities(benchmark_id, "client")
+    ]
+    clients = [(client_name, client) for client_name, client in clients if client_name]
+    if not clients:
+        return
+
+    if hostnames is None:
+        hostnames = _read_client_hostnames(abs_working_dir, communicator)
+
     updated_clients = []
-    for client in clients:
-        client_name = client.get("name") or client.get("_id")
-        if not client_name:
+    client_updates = []
+    for client_name, client in clients:
+        hostname = hostnames.get(client_name)
+        if not hostname:
             continue
-            
-        # Try to read hostname file from cluster
-        hostname_file = f"{abs_working_dir}/{client_name}.hostname"
-        result = communicator.execute_command(f"cat {hostname_file} 2>/dev/null")
-        
-        if result.success and result.stdout.strip():
-            hostname = result.stdout.strip()
-            # Update client hostname in storage
-            client["hostname"] = hostname
-            client["node_name"] = hostname
-            storage.backend.save(benchmark_id, "client", client_name, client)
-            updated_clients.append((client_name, hostname))
-            print(f"  ✓ Client {client_name} running on: {hostname}")
+
+        # Update client hostname in storage
+        client["hostname"] = hostname
+        client["node_name"] = hostname
+        client_updates.append((client_name, client))
+        updated_clients.append((client_name, hostname))
+        print(f"  ✓ Client {client_name} running on: {hostname}")
+
+    # Save all updated clients in one batch
+    if client_updates:
+        storage.save_entities(benchmark_id, "client", client_updates)
     
     # Also update run.json if it exists
     if updated_clients:
-        run_json_path = Path("results") / benchmark_id / "run.json"
-        if run_json_path.exists():
-            try:
-                with open(run_json_path, "r") as f:
-                    run_data = json.load(f)
-                
+        try:
+            run_data = read_run_json(benchmark_id)
+            if run_data is not None:
                 # Update client hostnames in run.json
+                hostname_map = dict(updated_clients)
                 for client_info in run_data.get("clients", []):
-                    for client_name, hostname in updated_clients:
-                        if client_info.get("name") == client_name:
-                            client_info["hostname"] = hostname
-                            break
-                
-                with open(run_json_path, "w") as f:
-                    json.dump(run_data, f, indent=2, default=str)
-                    
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"  Warning: Could not update run.json: {e}")
+                    hostname = hostname_map.get(client_info.get("name"))
+                    if hostname:
+                        client_info["hostname"] = hostname
+
+                update_run_json(benchmark_id, run_data)
+
+        except (ValueError, IOError) as e:
+            print(f"  Warning: Could not update run.json: {e}")
 
 
 def auto_collect_if_complete(benchmark_id: str, target: Optional[str] = None) -> bool:
@@ -5,16 +5,31 @@ This module provides a single source of truth for benchmark lifecycle operations
 including completion handling, artifact collection, and report generation.
 """
 
+import functools
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from reporting.artifacts import read_run_json
 
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# Open lock file descriptor per benchmark whose collection lock we hold
+_lock_fds: Dict[str, int] = {}
+
 
 def get_benchmark_target(benchmark_id: str) -> str:
     """
     Get target cluster from run.json or default to meluxina.
+
+    The target is cached per version of run.json, so polling loops do not
+    re-read and re-parse it on every call.
     
     Args:
         benchmark_id: Unique benchmark identifier
@@ -22,27 +37,36 @@ def get_benchmark_target(benchmark_id: str) -> str:
     Returns:
         Target cluster name (SSH alias)
     """
+    try:
+        st = (Path("results") / benchmark_id / "run.json").stat()
+    except OSError:
+        return "meluxina"
+    # Any rewrite of run.json changes its mtime (and usually size/inode),
+    # which makes a new cache key
+    return _read_benchmark_target(benchmark_id, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_benchmark_target(
+    benchmark_id: str, inode: int, size: int, mtime_ns: int
+) -> str:
+    """Read the target from run.json; the stat fields only key the cache."""
     run_data = read_run_json(benchmark_id)
     return run_data.get("target", "meluxina") if run_data else "meluxina"
 
 
-def is_collection_in_progress(benchmark_id: str) -> bool:
-    """
-    Check if artifact collection is already in progress for a benchmark.
-    
-    Args:
-        benchmark_id: Unique benchmark identifier
-        
-    Returns:
-        True if collection is in progress, False otherwise
-    """
-    lock_file = Path(f"results/{benchmark_id}/.collecting")
-    return lock_file.exists()
+def _collection_lock_path(benchmark_id: str) -> Path:
+    """Return the path of the collection lock file of a benchmark."""
+    return Path("results") / benchmark_id / ".collecting"
 
 
 def acquire_collection_lock(benchmark_id: str) -> bool:
     """
     Acquire a lock for artifact collection to prevent race conditions.
+
+    Uses flock() on the lock file, so acquisition is atomic and the kernel
+    drops the lock if the process dies mid-collection. Without fcntl the
+    lock file is created exclusively instead.
     
     Args:
         benchmark_id: Unique benchmark identifier
@@ -50,18 +74,28 @@ def acquire_collection_lock(benchmark_id: str) -> bool:
     Returns:
         True if lock was acquired, False if already locked
     """
-    lock_file = Path(f"results/{benchmark_id}/.collecting")
-    
-    if lock_file.exists():
-        return False
+    lock_file = _collection_lock_path(benchmark_id)
     
     try:
         lock_file.parent.mkdir(parents=True, exist_ok=True)
-        lock_file.write_text(str(datetime.now()))
-        return True
-    except Exception:
+        if not HAS_FCNTL:
+            fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            os.write(fd, str(datetime.now()).encode())
+            _lock_fds[benchmark_id] = fd
+            return True
+
+        fd = os.open(lock_file, os.O_CREAT | os.O_RDWR, 0o644)
+    except OSError:
         return False
 
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return False
+    _lock_fds[benchmark_id] = fd
+    return True
+
 
 def release_collection_lock(benchmark_id: str) -> None:
     """
@@ -70,11 +104,13 @@ def release_collection_lock(benchmark_id: str) -> None:
     Args:
         benchmark_id: Unique benchmark identifier
     """
-    lock_file = Path(f"results/{benchmark_id}/.collecting")
-    try:
-        lock_file.unlink(missing_ok=True)
-    except Exception:
-        pass
+    fd = _lock_fds.pop(benchmark_id, None)
+    if fd is None:
+        return
+    # Closing the descriptor releases the flock
+    os.close(fd)
+    if not HAS_FCNTL:
+        _collection_lock_path(benchmark_id).unlink(missing_ok=True)
 
 
 def handle_benchmark_completion(
@@ -11,19 +11,246 @@ The Manager class is responsible for:
 - Writing benchmark artifacts (run.json, etc.)
 """
 
+import re
+import shlex
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set
 
 # TODO: maybe here we should import and use the create_communicator factory method
 # but it works so leave it for now
-from infra.communicator import SSHCommunicator
+from infra.communicator import (
+    HAS_ASYNCSSH,
+    AsyncSSHCommunicator,
+    SSHCommunicator,
+)
 from infra.storage import get_storage_manager, StorageManager
 from models.service import Service
 from models.client import Client
 
 
+def _sif_filename(container_image: str) -> str:
+    """
+    Name of the cached .sif file for a container image.
+
+    The tag (or digest) is part of the name, so different versions of the
+    same image do not overwrite each other in the shared cache.
+
+    Args:
+        container_image: Image reference, e.g. "ollama/ollama:latest"
+
+    Returns:
+        File name such as "ollama_ollama_latest.sif"
+    """
+    image = container_image.split("://", 1)[-1]
+    if "@" not in image and ":" not in image.rsplit("/", 1)[-1]:
+        image += ":latest"
+    return re.sub(r"[^A-Za-z0-9._-]", "_", image) + ".sif"
+
+
+def _sbatch_directives(
+    job_name: str,
+    log_path: str,
+    time_limit: str,
+    partition: str,
+    account: str,
+    num_nodes: int,
+    options: List[str],
+) -> str:
+    """
+    Build the #SBATCH header of a job script.
+
+    Args:
+        job_name: Slurm job name
+        log_path: Path of the job logs without extension (may contain
+            Slurm patterns such as %j)
+        time_limit: Time limit for the job
+        partition: Slurm partition
+        account: Slurm account/project ID
+        num_nodes: Number of nodes (one task per node)
+        options: Further sbatch options, e.g. "--gpus=1"; only the options
+            that are set are passed, so no blank lines end up in the header
+
+    Returns:
+        The directive lines joined by newlines
+    """
+    lines = [
+        f"--job-name={job_name}",
+        f"--time={time_limit}",
+        "--qos=default",
+        f"--partition={partition}",
+        f"--account={account}",
+        f"--nodes={num_nodes}",
+        f"--ntasks={num_nodes}",
+        "--ntasks-per-node=1",
+        *options,
+        f"--output={log_path}.out",
+        f"--error={log_path}.err",
+    ]
+    return "\n".join(f"#SBATCH {line}" for line in lines)
+
+
+@contextmanager
+def _progress_ticker(message: str, max_wait_time: int, interval: float = 10.0):
+    """
+    Print a progress line every few seconds while a blocking wait runs.
+
+    The waits on the cluster are single remote commands, so nothing is
+    printed while they block; a daemon thread keeps the user informed and
+    is stopped as soon as the wait returns.
+
+    Args:
+        message: What is being waited for, e.g. "Waiting for job to start"
+        max_wait_time: Deadline of the wait (seconds), shown in the line
+        interval: Seconds between progress lines
+    """
+    done = threading.Event()
+    start_time = time.time()
+
+    def tick():
+        while not done.wait(interval):
+            elapsed = int(time.time() - start_time)
+            print(f"  {message}... ({elapsed}s/{max_wait_time}s)")
+
+    ticker = threading.Thread(target=tick, daemon=True)
+    ticker.start()
+    try:
+        yield
+    finally:
+        done.set()
+        ticker.join()
+
+
+# Static skeleton of a service job script, built once at import and filled
+# in with str.format by Manager._create_sbatch_script. Braces meant for bash
+# are doubled ("${{VAR}}").
+_SERVICE_SBATCH_TEMPLATE = """#!/bin/bash -l
+{directives}
+
+echo "==============================================="
+echo "Service: {service_name}"
+echo "Date: $(date)"
+echo "Hostname: ${{HOSTNAME%%.*}}"
+echo "Working Directory: $PWD"
+echo "==============================================="
+
+# Write service information EARLY so clients can discover us
+# This MUST happen before container pull (which can be slow)
+# (bash builtins and $HOSTNAME only: no process is started for this)
+printf '%s\\n' "$HOSTNAME" > {working_dir}/{service_name}.hostname
+printf '%s\\n' "$SLURM_JOB_ID" > {working_dir}/{service_name}.jobid
+
+# Load required modules
+module add Apptainer
+{module_loads}
+
+# Images are cached once per user on the cluster and shared by every job,
+# instead of being pulled again into each benchmark directory
+SIF_CACHE_DIR="${{SIF_CACHE_DIR:-${{SCRATCH:-$HOME}}/.cache/apptainer-sif}}"
+SIF_FILE="$SIF_CACHE_DIR/{sif_name}"
+
+# A cached image is used as is: no mkdir, no lock, no registry lookup.
+# Otherwise jobs starting together take turns on the lock and only the
+# first one downloads the image; the pull goes to a temporary file so
+# nobody runs a half-written image.
+if [ -f "$SIF_FILE" ]; then
+  echo "Using cached container: $SIF_FILE"
+else
+  mkdir -p "$SIF_CACHE_DIR"
+  (
+    flock 9 || echo "Warning: could not lock $SIF_FILE.lock, pulling without lock"
+    if [ ! -f "$SIF_FILE" ]; then
+      echo "Pulling container image: {container_image}"
+      if apptainer pull "$SIF_FILE.$SLURM_JOB_ID.tmp" docker://{container_image}; then
+        mv -f "$SIF_FILE.$SLURM_JOB_ID.tmp" "$SIF_FILE"
+      fi
+    else
+      echo "Using cached container: $SIF_FILE"
+    fi
+  ) 9>"$SIF_FILE.lock"
+fi
+
+echo "Running container: $SIF_FILE"
+
+# Set up environment variables for the container
+{env_vars_setup}
+
+# Pre-run commands
+{pre_run}
+
+
+# MONITORING SIDECAR
+# ------------------
+# Run hardware scraper in background (exposes metrics on port 8010)
+echo "Starting hardware scraper..."
+SCRAPER_SCRIPT="{abs_working_dir}/scripts/scraper.py"
+if [ -f "$SCRAPER_SCRIPT" ]; then
+    python3 "$SCRAPER_SCRIPT" --service-name "{service_name}" > {abs_working_dir}/logs/scraper_{service_name}.out 2>&1 &
+    echo "Scraper started with PID $!"
+else
+    echo "Warning: Scraper script not found at $SCRAPER_SCRIPT"
+fi
+
+# Run the service
+apptainer exec {nv_flag} {apptainer_opts} "$SIF_FILE" {service_command}
+"""
+
+# Static skeleton of a client job script, filled in the same way by
+# Manager._create_client_sbatch_script.
+_CLIENT_SBATCH_TEMPLATE = """#!/bin/bash -l
+{directives}
+
+echo "================================================"
+echo "Client: {client_name}"
+echo "Service: {service_name}"
+echo "Date: $(date)"
+echo "Hostname: ${{HOSTNAME%%.*}}"
+echo "Working Directory: $PWD"
+echo "================================================"
+
+# Export service connection information
+export SERVICE_NAME="{service_name}"
+export SERVICE_HOSTNAME="{service_hostname}"
+export SERVICE_PORT="{service_port}"
+export SERVICE_URL="{service_url}"
+
+# Export benchmark information for artifacts
+export BENCHMARK_ID="{benchmark_id}"
+export BENCHMARK_OUTPUT_DIR="{abs_working_dir}/metrics"
+export CLIENT_NAME="{client_name}"
+
+# Write client information to files
+printf '%s\\n' "$HOSTNAME" > {working_dir}/{client_name}.hostname
+printf '%s\\n' "$SLURM_JOB_ID" > {working_dir}/{client_name}.jobid
+
+# Create metrics directory
+mkdir -p {working_dir}/metrics
+
+# Start Heartbeat (for real-time monitoring across nodes)
+# The scraper counts clients whose file changed in the last 15 seconds.
+# Refresh it every 5 seconds with a builtin truncation (updates the mtime
+# without starting a touch process), and remove it however the job ends.
+HEARTBEAT_FILE="{abs_working_dir}/heartbeat_{client_name}"
+echo "Starting heartbeat at $HEARTBEAT_FILE"
+(while true; do : > "$HEARTBEAT_FILE"; sleep 5; done) &
+HEARTBEAT_PID=$!
+trap 'kill $HEARTBEAT_PID 2>/dev/null; rm -f "$HEARTBEAT_FILE"' EXIT
+
+# Run the benchmark command
+echo "Running benchmark command..."
+{benchmark_command}
+
+# Stop Heartbeat
+kill $HEARTBEAT_PID 2>/dev/null
+rm -f "$HEARTBEAT_FILE"
+
+echo "Benchmark completed at $(date)"
+"""
+
+
 class Manager:
     """
     Manager class for deploying and managing services on the cluster.
@@ -38,6 +265,14 @@ class Manager:
     7. Save service state to storage
     """
 
+    # Home directory per target, shared by every Manager in the process
+    # (Managers are created per operation, and $HOME does not change)
+    _home_dirs: Dict[str, str] = {}
+
+    # Contents of the monitoring scraper uploaded with each service, read
+    # from disk once per process
+    _scraper_source: Optional[bytes] = None
+
     def __init__(
         self,
         target: str,
@@ -60,6 +295,10 @@ class Manager:
         self.abs_working_dir: Optional[str] = None  # Will be set after connection
         self.storage_manager = storage_manager or get_storage_manager()
         self.communicator: Optional[SSHCommunicator] = None
+        # Hostname per service/client; a written hostname file never changes
+        self._hostname_cache: Dict[str, str] = {}
+        # Remote files already uploaded through this Manager
+        self._uploaded_paths: Set[str] = set()
 
     def connect(self) -> bool:
         """
@@ -80,9 +319,13 @@ class Manager:
     def _resolve_working_dir(self) -> None:
         """Resolve the absolute working directory path on the cluster."""
         if self.working_dir.startswith("~"):
-            result = self.communicator.execute_command("echo $HOME")
-            if result.success:
-                home_dir = result.stdout.strip()
+            home_dir = Manager._home_dirs.get(self.target)
+            if home_dir is None:
+                result = self.communicator.execute_command("echo $HOME")
+                if result.success and result.stdout.strip():
+                    home_dir = result.stdout.strip()
+                    Manager._home_dirs[self.target] = home_dir
+            if home_dir:
                 self.abs_working_dir = self.working_dir.replace("~", home_dir)
             else:
                 # Fallback to using ~ as-is
@@ -95,6 +338,22 @@ class Manager:
         if self.communicator:
             self.communicator.disconnect()
 
+    @classmethod
+    def _get_scraper_source(cls) -> Optional[bytes]:
+        """
+        Return the contents of src/monitoring/scraper.py, read once per process.
+
+        Returns:
+            The scraper source, or None if the file is missing
+        """
+        if cls._scraper_source is None:
+            scraper_path = Path(__file__).parent.parent / "monitoring" / "scraper.py"
+            try:
+                cls._scraper_source = scraper_path.read_bytes()
+            except OSError:
+                return None
+        return cls._scraper_source
+
     def _ensure_connected(self) -> None:
         """Ensure we have an active connection."""
         if not self.communicator or not self.communicator._connection:
@@ -141,121 +400,74 @@ class Manager:
         apptainer_opts = ""
 
         if env_vars:
-            env_exports = []
-            for key, value in env_vars.items():
-                env_exports.append(f"export {key}='{value}'")
-            env_vars_setup = "\n".join(env_exports) + "\n"
+            env_vars_setup = "".join(
+                f"export {key}='{value}'\n" for key, value in env_vars.items()
+            )
             # Add environment variables to Apptainer
             apptainer_opts = " ".join(
-                [f"--env {key}='{value}'" for key, value in env_vars.items()]
+                f"--env {key}='{value}'" for key, value in env_vars.items()
             )
 
-        # Build GPU directive
+        # Optional sbatch directives, only those that are set
+        sbatch_options = []
         # Prefer explicit gpus_per_node if provided, else use num_gpus if > 0
         if gpus_per_node is not None:
-            gpu_directive = f"#SBATCH --gpus-per-node={gpus_per_node}"
+            sbatch_options.append(f"--gpus-per-node={gpus_per_node}")
             use_gpu = True
         elif num_gpus > 0:
-            gpu_directive = f"#SBATCH --gpus={num_gpus}"
+            sbatch_options.append(f"--gpus={num_gpus}")
             use_gpu = True
         else:
-            gpu_directive = ""
             use_gpu = False
+        if cpus_per_task:
+            sbatch_options.append(f"--cpus-per-task={cpus_per_task}")
+        if memory:
+            sbatch_options.append(f"--mem={memory}")
+        if constraints:
+            sbatch_options.append(f"--constraint={constraints}")
+        if exclude_nodes:
+            sbatch_options.append(f"--exclude={exclude_nodes}")
 
         # Use --nv flag only when GPUs are requested
         nv_flag = "--nv" if use_gpu else ""
 
-        # Build other directives
-        cpu_directive = f"#SBATCH --cpus-per-task={cpus_per_task}" if cpus_per_task else ""
-        mem_directive = f"#SBATCH --mem={memory}" if memory else ""
-        constraint_directive = f"#SBATCH --constraint={constraints}" if constraints else ""
-        exclude_directive = f"#SBATCH --exclude={exclude_nodes}" if exclude_nodes else ""
-
         # Build apptainer volumes
         if volumes:
-            bind_opts = " ".join([f"--bind {v}" for v in volumes])
+            bind_opts = " ".join(f"--bind {v}" for v in volumes)
             apptainer_opts = f"{apptainer_opts} {bind_opts}"
 
         # Build modules loading
         module_loads = ""
         if modules:
-            module_loads = "\n".join([f"module load {m}" for m in modules])
+            module_loads = "\n".join(f"module load {m}" for m in modules)
 
         # Build pre-run commands
         pre_run = ""
         if pre_run_commands:
             pre_run = "\n".join(pre_run_commands)
-        
-        script = f"""#!/bin/bash -l
-#SBATCH --job-name={service_name}
-#SBATCH --time={time_limit}
-#SBATCH --qos=default
-#SBATCH --partition={partition}
-#SBATCH --account={account}
-#SBATCH --nodes={num_nodes}
-#SBATCH --ntasks={num_nodes}
-#SBATCH --ntasks-per-node=1
-{gpu_directive}
-{cpu_directive}
-{mem_directive}
-{constraint_directive}
-{exclude_directive}
-#SBATCH --output={self.abs_working_dir}/logs/{service_name}_%j.out
-#SBATCH --error={self.abs_working_dir}/logs/{service_name}_%j.err
-
-echo "==============================================="
-echo "Service: {service_name}"
-echo "Date: $(date)"
-echo "Hostname: $(hostname -s)"
-echo "Working Directory: $(pwd)"
-echo "==============================================="
-
-# Write service information EARLY so clients can discover us
-# This MUST happen before container pull (which can be slow)
-echo "$(hostname)" > {self.working_dir}/{service_name}.hostname
-echo "$SLURM_JOB_ID" > {self.working_dir}/{service_name}.jobid
 
-# Load required modules
-module add Apptainer
-{module_loads}
-
-# Extract image name for the .sif file
-IMAGE_NAME=$(echo {container_image} | sed 's|.*/||' | sed 's|:.*||')
-SIF_FILE="${{IMAGE_NAME}}_latest.sif"
-
-# Pull container image if not already present
-if [ ! -f "$SIF_FILE" ]; then
-  echo "Pulling container image: {container_image}"
-  apptainer pull docker://{container_image}
-else
-  echo "Using cached container: $SIF_FILE"
-fi
-
-echo "Running container: $SIF_FILE"
-
-# Set up environment variables for the container
-{env_vars_setup}
-
-# Pre-run commands
-{pre_run}
-
-
-# MONITORING SIDECAR
-# ------------------
-# Run hardware scraper in background (exposes metrics on port 8010)
-echo "Starting hardware scraper..."
-SCRAPER_SCRIPT="{self.abs_working_dir}/scripts/scraper.py"
-if [ -f "$SCRAPER_SCRIPT" ]; then
-    python3 "$SCRAPER_SCRIPT" --service-name "{service_name}" > {self.abs_working_dir}/logs/scraper_{service_name}.out 2>&1 &
-    echo "Scraper started with PID $!"
-else
-    echo "Warning: Scraper script not found at $SCRAPER_SCRIPT"
-fi
-
-# Run the service
-apptainer exec {nv_flag} {apptainer_opts} "$SIF_FILE" {service_command}
-"""
-        return script
+        return _SERVICE_SBATCH_TEMPLATE.format(
+            directives=_sbatch_directives(
+                job_name=service_name,
+                log_path=f"{self.abs_working_dir}/logs/{service_name}_%j",
+                time_limit=time_limit,
+                partition=partition,
+                account=account,
+                num_nodes=num_nodes,
+                options=sbatch_options,
+            ),
+            service_name=service_name,
+            abs_working_dir=self.abs_working_dir,
+            working_dir=self.working_dir,
+            module_loads=module_loads,
+            container_image=container_image,
+            sif_name=_sif_filename(container_image),
+            env_vars_setup=env_vars_setup,
+            pre_run=pre_run,
+            nv_flag=nv_flag,
+            apptainer_opts=apptainer_opts,
+            service_command=service_command,
+        )
 
     def _create_client_sbatch_script(
         self,
@@ -270,10 +482,16 @@ apptainer exec {nv_flag} {apptainer_opts} "$SIF_FILE" {service_command}
         account: str = "p200981",
         num_nodes: int = 1,
         num_gpus: int = 0,
+        array_size: Optional[int] = None,
     ) -> str:
         """
         Create an sbatch script for deploying a benchmark client.
 
+        With array_size, the script is a Slurm job array of that many clients
+        and client_name is their prefix: task i runs as "<client_name>-<i>",
+        writes "<client_name>-<i>_<job_id>_<i>.out" and is addressed by Slurm
+        as "<job_id>_<i>".
+
         Args:
             client_name: Name of the client
             service_name: Name of the service being benchmarked
@@ -285,78 +503,46 @@ apptainer exec {nv_flag} {apptainer_opts} "$SIF_FILE" {service_command}
             account: Slurm account/project ID
             num_nodes: Number of nodes
             num_gpus: Number of GPUs
+            array_size: Number of clients to run as one job array (optional)
 
         Returns:
             Content of the sbatch script
         """
+        # Only add GPU directive if num_gpus > 0
+        sbatch_options = [f"--gpus={num_gpus}"] if num_gpus > 0 else []
+        job_name = client_name
+        log_path = f"{self.abs_working_dir}/logs/{client_name}_%j"
+        if array_size:
+            sbatch_options.append(f"--array=1-{array_size}")
+            log_path = f"{self.abs_working_dir}/logs/{client_name}-%a_%A_%a"
+            # Resolved by bash in each array task
+            client_name = f"{client_name}-${{SLURM_ARRAY_TASK_ID}}"
+
         # Build service URL if hostname and port are available
         service_url = ""
         if service_hostname and service_port:
             service_url = f"http://{service_hostname}:{service_port}"
 
-        script = f"""#!/bin/bash -l
-#SBATCH --job-name={client_name}
-#SBATCH --time={time_limit}
-#SBATCH --qos=default
-#SBATCH --partition={partition}
-#SBATCH --account={account}
-#SBATCH --nodes={num_nodes}
-#SBATCH --ntasks={num_nodes}
-#SBATCH --ntasks-per-node=1"""
-
-        # Only add GPU directive if num_gpus > 0
-        if num_gpus > 0:
-            script += f"""
-#SBATCH --gpus={num_gpus}"""
-
-        script += f"""
-#SBATCH --output={self.abs_working_dir}/logs/{client_name}_%j.out
-#SBATCH --error={self.abs_working_dir}/logs/{client_name}_%j.err
-
-echo "================================================"
-echo "Client: {client_name}"
-echo "Service: {service_name}"
-echo "Date: $(date)"
-echo "Hostname: $(hostname -s)"
-echo "Working Directory: $(pwd)"
-echo "================================================"
-
-# Export service connection information
-export SERVICE_NAME="{service_name}"
-export SERVICE_HOSTNAME="{service_hostname or ""}"
-export SERVICE_PORT="{service_port or ""}"
-export SERVICE_URL="{service_url}"
-
-# Export benchmark information for artifacts
-export BENCHMARK_ID="{self.benchmark_id}"
-export BENCHMARK_OUTPUT_DIR="{self.abs_working_dir}/metrics"
-export CLIENT_NAME="{client_name}"
-
-# Write client information to files
-echo "$(hostname)" > {self.working_dir}/{client_name}.hostname
-echo "$SLURM_JOB_ID" > {self.working_dir}/{client_name}.jobid
-
-# Create metrics directory
-mkdir -p {self.working_dir}/metrics
-
-# Start Heartbeat (for real-time monitoring across nodes)
-# Touch a file every 2 seconds so scraper knows we are alive
-HEARTBEAT_FILE="{self.abs_working_dir}/heartbeat_{client_name}"
-echo "Starting heartbeat at $HEARTBEAT_FILE"
-(while true; do touch "$HEARTBEAT_FILE"; sleep 2; done) &
-HEARTBEAT_PID=$!
-
-# Run the benchmark command
-echo "Running benchmark command..."
-{benchmark_command}
-
-# Stop Heartbeat
-kill $HEARTBEAT_PID 2>/dev/null
-rm -f "$HEARTBEAT_FILE"
-
-echo "Benchmark completed at $(date)"
-"""
-        return script
+        return _CLIENT_SBATCH_TEMPLATE.format(
+            directives=_sbatch_directives(
+                job_name=job_name,
+                log_path=log_path,
+                time_limit=time_limit,
+                partition=partition,
+                account=account,
+                num_nodes=num_nodes,
+                options=sbatch_options,
+            ),
+            client_name=client_name,
+            service_name=service_name,
+            service_hostname=service_hostname or "",
+            service_port=service_port or "",
+            service_url=service_url,
+            abs_working_dir=self.abs_working_dir,
+            working_dir=self.working_dir,
+            benchmark_id=self.benchmark_id,
+            benchmark_command=benchmark_command,
+        )
 
     def deploy_client(
         self,
@@ -366,6 +552,7 @@ echo "Benchmark completed at $(date)"
         service: Optional[Service] = None,
         wait_for_start: bool = True,
         max_wait_time: int = 300,
+        save_state: bool = True,
         **sbatch_kwargs,
     ) -> Optional[Client]:
         """
@@ -387,6 +574,8 @@ echo "Benchmark completed at $(date)"
             service: Optional Service object (will be loaded if not provided)
             wait_for_start: Whether to wait for job to start running
             max_wait_time: Maximum time to wait for job to start (seconds)
+            save_state: Save the client to storage; callers deploying several
+                clients pass False and save them in one batch
             **sbatch_kwargs: Additional sbatch parameters (partition, num_gpus, time_limit, etc.)
 
         Returns:
@@ -420,7 +609,6 @@ echo "Benchmark completed at $(date)"
         # Get fresh hostname from file (in case it wasn't saved to Service object)
         service_hostname = service.hostname
         if not service_hostname:
-            # Poll for hostname with exponential backoff
             print("Waiting for service hostname to be available...")
             service_hostname = self._wait_for_service_hostname(
                 service_name, max_wait_time=120  # Increased for GPU services
@@ -451,21 +639,10 @@ echo "Benchmark completed at $(date)"
             **sbatch_kwargs,
         )
 
-        # Write script locally first
-        local_script_path = Path(f"/tmp/{client_name}_{self.benchmark_id}.sh")
-        local_script_path.write_text(script_content)
-
-        # Upload script to cluster
+        # Write the script to the cluster and submit it in one round trip
         remote_script_path = f"{self.abs_working_dir}/scripts/{client_name}.sh"
-        print(f"Uploading client sbatch script to: {remote_script_path}")
-
-        if not self.communicator.upload_file(local_script_path, remote_script_path):
-            print("Error: Failed to upload script")
-            return None
-
-        # Submit job
-        print("Submitting client job...")
-        job_id = self.communicator.submit_job(remote_script_path)
+        print(f"Submitting client job (script: {remote_script_path})...")
+        job_id = self.communicator.submit_inline(script_content, remote_script_path)
 
         if not job_id:
             print("Error: Failed to submit job")
@@ -474,20 +651,13 @@ echo "Benchmark completed at $(date)"
         print(f"✓ Job submitted with ID: {job_id}")
 
         # Create initial client object
-        client = Client(
-            name=client_name,
-            service_name=service_name,
-            benchmark_command=benchmark_command,
-            job_id=job_id,
-            working_dir=self.working_dir,
-            submit_time=datetime.now(),
-            log_file=f"{self.working_dir}/logs/{client_name}_{job_id}.out",
-            metrics_file=f"{self.working_dir}/metrics/{client_name}_metrics.json",
-        )
+        client = self._new_client(client_name, job_id, service_name, benchmark_command)
 
-        # Save initial state
-        client.save(self.benchmark_id, self.storage_manager)
-        print("✓ Client state saved to storage")
+        # Save initial state before waiting, so the submitted job is on record
+        # even if the wait is interrupted
+        if save_state:
+            client.save(self.benchmark_id, self.storage_manager)
+            print("✓ Client state saved to storage")
 
         # Wait for job to start if requested
         if wait_for_start:
@@ -508,7 +678,8 @@ echo "Benchmark completed at $(date)"
                     print(f"✓ Client running on: {hostname}")
 
                 # Save updated state
-                client.save(self.benchmark_id, self.storage_manager)
+                if save_state:
+                    client.save(self.benchmark_id, self.storage_manager)
             else:
                 print(f"Warning: Client job did not start within {max_wait_time}s (status: {final_status})")
 
@@ -588,22 +759,265 @@ echo "Benchmark completed at $(date)"
                 return clients
             print()  # Empty line after readiness check
 
+        if num_clients > 1:
+            # All clients share one script, so submit them as a single job array
+            clients = self._deploy_client_array(
+                client_name_prefix=client_name_prefix,
+                num_clients=num_clients,
+                service_name=service_name,
+                benchmark_command=benchmark_command,
+                service=service,
+                **sbatch_kwargs,
+            )
+            if clients is None:
+                print("Job array submission failed, submitting clients one by one...")
+                clients = self._deploy_clients_individually(
+                    client_name_prefix=client_name_prefix,
+                    num_clients=num_clients,
+                    service_name=service_name,
+                    benchmark_command=benchmark_command,
+                    service=service,
+                    **sbatch_kwargs,
+                )
+            print()
+            return clients
+
         for i in range(num_clients):
-            client_name = f"{client_name_prefix}-{i + 1}"
             client = self.deploy_client(
-                client_name=client_name,
+                client_name=f"{client_name_prefix}-{i + 1}",
                 service_name=service_name,
                 benchmark_command=benchmark_command,
                 service=service,
-                wait_for_start=False,  # Don't wait for each client individually
+                wait_for_start=False,
                 **sbatch_kwargs,
             )
             if client:
                 clients.append(client)
-            print()  # Empty line between clients
+        print()
+        return clients
 
+    def _deploy_client_array(
+        self,
+        client_name_prefix: str,
+        num_clients: int,
+        service_name: str,
+        benchmark_command: str,
+        service: Service,
+        **sbatch_kwargs,
+    ) -> Optional[List[Client]]:
+        """
+        Deploy several identical clients with one sbatch job array.
+
+        One script upload and one submission replace one per client. The
+        clients are saved to storage in a single batch.
+
+        Args:
+            client_name_prefix: Prefix for client names (will be numbered)
+            num_clients: Number of clients to deploy
+            service_name: Name of the service to benchmark
+            benchmark_command: Command to run for benchmarking
+            service: Service object with a resolved hostname
+            **sbatch_kwargs: Additional sbatch parameters
+
+        Returns:
+            List of Client objects, an empty list if the service is not
+            running (or the outcome of a failed submission is unknown), or
+            None if the array is definitely not queued (so the caller can
+            fall back to individual submissions)
+        """
+        self._ensure_connected()
+
+        # Verify service is running
+        if service.job_id:
+            status = self.get_job_status(service.job_id)
+            if status != "RUNNING":
+                print(
+                    f"Error: Service '{service_name}' is not running (status: {status})"
+                )
+                return []
+            print(f"✓ Service '{service_name}' is running (Job ID: {service.job_id})")
+
+        service_url = ""
+        if service.hostname and service.port:
+            service_url = f"http://{service.hostname}:{service.port}"
+
+        script_content = self._create_client_sbatch_script(
+            client_name=client_name_prefix,
+            service_name=service_name,
+            service_hostname=service.hostname,
+            service_port=service.port,
+            service_url=service_url,
+            benchmark_command=benchmark_command,
+            array_size=num_clients,
+            **sbatch_kwargs,
+        )
+
+        remote_script_path = f"{self.abs_working_dir}/scripts/{client_name_prefix}-array.sh"
+        print(f"Submitting {num_clients} clients as a job array (script: {remote_script_path})...")
+        job_id = self.communicator.submit_inline(script_content, remote_script_path)
+        if not job_id:
+            # A timeout or dropped connection does not mean sbatch rejected the
+            # array; only resubmit the clients one by one if it is not queued
+            queued = self._queued_jobs_for_script(remote_script_path)
+            if queued is None:
+                print(
+                    "Error: Job array submission failed and the queue could not be "
+                    "checked; not resubmitting to avoid duplicate jobs"
+                )
+                return []
+            if not queued:
+                return None
+            job_id = queued[-1]
+            print(f"✓ Job array was queued despite the failed submission: {job_id}")
+        else:
+            print(f"✓ Job array submitted with ID: {job_id}")
+
+        clients = [
+            self._new_client(
+                f"{client_name_prefix}-{i}", f"{job_id}_{i}", service_name, benchmark_command
+            )
+            for i in range(1, num_clients + 1)
+        ]
+
+        self.storage_manager.save_entities(
+            self.benchmark_id, "client", [(client.name, client.to_dict()) for client in clients]
+        )
+        print("✓ Client state saved to storage")
+        return clients
+
+    def _queued_jobs_for_script(self, script_path: str) -> Optional[List[str]]:
+        """
+        Find this user's queued or running jobs that were submitted from a script.
+
+        Args:
+            script_path: Absolute path of the sbatch script on the cluster
+
+        Returns:
+            Job IDs in ascending order, each job array once under its base
+            job ID, or None if squeue could not be run
+        """
+        # %F is the array's base job ID for every task (and the job ID for
+        # plain jobs); %A would give each running task its own ID
+        result = self.communicator.execute_command('squeue -h -u "$USER" -o "%F %o"')
+        if not result.success:
+            return None
+        job_ids = {
+            job_id
+            for job_id, _, command in (
+                line.partition(" ") for line in result.stdout.splitlines()
+            )
+            if command.strip() == script_path
+        }
+        return sorted(job_ids, key=lambda job_id: int(job_id) if job_id.isdigit() else 0)
+
+    def _deploy_clients_individually(
+        self,
+        client_name_prefix: str,
+        num_clients: int,
+        service_name: str,
+        benchmark_command: str,
+        service: Service,
+        **sbatch_kwargs,
+    ) -> List[Client]:
+        """
+        Submit one job per client, the fallback when job arrays are not available.
+
+        With asyncssh installed the submissions run concurrently as channels
+        of a single connection; otherwise they go one after another over the
+        Manager's own connection.
+
+        Args:
+            client_name_prefix: Prefix for client names (will be numbered)
+            num_clients: Number of clients to deploy
+            service_name: Name of the service to benchmark
+            benchmark_command: Command to run for benchmarking
+            service: Service object with a resolved hostname
+            **sbatch_kwargs: Additional sbatch parameters
+
+        Returns:
+            List of the submitted Client objects (saved to storage in one batch)
+        """
+        communicator = None
+        if HAS_ASYNCSSH:
+            communicator = AsyncSSHCommunicator(
+                self.target,
+                user=getattr(self.communicator, "user", None),
+                port=getattr(self.communicator, "port", None),
+            )
+            if not communicator.connect():
+                communicator = None
+
+        service_url = ""
+        if service.hostname and service.port:
+            service_url = f"http://{service.hostname}:{service.port}"
+
+        client_names = [f"{client_name_prefix}-{i + 1}" for i in range(num_clients)]
+        scripts = [
+            (
+                self._create_client_sbatch_script(
+                    client_name=client_name,
+                    service_name=service_name,
+                    service_hostname=service.hostname,
+                    service_port=service.port,
+                    service_url=service_url,
+                    benchmark_command=benchmark_command,
+                    **sbatch_kwargs,
+                ),
+                f"{self.abs_working_dir}/scripts/{client_name}.sh",
+            )
+            for client_name in client_names
+        ]
+        if communicator is None:
+            print(f"Submitting {num_clients} client jobs...")
+            job_ids = self.communicator.submit_inline_many(scripts)
+        else:
+            print(f"Submitting {num_clients} client jobs concurrently...")
+            try:
+                job_ids = communicator.submit_inline_many(scripts)
+            finally:
+                communicator.disconnect()
+
+        clients = []
+        for client_name, job_id in zip(client_names, job_ids):
+            if not job_id:
+                print(f"Error: Failed to submit job for {client_name}")
+                continue
+            print(f"✓ {client_name} submitted with ID: {job_id}")
+            clients.append(self._new_client(client_name, job_id, service_name, benchmark_command))
+
+        if clients:
+            self.storage_manager.save_entities(
+                self.benchmark_id, "client", [(client.name, client.to_dict()) for client in clients]
+            )
+            print("✓ Client state saved to storage")
         return clients
 
+    def _new_client(
+        self, client_name: str, job_id: str, service_name: str, benchmark_command: str
+    ) -> Client:
+        """
+        Create the Client object for a freshly submitted client job.
+
+        Args:
+            client_name: Name of the client
+            job_id: Slurm job ID (or "<job>_<task>" for job array tasks)
+            service_name: Name of the service being benchmarked
+            benchmark_command: Command the client runs
+
+        Returns:
+            Client object
+        """
+        return Client(
+            name=client_name,
+            service_name=service_name,
+            benchmark_command=benchmark_command,
+            job_id=job_id,
+            working_dir=self.working_dir,
+            submit_time=datetime.now(),
+            log_file=f"{self.working_dir}/logs/{client_name}_{job_id}.out",
+            metrics_file=f"{self.working_dir}/metrics/{client_name}_metrics.json",
+        )
+
     def deploy_service(
         self,
         service_name: str,
@@ -647,19 +1061,12 @@ echo "Benchmark completed at $(date)"
         # Create working directory structure on cluster
         print(f"Creating working directory: {self.abs_working_dir}")
 
-        # Create directories
-        result = self.communicator.execute_command(
-            f"mkdir -p {self.abs_working_dir}/logs"
-        )
-        if not result.success:
-            print(f"Error: Failed to create logs directory: {result.stderr}")
-            return None
-
+        # Create directories (single mkdir, single round trip)
         result = self.communicator.execute_command(
-            f"mkdir -p {self.abs_working_dir}/scripts"
+            f"mkdir -p {self.abs_working_dir}/logs {self.abs_working_dir}/scripts"
         )
         if not result.success:
-            print(f"Error: Failed to create scripts directory: {result.stderr}")
+            print(f"Error: Failed to create working directories: {result.stderr}")
             return None
 
         # Generate sbatch script
@@ -671,34 +1078,23 @@ echo "Benchmark completed at $(date)"
             **sbatch_kwargs,
         )
 
-        # Write script locally first
-        local_script_path = Path(f"/tmp/{service_name}_{self.benchmark_id}.sh")
-        local_script_path.write_text(script_content)
-
-        # Upload script to cluster (use absolute path)
-        remote_script_path = f"{self.abs_working_dir}/scripts/{service_name}.sh"
-        print(f"Uploading sbatch script to: {remote_script_path}")
-
-        if not self.communicator.upload_file(local_script_path, remote_script_path):
-            print("Error: Failed to upload script")
-            return None
-
-        # Upload monitoring scraper script
-        try:
-            import sys
-            repo_root = Path(__file__).parent.parent.parent
-            local_scraper_path = repo_root / "src/monitoring/scraper.py"
-            
-            if local_scraper_path.exists():
-                remote_scraper_path = f"{self.abs_working_dir}/scripts/scraper.py"
+        # Upload monitoring scraper script (before the job that runs it);
+        # services of the same benchmark share one copy
+        remote_scraper_path = f"{self.abs_working_dir}/scripts/scraper.py"
+        scraper_source = self._get_scraper_source()
+        if scraper_source is not None and remote_scraper_path not in self._uploaded_paths:
+            try:
                 print(f"Uploading scraper to: {remote_scraper_path}")
-                self.communicator.upload_file(local_scraper_path, remote_scraper_path)
-        except Exception as e:
-            print(f"Warning: Failed to upload scraper: {e}")
+                if self.communicator.upload_bytes(scraper_source, remote_scraper_path):
+                    self._uploaded_paths.add(remote_scraper_path)
+            except Exception as e:
+                print(f"Warning: Failed to upload scraper: {e}")
 
-        # Submit job
-        print("Submitting job...")
-        job_id = self.communicator.submit_job(remote_script_path)
+        # Write the script to the cluster and submit it in one round trip
+        # (use absolute path)
+        remote_script_path = f"{self.abs_working_dir}/scripts/{service_name}.sh"
+        print(f"Submitting job (script: {remote_script_path})...")
+        job_id = self.communicator.submit_inline(script_content, remote_script_path)
 
         if not job_id:
             print("Error: Failed to submit job")
@@ -772,22 +1168,10 @@ echo "Benchmark completed at $(date)"
             - success: True if job started running, False if timeout or failure
             - final_status: Last known job status ("RUNNING", "PENDING", "FAILED", etc.)
         """
-        start_time = time.time()
-        last_status = "UNKNOWN"
-
-        while time.time() - start_time < max_wait_time:
-            status = self.communicator.get_job_status(job_id)
-            last_status = status or "UNKNOWN"
-
-            if status == "RUNNING":
-                return (True, status)
-            elif status in ["COMPLETED", "FAILED", "CANCELLED"]:
-                return (False, status)
-
-            # Wait a bit before checking again
-            time.sleep(5)
-
-        return (False, last_status)
+        # Polled on the cluster, so the wait costs one round trip
+        with _progress_ticker("Waiting for job to start", max_wait_time):
+            status = self.communicator.wait_for_job_state(job_id, max_wait_time)
+        return (status == "RUNNING", status or "UNKNOWN")
 
     def _get_service_hostname(self, service_name: str) -> Optional[str]:
         """
@@ -801,21 +1185,48 @@ echo "Benchmark completed at $(date)"
         Returns:
             Hostname or None if not available
         """
-        hostname_file = f"{self.abs_working_dir}/{service_name}.hostname"
+        return self._get_hostnames([service_name]).get(service_name)
 
-        # Check if file exists
-        result = self.communicator.execute_command(f"test -e {hostname_file}")
-        if not result.success:
-            return None
+    def _get_hostnames(self, names: List[str]) -> Dict[str, str]:
+        """
+        Get the hostnames of several services/clients in one round trip.
 
+        Reads the hostname files written by the sbatch scripts; names whose
+        file is missing or still empty are left out.
+
+        Args:
+            names: Service or client names
+
+        Returns:
+            Hostname per name
+        """
+        hostnames = {
+            name: self._hostname_cache[name] for name in names if name in self._hostname_cache
+        }
+        missing = [name for name in names if name not in hostnames]
+        if not missing:
+            return hostnames
+
+        # One "<name>=<hostname>" record per existing file, NUL-terminated
+        files = " ".join(shlex.quote(f"{name}.hostname") for name in missing)
         try:
-            result = self.communicator.execute_command(f"cat {hostname_file}")
-            if result.success and result.stdout:
-                return result.stdout.strip()
+            result = self.communicator.execute_command(
+                f"for f in {files}; do "
+                f'[ -s "$f" ] && printf \'%s=%s\\0\' "${{f%.hostname}}" "$(cat "$f")"; '
+                f"done; true",
+                working_dir=self.abs_working_dir,
+            )
         except Exception as e:
-            print(f"Error reading hostname file: {e}")
+            print(f"Error reading hostname files: {e}")
+            return hostnames
 
-        return None
+        if result.success:
+            for record in result.stdout.split("\0"):
+                name, _, hostname = record.strip().partition("=")
+                if name in missing and hostname:
+                    hostnames[name] = hostname
+                    self._hostname_cache[name] = hostname
+        return hostnames
 
     def get_job_status(self, job_id: str) -> Optional[str]:
         """
@@ -830,6 +1241,19 @@ echo "Benchmark completed at $(date)"
         self._ensure_connected()
         return self.communicator.get_job_status(job_id)
 
+    def get_job_statuses(self, job_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the status of several Slurm jobs with a single cluster query.
+
+        Args:
+            job_ids: Slurm job IDs
+
+        Returns:
+            Dictionary mapping job ID to status string (missing jobs omitted)
+        """
+        self._ensure_connected()
+        return self.communicator.get_job_statuses(job_ids)
+
     def cancel_job(self, job_id: str) -> bool:
         """
         Cancel a Slurm job.
@@ -843,6 +1267,19 @@ echo "Benchmark completed at $(date)"
         self._ensure_connected()
         return self.communicator.cancel_job(job_id)
 
+    def cancel_jobs(self, job_ids: List[str]) -> Dict[str, bool]:
+        """
+        Cancel several Slurm jobs in one round trip.
+
+        Args:
+            job_ids: Slurm job IDs
+
+        Returns:
+            Dictionary mapping job ID to whether it was cancelled
+        """
+        self._ensure_connected()
+        return self.communicator.cancel_jobs(job_ids)
+
     def load_service(self, service_name: str) -> Optional[Service]:
         """
         Load a service from storage.
@@ -889,10 +1326,11 @@ echo "Benchmark completed at $(date)"
         self, service_name: str, max_wait_time: int = 120
     ) -> Optional[str]:
         """
-        Wait for service hostname to become available with exponential backoff.
+        Wait for service hostname to become available.
 
-        This method polls for the hostname file to exist and contain data,
-        using exponential backoff to handle variable cluster scheduling delays.
+        The hostname file is watched on the cluster by a single long-running
+        command, so it is picked up within a second of being written without
+        a round trip per poll.
 
         Args:
             service_name: Name of the service
@@ -901,30 +1339,17 @@ echo "Benchmark completed at $(date)"
         Returns:
             Hostname string or None if timeout reached
         """
-        hostname_file = f"{self.abs_working_dir}/{service_name}.hostname"
-        start_time = time.time()
-        wait_interval = 1  # Start with 1 second
-        max_interval = 10  # Max 10 seconds between polls
-
-        while time.time() - start_time < max_wait_time:
-            # Check if file exists and has content
-            result = self.communicator.execute_command(
-                f"test -s {hostname_file} && cat {hostname_file}"
-            )
-            if result.success and result.stdout:
-                hostname = result.stdout.strip()
-                if hostname:  # Ensure hostname is not empty
-                    return hostname
+        hostname = self._hostname_cache.get(service_name)
+        if hostname:
+            return hostname
 
-            # Wait with exponential backoff
-            time.sleep(wait_interval)
-            wait_interval = min(wait_interval * 2, max_interval)
-
-            # Show progress
-            elapsed = int(time.time() - start_time)
-            print(f"  Waiting for hostname... ({elapsed}s elapsed)")
-
-        return None
+        hostname_file = f"{self.abs_working_dir}/{service_name}.hostname"
+        print(f"  Waiting up to {max_wait_time}s for {hostname_file}...")
+        with _progress_ticker("Waiting for hostname", max_wait_time):
+            hostname = self.communicator.wait_for_file(hostname_file, max_wait_time)
+        if hostname:
+            self._hostname_cache[service_name] = hostname
+        return hostname
 
     def _wait_for_service_ready(
         self,
@@ -952,87 +1377,59 @@ echo "Benchmark completed at $(date)"
         """
         if not hostname:
             return False
-            
-        start_time = time.time()
-        wait_interval = 2  # Start with 2 seconds
-        max_interval = 15  # Max 15 seconds between polls
-        
-        print(f"  Checking service readiness ({service_type or 'generic'})...")
-        
-        while time.time() - start_time < max_wait_time:
-            elapsed = int(time.time() - start_time)
-            is_ready = False
-            
-            try:
-                if service_type == "ollama":
-                    # Ollama: Check /api/tags for model availability
-                    check_url = f"http://{hostname}:11434/api/tags"
-                    result = self.communicator.execute_command(
-                        f"curl -s --max-time 5 {check_url}"
-                    )
-                    if result.success and result.stdout:
-                        # Check if expected model is in the response
-                        if expected_model:
-                            if expected_model in result.stdout:
-                                is_ready = True
-                                print(f"  ✓ Model '{expected_model}' is loaded")
-                        else:
-                            # Any successful response means service is ready
-                            if "models" in result.stdout:
-                                is_ready = True
-                                
-                elif service_type == "vllm":
-                    # vLLM: Check /health or /v1/models
-                    check_url = f"http://{hostname}:{port or 8000}/health"
-                    result = self.communicator.execute_command(
-                        f"curl -s --max-time 5 -o /dev/null -w '%{{http_code}}' {check_url}"
-                    )
-                    if result.success and result.stdout.strip() == "200":
-                        is_ready = True
-                    else:
-                        # Fallback to /v1/models
-                        check_url = f"http://{hostname}:{port or 8000}/v1/models"
-                        result = self.communicator.execute_command(
-                            f"curl -s --max-time 5 {check_url}"
-                        )
-                        if result.success and "data" in result.stdout:
-                            is_ready = True
-                            
-                elif service_type in ("redis", "postgres", "chroma"):
-                    # For databases: Simple TCP port check
-                    check_port = port or {"redis": 6379, "postgres": 5432, "chroma": 8000}.get(service_type, port)
-                    if check_port:
-                        result = self.communicator.execute_command(
-                            f"timeout 3 bash -c 'cat < /dev/null > /dev/tcp/{hostname}/{check_port}' 2>/dev/null && echo 'OK'"
-                        )
-                        if result.success and "OK" in result.stdout:
-                            is_ready = True
-                else:
-                    # Generic check: TCP port if available
-                    if port:
-                        result = self.communicator.execute_command(
-                            f"timeout 3 bash -c 'cat < /dev/null > /dev/tcp/{hostname}/{port}' 2>/dev/null && echo 'OK'"
-                        )
-                        if result.success and "OK" in result.stdout:
-                            is_ready = True
-                    else:
-                        # No port to check, assume ready after hostname available
-                        is_ready = True
-                        
-            except Exception as e:
-                print(f"  Health check error: {e}")
-                
-            if is_ready:
-                print(f"  ✓ Service is ready! ({elapsed}s)")
+
+        if service_type == "ollama":
+            # Ollama: /api/tags lists the loaded models
+            check_url = shlex.quote(f"http://{hostname}:11434/api/tags")
+            pattern = shlex.quote(expected_model) if expected_model else "models"
+            check = f"curl -s --max-time 2 {check_url} | grep -qF -- {pattern}"
+        elif service_type == "vllm":
+            # vLLM: /health, with /v1/models as fallback
+            base_url = f"http://{hostname}:{port or 8000}"
+            health_url = shlex.quote(f"{base_url}/health")
+            models_url = shlex.quote(f"{base_url}/v1/models")
+            check = (
+                f"[ \"$(curl -s --max-time 2 -o /dev/null -w '%{{http_code}}' {health_url})\" = 200 ] "
+                f"|| curl -s --max-time 2 {models_url} | grep -qF data"
+            )
+        else:
+            # Databases and generic services: TCP port check
+            check_port = port
+            if service_type in ("redis", "postgres", "chroma"):
+                check_port = port or {"redis": 6379, "postgres": 5432, "chroma": 8000}[service_type]
+            if not check_port:
+                # No port to check, assume ready after hostname available
+                print("  ✓ Service is ready! (0s)")
                 return True
-                
-            # Show progress
-            print(f"  Waiting for service to be ready... ({elapsed}s/{max_wait_time}s)")
-            
-            # Wait with exponential backoff
-            time.sleep(wait_interval)
-            wait_interval = min(wait_interval * 1.5, max_interval)
-            
+            check = f"timeout 3 bash -c \"cat < /dev/null > /dev/tcp/{hostname}/{int(check_port)}\" 2>/dev/null"
+
+        print(f"  Checking service readiness ({service_type or 'generic'}), up to {max_wait_time}s...")
+
+        # The health check is polled on the cluster by a single command that
+        # returns as soon as it passes, so the wait costs one round trip and
+        # readiness is seen within a second
+        start_time = time.time()
+        try:
+            with _progress_ticker("Waiting for service to be ready", max_wait_time):
+                result = self.communicator.execute_command(
+                    f"end=$((SECONDS + {int(max_wait_time)})); "
+                    f"until {check}; do "
+                    f"[ $SECONDS -ge $end ] && exit 1; sleep 1; "
+                    f"done; echo READY",
+                    # Leave the remote loop time to give up on its own
+                    timeout=int(max_wait_time) + 30,
+                )
+        except Exception as e:
+            print(f"  Health check error: {e}")
+            return False
+        elapsed = int(time.time() - start_time)
+
+        if result.success and "READY" in result.stdout:
+            if service_type == "ollama" and expected_model:
+                print(f"  ✓ Model '{expected_model}' is loaded")
+            print(f"  ✓ Service is ready! ({elapsed}s)")
+            return True
+
         print(f"  ❌ Service readiness timeout after {max_wait_time}s")
         return False
 
@@ -1047,41 +1444,26 @@ echo "Benchmark completed at $(date)"
 
         result = {"services": [], "clients": [], "errors": []}
 
-        # Load and cancel all services
-        services = self.load_all_services()
-        for service in services:
-            if service.job_id:
-                try:
-                    if self.cancel_job(service.job_id):
-                        result["services"].append(
-                            {"name": service.name, "job_id": service.job_id}
-                        )
-                    else:
-                        result["errors"].append(
-                            f"Failed to cancel service {service.name} (job {service.job_id})"
-                        )
-                except Exception as e:
-                    result["errors"].append(
-                        f"Error cancelling service {service.name}: {e}"
-                    )
-
-        # Load and cancel all clients
-        clients = self.load_all_clients()
-        for client in clients:
-            if client.job_id:
-                try:
-                    if self.cancel_job(client.job_id):
-                        result["clients"].append(
-                            {"name": client.name, "job_id": client.job_id}
-                        )
-                    else:
-                        result["errors"].append(
-                            f"Failed to cancel client {client.name} (job {client.job_id})"
-                        )
-                except Exception as e:
-                    result["errors"].append(
-                        f"Error cancelling client {client.name}: {e}"
-                    )
+        jobs = [
+            ("service", job) for job in self.load_all_services() if job.job_id
+        ] + [("client", job) for job in self.load_all_clients() if job.job_id]
+        if not jobs:
+            return result
+
+        # Cancel every job in one round trip
+        try:
+            cancelled = self.cancel_jobs([job.job_id for _, job in jobs])
+        except Exception as e:
+            result["errors"].append(f"Error cancelling jobs: {e}")
+            return result
+
+        for kind, job in jobs:
+            if cancelled.get(str(job.job_id)):
+                result[f"{kind}s"].append({"name": job.name, "job_id": job.job_id})
+            else:
+                result["errors"].append(
+                    f"Failed to cancel {kind} {job.name} (job {job.job_id})"
+                )
 
         return result
 
@@ -1096,12 +1478,17 @@ echo "Benchmark completed at $(date)"
 
         status = {"services": [], "clients": []}
 
-        # Get service statuses
         services = self.load_all_services()
+        clients = self.load_all_clients()
+
+        # Poll every tracked job in one round trip
+        job_statuses = self.get_job_statuses(
+            [job.job_id for job in (*services, *clients) if job.job_id]
+        )
+
+        # Get service statuses
         for service in services:
-            job_status = None
-            if service.job_id:
-                job_status = self.get_job_status(service.job_id)
+            job_status = job_statuses.get(str(service.job_id)) if service.job_id else None
             status["services"].append(
                 {
                     "name": service.name,
@@ -1111,20 +1498,29 @@ echo "Benchmark completed at $(date)"
                 }
             )
 
+        # Lazy-load hostnames of clients that are running/completed but have
+        # none yet, all in one round trip
+        hostnames = self._get_hostnames(
+            [
+                client.name
+                for client in clients
+                if client.job_id
+                and not client.hostname
+                and job_statuses.get(str(client.job_id)) in ["RUNNING", "COMPLETED"]
+            ]
+        )
+
         # Get client statuses
-        clients = self.load_all_clients()
+        found_hostnames = []
         for client in clients:
-            if client.job_id:
-                job_status = self.get_job_status(client.job_id)
-            
-            # Lazy-load hostname if running/completed but missing
-            if (job_status in ["RUNNING", "COMPLETED"] and not client.hostname and client.job_id):
-                hostname = self._get_service_hostname(client.name)
+            job_status = job_statuses.get(str(client.job_id)) if client.job_id else None
+
+            if not client.hostname:
+                hostname = hostnames.get(client.name)
                 if hostname:
                     client.hostname = hostname
                     client.node_name = hostname
-                    # Persist the found hostname
-                    client.save(self.benchmark_id, self.storage_manager)
+                    found_hostnames.append((client.name, client.to_dict()))
 
             status["clients"].append(
                 {
@@ -1135,6 +1531,10 @@ echo "Benchmark completed at $(date)"
                 }
             )
 
+        # Persist the found hostnames in one write
+        if found_hostnames:
+            self.storage_manager.save_entities(self.benchmark_id, "client", found_hostnames)
+
         return status
 
     def tail_logs(self, num_lines: int = 20) -> dict:
@@ -1151,33 +1551,37 @@ echo "Benchmark completed at $(date)"
 
         logs = {"services": {}, "clients": {}}
 
-        # Get service logs
-        services = self.load_all_services()
-        for service in services:
-            if service.job_id:
-                log_path = (
-                    f"{self.abs_working_dir}/logs/{service.name}_{service.job_id}.out"
-                )
-                result = self.communicator.execute_command(
-                    f"tail -n {num_lines} {log_path} 2>/dev/null"
-                )
-                logs["services"][service.name] = (
-                    result.stdout if result.success else "(no logs yet)"
-                )
+        # Log file (relative to logs/) of every job, e.g. "vllm_1234.out"
+        targets = [
+            ("services", service.name, f"{service.name}_{service.job_id}.out")
+            for service in self.load_all_services()
+            if service.job_id
+        ] + [
+            ("clients", client.name, f"{client.name}_{client.job_id}.out")
+            for client in self.load_all_clients()
+            if client.job_id
+        ]
+        if not targets:
+            return logs
+
+        # Tail every file in one round trip; each existing file is announced
+        # by a NUL-delimited header with its name
+        files = " ".join(shlex.quote(filename) for _, _, filename in targets)
+        result = self.communicator.execute_command(
+            f"for f in {files}; do "
+            f'[ -r "$f" ] && printf \'\\0%s\\0\' "$f" && tail -n {int(num_lines)} -- "$f"; '
+            f"done; true",
+            working_dir=f"{self.abs_working_dir}/logs",
+        )
 
-        # Get client logs
-        clients = self.load_all_clients()
-        for client in clients:
-            if client.job_id:
-                log_path = (
-                    f"{self.abs_working_dir}/logs/{client.name}_{client.job_id}.out"
-                )
-                result = self.communicator.execute_command(
-                    f"tail -n {num_lines} {log_path} 2>/dev/null"
-                )
-                logs["clients"][client.name] = (
-                    result.stdout if result.success else "(no logs yet)"
-                )
+        tails = {}
+        if result.success:
+            fields = result.stdout.split("\0")
+            for filename, content in zip(fields[1::2], fields[2::2]):
+                tails[filename] = content.strip()
+
+        for kind, name, filename in targets:
+            logs[kind][name] = tails.get(filename, "(no logs yet)")
 
         return logs
 
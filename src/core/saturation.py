@@ -13,8 +13,6 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import numpy as np
-
 
 def find_knee_point(x_values: List[float], y_values: List[float]) -> Optional[int]:
     """
@@ -32,6 +30,9 @@ def find_knee_point(x_values: List[float], y_values: List[float]) -> Optional[in
     if len(x_values) < 3:
         return None
 
+    # Imported here so that loading the core package does not pull in NumPy
+    import numpy as np
+
     # Normalize values to [0, 1] range for consistent analysis
     x_norm = np.array(x_values, dtype=float)
     y_norm = np.array(y_values, dtype=float)
@@ -28,6 +28,7 @@ from builders.command_builders import (
     validate_service_type,
     validate_settings,
 )
+from infra.communicator import round_trip_count
 from infra.health import check_http_health, wait_for_service_healthy
 from core.manager import Manager
 from monitoring.monitor import (
@@ -886,6 +887,7 @@ def run_benchmark_from_recipe(recipe_path: Path) -> Optional[int]:
         print(f"Command: {service_config.command}\n")
 
         # Create Manager and deploy service
+        round_trips_before = round_trip_count()
         with Manager(target=target, benchmark_id=benchmark_id) as manager:
             print("Connecting to cluster...")
 
@@ -1059,7 +1061,8 @@ def run_benchmark_from_recipe(recipe_path: Path) -> Optional[int]:
                 target=target
             )
             print(f"✓ Run metadata written to results/{benchmark_id}/run.json")
-            
+            print(f"[perf] deploy made {round_trip_count() - round_trips_before} SSH round-trips")
+
             # Benchmark is now running - return control to caller
             # The UI will ask if user wants to watch status
             return benchmark_id
@@ -1788,8 +1791,7 @@ def cmd_rerun_benchmark(benchmark_id: str) -> int:
             
     finally:
         # Cleanup
-        if tmp_path.exists():
-            os.unlink(tmp_path)
+        tmp_path.unlink(missing_ok=True)
 
 
 def cmd_compare_benchmarks(id1: str, id2: str) -> int:
@@ -6,9 +6,14 @@ Contains:
 - storage: Persistence layer
 - health: Health checks
 - logs: Log retrieval
+- rsync: Bulk file transfers with rsync
 """
 
-from .communicator import SSHCommunicator
+from .communicator import (
+    SSHCommunicator,
+    AsyncSSHCommunicator,
+    round_trip_count,
+)
 from .storage import (
     get_storage_manager,
     StorageManager,
@@ -19,3 +24,4 @@ from .storage import (
 )
 from .health import check_http_health, wait_for_service_healthy
 from .logs import LogManager, LogEntry, LogFile
+from .rsync import HAS_RSYNC, rsync_pull
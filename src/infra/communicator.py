@@ -10,17 +10,92 @@ Uses Fabric for SSH communication, which provides a clean Python API
 for remote command execution and file transfers.
 """
 
+import asyncio
+import functools
+import io
+import os
+import random
+import re
+import select
+import shlex
+import socket
+import tarfile
+import tempfile
+import threading
+import time
+import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from fabric import Connection
 from invoke.exceptions import UnexpectedExit
-from paramiko.ssh_exception import SSHException
-
-
-@dataclass
+from paramiko import SFTPClient
+from paramiko.ssh_exception import AuthenticationException, SSHException
+
+# Optional asyncssh backend (method="async-ssh")
+try:
+    import asyncssh
+
+    HAS_ASYNCSSH = True
+except ImportError:
+    asyncssh = None
+    HAS_ASYNCSSH = False
+
+# Slurm output parsers, compiled once and reused for every call
+_SBATCH_JOBID_RE = re.compile(r"Submitted batch job (\d+)")
+# Status parsers work on raw bytes so only the matched fields get decoded
+# squeue -h -o "%i %T": "<job_id> <state>" per line
+_SQUEUE_LINE_RE = re.compile(rb"^\s*(\S+)\s+(\S+)\s*$", re.MULTILINE)
+# sacct --parsable2 -o JobID,State: "<job_id>|<state>" per line
+_SACCT_LINE_RE = re.compile(rb"^\s*([^|\s]+)\|([^|\n]*)", re.MULTILINE)
+# Slurm states of a job that will not start (or run) any more, as a case pattern
+_JOB_END_STATES = "COMPLETED|FAILED|CANCELLED|TIMEOUT|NODE_FAIL|OUT_OF_MEMORY|PREEMPTED|BOOT_FAIL|DEADLINE"
+
+
+# Maximum characters of stdout/stderr shown by str(CommandResult)
+_STR_OUTPUT_LIMIT = 512
+
+# Longest sbatch script sent inline by submit_inline(); the command line of
+# a single exec is limited (Linux: 128 KiB per argument)
+_INLINE_SCRIPT_MAX_CHARS = 64 * 1024
+
+# Channels one connection runs at the same time in execute_many and friends.
+# sshd refuses sessions beyond MaxSessions (OpenSSH default: 10); keep below
+# it, with room for the SFTP session and a persistent shell
+_MAX_CONCURRENT_CHANNELS = 8
+
+# asyncssh SFTP pipelining for downloads: read size and reads in flight
+_SFTP_BLOCK_SIZE = 256 * 1024
+_SFTP_MAX_REQUESTS = 64
+
+# Default for SSHCommunicator(control_master=None). Setting
+# BENCHMARK_SSH_CONTROL_MASTER=1 makes the OpenSSH tools started for any
+# communicator (rsync artifact pulls) share one master per target, so only
+# the first of them pays the TCP/SSH handshake. Paramiko sessions still
+# connect and authenticate on their own
+CONTROL_MASTER_DEFAULT = os.environ.get(
+    "BENCHMARK_SSH_CONTROL_MASTER", ""
+).lower() in ("1", "true", "yes")
+
+
+def _truncate(text: str, limit: int = _STR_OUTPUT_LIMIT) -> str:
+    """Shorten text to at most limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def _quote_remote_path(path: str) -> str:
+    """Shell-quote a remote path, leaving a leading ~ for the remote shell to expand."""
+    if path == "~":
+        return path
+    if path.startswith("~/"):
+        return "~/" + shlex.quote(path[2:])
+    return shlex.quote(path)
+
+
+@dataclass(slots=True, frozen=True)
 class CommandResult:
     """Result of a command execution on the remote cluster."""
 
@@ -34,8 +109,101 @@ class CommandResult:
         return self.return_code == 0
 
     def __str__(self) -> str:
-        status = "SUCCESS" if self.success else f"FAILED (code: {self.return_code})"
-        return f"CommandResult({status})\nstdout: {self.stdout}\nstderr: {self.stderr}"
+        status = "SUCCESS" if self.return_code == 0 else f"FAILED (code: {self.return_code})"
+        # Cap the echoed output so printing a result of a long squeue/sacct
+        # listing stays cheap and readable
+        return (
+            f"CommandResult({status})\nstdout: {_truncate(self.stdout)}"
+            f"\nstderr: {_truncate(self.stderr)}"
+        )
+
+
+def _to_command_result(result) -> CommandResult:
+    """Convert a Fabric/Invoke result into a CommandResult, stripping output once."""
+    stdout = result.stdout
+    stderr = result.stderr
+    return CommandResult(
+        stdout=stdout.strip() if stdout else "",
+        stderr=stderr.strip() if stderr else "",
+        return_code=result.return_code,
+    )
+
+
+# Remote operations (command executions and file transfers) issued by all
+# communicators in this process, see round_trip_count()
+_round_trips = 0
+_round_trips_lock = threading.Lock()
+
+
+def _count_round_trip() -> None:
+    """Record one remote operation."""
+    global _round_trips
+    with _round_trips_lock:
+        _round_trips += 1
+
+
+def _counts_round_trip(method):
+    """Decorator counting each call of a communicator method as one remote operation."""
+    if asyncio.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(*args, **kwargs):
+            _count_round_trip()
+            return await method(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        _count_round_trip()
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+def round_trip_count() -> int:
+    """
+    Number of remote operations issued by all communicators in this process.
+
+    Every command execution and file transfer counts once, whether it goes
+    through a Manager's connection, a pooled one or asyncssh. Compare two
+    readings to see how many an operation (e.g. a deploy) needed.
+
+    Returns:
+        The running total
+    """
+    return _round_trips
+
+
+def _parse_job_id(result: CommandResult) -> Optional[str]:
+    """Extract the job ID from the result of an sbatch invocation."""
+    if result.success:
+        # sbatch reports "Submitted batch job <job_id>"; searching (rather than
+        # taking the last word) tolerates banners or warnings around it
+        match = _SBATCH_JOBID_RE.search(result.stdout)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _inline_submit_command(script_content: str, script_path: str) -> str:
+    """
+    Build the command that writes an sbatch script from a heredoc and submits it.
+
+    Args:
+        script_content: Content of the sbatch script
+        script_path: Path to store the script at on the remote cluster
+
+    Returns:
+        The remote command
+    """
+    # A random delimiter cannot occur in the script; quoting it keeps
+    # the shell from expanding anything inside the heredoc
+    delimiter = f"SBATCH_SCRIPT_{uuid.uuid4().hex}"
+    if not script_content.endswith("\n"):
+        script_content += "\n"
+    path = _quote_remote_path(script_path)
+    return f"cat > {path} <<'{delimiter}' && sbatch {path}\n{script_content}{delimiter}"
 
 
 class Communicator(ABC):
@@ -74,7 +242,10 @@ class Communicator(ABC):
 
     @abstractmethod
     def execute_command(
-        self, command: str, working_dir: Optional[str] = None
+        self,
+        command: str,
+        working_dir: Optional[str] = None,
+        timeout: Optional[int] = None,
     ) -> CommandResult:
         """
         Execute a command on the remote cluster.
@@ -82,12 +253,31 @@ class Communicator(ABC):
         Args:
             command: The command to execute
             working_dir: Optional working directory for command execution
+            timeout: Optional timeout override (seconds)
 
         Returns:
             CommandResult containing stdout, stderr, and return code
         """
         pass
 
+    def execute_script(
+        self, commands: List[str], working_dir: Optional[str] = None
+    ) -> CommandResult:
+        """
+        Execute a sequence of commands in a single remote invocation.
+
+        Commands are chained with ``&&``, so the sequence stops at the first
+        failure and costs one round trip instead of one per command.
+
+        Args:
+            commands: Commands to execute in order
+            working_dir: Optional working directory for command execution
+
+        Returns:
+            CommandResult of the chained invocation
+        """
+        return self.execute_command(" && ".join(commands), working_dir=working_dir)
+
     @abstractmethod
     def upload_file(self, local_path: Path, remote_path: str) -> bool:
         """
@@ -102,6 +292,28 @@ class Communicator(ABC):
         """
         pass
 
+    def upload_bytes(self, data: bytes, remote_path: str) -> bool:
+        """
+        Upload in-memory content as a file on the remote cluster.
+
+        The default implementation goes through a temporary local file;
+        communicators that can stream from memory override it.
+
+        Args:
+            data: File content
+            remote_path: Destination path on the remote cluster
+
+        Returns:
+            True if upload was successful, False otherwise
+        """
+        fd, tmp_name = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            return self.upload_file(Path(tmp_name), remote_path)
+        finally:
+            os.unlink(tmp_name)
+
     @abstractmethod
     def download_file(self, remote_path: str, local_path: Path) -> bool:
         """
@@ -116,6 +328,30 @@ class Communicator(ABC):
         """
         pass
 
+    def upload_files(self, files: Iterable[Tuple[Path, str]]) -> List[bool]:
+        """
+        Upload several files to the remote cluster.
+
+        Args:
+            files: (local_path, remote_path) pairs
+
+        Returns:
+            One success flag per pair, in input order
+        """
+        return [self.upload_file(local, remote) for local, remote in files]
+
+    def download_files(self, files: Iterable[Tuple[str, Path]]) -> List[bool]:
+        """
+        Download several files from the remote cluster.
+
+        Args:
+            files: (remote_path, local_path) pairs
+
+        Returns:
+            One success flag per pair, in input order
+        """
+        return [self.download_file(remote, local) for remote, local in files]
+
     @abstractmethod
     def submit_job(self, script_path: str) -> Optional[str]:
         """
@@ -129,7 +365,127 @@ class Communicator(ABC):
         """
         pass
 
+    def submit_inline(self, script_content: str, script_path: str) -> Optional[str]:
+        """
+        Write an sbatch script on the cluster and submit it in one remote invocation.
+
+        The script travels inside the command as a quoted heredoc, so writing
+        it and running sbatch cost one round trip instead of an SFTP upload
+        followed by a separate submission. The script is kept at script_path.
+        Scripts too large for a command line are uploaded first instead.
+
+        Args:
+            script_content: Content of the sbatch script
+            script_path: Path to store the script at on the remote cluster
+
+        Returns:
+            Job ID if submission was successful, None otherwise
+        """
+        if len(script_content) > _INLINE_SCRIPT_MAX_CHARS:
+            if not self.upload_bytes(script_content.encode(), script_path):
+                return None
+            return self.submit_job(script_path)
+
+        result = self.execute_command(_inline_submit_command(script_content, script_path))
+        return _parse_job_id(result)
+
+    def submit_inline_many(self, scripts: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Write and submit several sbatch scripts (see submit_inline).
+
+        The default submits them one after another; communicators that can
+        run commands concurrently override this.
+
+        Args:
+            scripts: (script_content, script_path) pairs
+
+        Returns:
+            One job ID (or None on failure) per script, in input order
+        """
+        return [self.submit_inline(content, path) for content, path in scripts]
+
+    def wait_for_file(
+        self, remote_path: str, timeout: int, poll_interval: float = 1.0
+    ) -> Optional[str]:
+        """
+        Wait on the cluster for a file to become non-empty and return its content.
+
+        The polling loop runs remotely inside a single command, so the wait
+        costs one round trip instead of one per poll, and the file is seen
+        within poll_interval of being written.
+
+        Args:
+            remote_path: Path of the file on the remote cluster
+            timeout: Maximum time to wait (seconds)
+            poll_interval: Seconds between checks on the cluster
+
+        Returns:
+            File content (stripped), or None if it did not appear in time
+        """
+        path = _quote_remote_path(remote_path)
+        result = self.execute_command(
+            f"end=$((SECONDS + {int(timeout)})); "
+            f"until [ -s {path} ]; do "
+            f"[ $SECONDS -ge $end ] && exit 1; sleep {poll_interval}; "
+            f"done; cat {path}",
+            # Leave the remote loop time to give up on its own
+            timeout=int(timeout) + 30,
+        )
+        if result.success and result.stdout:
+            return result.stdout
+        return None
+
+    def wait_for_job_state(
+        self, job_id: str, timeout: int, poll_interval: float = 2.0
+    ) -> Optional[str]:
+        """
+        Wait on the cluster until a job is running or has ended.
+
+        Like wait_for_file, the squeue polling loop runs remotely inside a
+        single command. Jobs that already left the queue are looked up in
+        sacct.
+
+        Args:
+            job_id: The Slurm job ID
+            timeout: Maximum time to wait (seconds)
+            poll_interval: Seconds between squeue calls on the cluster
+
+        Returns:
+            "RUNNING", the final state of a job that ended, the last state
+            seen if the timeout expired, or None if the job was never found
+        """
+        job = shlex.quote(str(job_id))
+        result = self.execute_command(
+            f"end=$((SECONDS + {int(timeout)})); "
+            f"while :; do "
+            f"s=$(squeue -h -r -j {job} -o %T 2>/dev/null); "
+            f'[ -z "$s" ] && s=$(sacct -X -n -j {job} -o State --parsable2 2>/dev/null | head -n 1); '
+            # sacct reports e.g. "CANCELLED by 1234"
+            f's=${{s%% *}}; '
+            f'case "$s" in RUNNING|{_JOB_END_STATES}) break;; esac; '
+            f"[ $SECONDS -ge $end ] && break; sleep {poll_interval}; "
+            f'done; echo "$s"',
+            # Leave the remote loop time to give up on its own
+            timeout=int(timeout) + 30,
+        )
+        if result.success and result.stdout:
+            return result.stdout
+        return None
+
     @abstractmethod
+    def get_job_statuses(self, job_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the status of several Slurm jobs in one query.
+
+        Args:
+            job_ids: The Slurm job IDs
+
+        Returns:
+            Dictionary mapping job ID to status string; jobs that could not be
+            found are omitted
+        """
+        pass
+
     def get_job_status(self, job_id: str) -> Optional[str]:
         """
         Get the status of a Slurm job.
@@ -140,7 +496,7 @@ class Communicator(ABC):
         Returns:
             Job status string (e.g., "PENDING", "RUNNING", "COMPLETED") or None if not found
         """
-        pass
+        return self.get_job_statuses([job_id]).get(str(job_id))
 
     @abstractmethod
     def cancel_job(self, job_id: str) -> bool:
@@ -155,6 +511,30 @@ class Communicator(ABC):
         """
         pass
 
+    def cancel_jobs(self, job_ids: List[str]) -> Dict[str, bool]:
+        """
+        Cancel several Slurm jobs in one round trip.
+
+        scancel runs once per job inside a single remote loop, so a failure
+        is still reported per job.
+
+        Args:
+            job_ids: The Slurm job IDs to cancel
+
+        Returns:
+            Dictionary mapping job ID to whether its cancellation succeeded
+        """
+        job_ids = [str(job_id) for job_id in job_ids if job_id]
+        if not job_ids:
+            return {}
+
+        jobs = " ".join(shlex.quote(job_id) for job_id in job_ids)
+        result = self.execute_command(
+            f'for j in {jobs}; do scancel "$j" >/dev/null 2>&1 && echo "$j"; done; true'
+        )
+        cancelled = set(result.stdout.split()) if result.success else set()
+        return {job_id: job_id in cancelled for job_id in job_ids}
+
     def __enter__(self) -> "Communicator":
         """Context manager entry."""
         self.connect()
@@ -174,6 +554,9 @@ class SSHCommunicator(Communicator):
     defined in ~/.ssh/config.
     """
 
+    # ControlMaster socket per target, shared by every instance in the process
+    _cm_sockets: Dict[str, Path] = {}
+
     def __init__(
         self,
         target: str,
@@ -181,6 +564,12 @@ class SSHCommunicator(Communicator):
         port: Optional[int] = None,
         connect_timeout: int = 30,
         command_timeout: int = 300,
+        control_master: Optional[bool] = None,
+        control_persist: int = 600,
+        persistent_shell: bool = False,
+        connect_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
     ):
         """
         Initialize the SSH communicator with Fabric.
@@ -191,13 +580,86 @@ class SSHCommunicator(Communicator):
             port: SSH port (if not in SSH config, defaults to 22)
             connect_timeout: Timeout for establishing connection (seconds)
             command_timeout: Default timeout for command execution (seconds)
+            control_master: Have the OpenSSH command lines from ssh_command()
+                (rsync, other external tools) share one ControlMaster per
+                target, so they skip the handshake after the first one
+                (requires non-interactive authentication). The Paramiko
+                session itself is unaffected: it cannot attach to an OpenSSH
+                master and relies on staying open instead. None uses
+                CONTROL_MASTER_DEFAULT
+            control_persist: Seconds the master stays alive after its last user
+            persistent_shell: Run commands through one long-lived remote bash
+                instead of opening an exec channel per command (each command
+                still runs in its own subshell)
+            connect_retries: Extra connection attempts after a transient failure
+            retry_base_delay: Initial backoff between attempts (seconds), doubled
+                on every retry and randomly jittered
+            retry_max_delay: Upper bound for a single backoff (seconds)
         """
         super().__init__(target)
         self.user = user
         self.port = port
         self.connect_timeout = connect_timeout
         self.command_timeout = command_timeout
+        self.control_master = (
+            CONTROL_MASTER_DEFAULT if control_master is None else control_master
+        )
+        self.control_persist = control_persist
+        self.persistent_shell = persistent_shell
+        self.connect_retries = connect_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        # Attempts used by the last connect(), so callers can spot throttling
+        self.last_connect_attempts = 0
         self._connection: Optional[Connection] = None
+        # Long-lived "bash -s" channel used when persistent_shell is enabled
+        self._shell_channel = None
+        self._shell_lock = threading.Lock()
+        # Whether the session is believed open; lets the hot path skip
+        # Paramiko's lock-taking is_active() check on every command
+        self._is_open = False
+        # One SFTP client per thread (Paramiko's SFTPClient is not thread-safe);
+        # every client opened is also tracked so disconnect() can close them all
+        self._sftp_local = threading.local()
+        self._sftp_clients: List[SFTPClient] = []
+        self._sftp_lock = threading.Lock()
+        # Bumped whenever the clients are closed, invalidating thread caches
+        self._sftp_generation = 0
+        # When the current session was opened (None while closed)
+        self._opened_at: Optional[float] = None
+        # Whether the session was opened by __enter__ (and so is ours to close)
+        self._opened_in_enter = False
+
+    def _control_path(self) -> Path:
+        """Get the ControlMaster socket path shared by all instances for this target."""
+        path = SSHCommunicator._cm_sockets.get(self.target)
+        if path is None:
+            path = Path.home() / ".ssh" / f"cm-benchmark-{self.target}"
+            SSHCommunicator._cm_sockets[self.target] = path
+        return path
+
+    def ssh_command(self) -> str:
+        """
+        Build an OpenSSH command line that reaches the target like this communicator.
+
+        Meant for external tools that take a remote shell (e.g. ``rsync -e``),
+        so they use the same user, port and ControlMaster socket.
+
+        Returns:
+            Shell-quoted ssh command line (without the target)
+        """
+        parts = ["ssh", "-o", f"ConnectTimeout={self.connect_timeout}"]
+        if self.user:
+            parts += ["-l", self.user]
+        if self.port:
+            parts += ["-p", str(self.port)]
+        if self.control_master:
+            parts += [
+                "-o", "ControlMaster=auto",
+                "-o", f"ControlPath={self._control_path()}",
+                "-o", f"ControlPersist={self.control_persist}",
+            ]
+        return shlex.join(parts)
 
     def _create_connection(self) -> Connection:
         """Create a new Fabric connection with the configured parameters."""
@@ -214,31 +676,141 @@ class SSHCommunicator(Communicator):
         """
         Establish an SSH connection to the remote cluster.
 
+        An already open session is reused rather than re-negotiated.
+        Transient failures are retried with jittered exponential backoff, so
+        a login node throttling new sessions (sshd MaxStartups) is not hit
+        with a burst of immediate reconnects. Authentication and name
+        resolution errors are not retried.
+
         Returns:
             True if connection was successful, False otherwise
         """
-        try:
-            self._connection = self._create_connection()
-            self._connection.open()
+        if self._connection is not None and self._connection.is_connected:
+            self._is_open = True
             return True
-        except (SSHException, Exception) as e:
-            print(f"Connection failed: {e}")
+
+        attempts = self.connect_retries + 1
+        for attempt in range(1, attempts + 1):
+            self.last_connect_attempts = attempt
+            try:
+                self._connection = self._create_connection()
+                self._connection.open()
+                self._opened_at = time.time()
+                self._is_open = True
+                if attempt > 1:
+                    print(f"Connected to {self.target} after {attempt} attempts")
+                return True
+            except AuthenticationException as e:
+                error, retryable = f"Authentication failed: {e}", False
+            except SSHException as e:
+                error, retryable = f"SSH error: {e}", True
+            except socket.gaierror as e:
+                error, retryable = f"Could not resolve {self.target}: {e}", False
+            except OSError as e:
+                error, retryable = f"Network error: {e}", True
+            except Exception as e:
+                error, retryable = f"Connection error: {e}", True
+
             self._connection = None
-            return False
+            self._is_open = False
+            if not retryable or attempt == attempts:
+                print(f"Connection failed: {error}")
+                return False
+
+            delay = self.retry_base_delay * 2 ** (attempt - 1)
+            if "administratively prohibited" in error:
+                # Typically sshd dropping sessions under MaxStartups: back off harder
+                delay *= 4
+            delay = min(self.retry_max_delay, delay) + random.random() * self.retry_base_delay
+            print(f"Connection attempt {attempt}/{attempts} failed: {error}; retrying in {delay:.1f}s")
+            time.sleep(delay)
+        return False
 
     def disconnect(self) -> None:
         """Close the SSH connection."""
+        self._close_shell()
+        self._close_sftp()
         if self._connection:
             self._connection.close()
             self._connection = None
+        self._opened_at = None
+        self._is_open = False
 
-    @property
-    def connection(self) -> Connection:
-        """Get the active connection, creating one if necessary."""
-        if self._connection is None or not self._connection.is_connected:
+    def _ensure_connection(self) -> Connection:
+        """
+        Return the live connection, opening it only when needed.
+
+        The session is opened lazily on first use and then kept for the
+        lifetime of the communicator, so successive commands and transfers
+        share one SSH transport instead of each paying a full handshake.
+        A dropped session is reopened on the same Connection object.
+
+        The live transport is only re-checked when the _is_open flag has
+        been cleared (by disconnect() or a failed command), so the common
+        path is a single attribute read.
+        """
+        if self._is_open:
+            return self._connection
+        if self._connection is None:
             self._connection = self._create_connection()
+        if not self._connection.is_connected:
+            # Channels from a previous transport are unusable now
+            self._close_shell()
+            self._close_sftp()
+            self._connection.open()
+            self._opened_at = time.time()
+        self._is_open = True
         return self._connection
 
+    def _get_sftp(self) -> SFTPClient:
+        """
+        Return the calling thread's SFTP client for the current session.
+
+        Reusing one SFTP subsystem (and calling Paramiko directly instead of
+        Fabric's Transfer, which adds a stat and a chmod per file) keeps each
+        transfer to the data round trips only. Each thread gets its own
+        client, i.e. its own SSH channel, so parallel transfers do not share
+        a channel window.
+        """
+        connection = self._ensure_connection()
+        local = self._sftp_local
+        if getattr(local, "generation", None) != self._sftp_generation:
+            sftp = connection.client.open_sftp()
+            with self._sftp_lock:
+                self._sftp_clients.append(sftp)
+            local.client = sftp
+            local.generation = self._sftp_generation
+        return local.client
+
+    def _close_sftp(self) -> None:
+        """Close every cached SFTP client, if any."""
+        with self._sftp_lock:
+            clients, self._sftp_clients = self._sftp_clients, []
+            self._sftp_generation += 1
+        for sftp in clients:
+            try:
+                sftp.close()
+            except Exception:
+                pass
+
+    @property
+    def connection(self) -> Connection:
+        """Get the active connection, opening it if necessary."""
+        return self._ensure_connection()
+
+    def __enter__(self) -> "SSHCommunicator":
+        """Context manager entry; reuses a session opened by an earlier connect()."""
+        self._opened_in_enter = not self._is_open
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit; only closes the session if __enter__ opened it."""
+        if self._opened_in_enter:
+            self.disconnect()
+        self._opened_in_enter = False
+
+    @_counts_round_trip
     def execute_command(
         self,
         command: str,
@@ -256,32 +828,169 @@ class SSHCommunicator(Communicator):
         Returns:
             CommandResult containing stdout, stderr, and return code
         """
-        if working_dir:
-            command = f"cd {working_dir} && {command}"
-
         timeout = timeout or self.command_timeout
 
+        if self.persistent_shell:
+            return self._execute_in_shell(command, working_dir, timeout)
+
+        if working_dir:
+            # Built into the command rather than via Fabric's cd(), which only
+            # escapes spaces and keeps the directory as state on the shared
+            # Connection (concurrent calls would interleave it)
+            command = f"cd {_quote_remote_path(working_dir)} && {command}"
+
         try:
-            result = self.connection.run(
+            connection = self._ensure_connection()
+            result = connection.run(
                 command,
                 hide=True,  # Don't print output to console
                 warn=True,  # Don't raise exception on non-zero exit
                 timeout=timeout,
             )
-            return CommandResult(
-                stdout=result.stdout.strip() if result.stdout else "",
-                stderr=result.stderr.strip() if result.stderr else "",
-                return_code=result.return_code,
-            )
+            return _to_command_result(result)
         except UnexpectedExit as e:
-            return CommandResult(
-                stdout=e.result.stdout.strip() if e.result.stdout else "",
-                stderr=e.result.stderr.strip() if e.result.stderr else "",
-                return_code=e.result.return_code,
-            )
+            return _to_command_result(e.result)
         except Exception as e:
+            # The session may have dropped; re-check it on the next call
+            self._is_open = False
             return CommandResult(stdout="", stderr=str(e), return_code=-1)
 
+    def _execute_in_shell(
+        self, command: str, working_dir: Optional[str], timeout: int
+    ) -> CommandResult:
+        """
+        Execute a command through the persistent remote shell.
+
+        The command runs in a subshell (so cd/export do not leak into later
+        commands) with stdin detached, followed by per-call sentinel lines on
+        stdout (carrying the exit code) and on stderr. Output is read until
+        both sentinels arrive, so no channel is opened per command.
+
+        Args:
+            command: The command to execute
+            working_dir: Optional working directory for command execution
+            timeout: Timeout in seconds
+
+        Returns:
+            CommandResult containing stdout, stderr, and return code
+        """
+        token = uuid.uuid4().hex
+        if working_dir:
+            command = f"cd {_quote_remote_path(working_dir)} && {command}"
+        # Newlines around the command keep heredocs and trailing comments intact
+        script = (
+            f"(\n{command}\n) </dev/null; __rc=$?; "
+            f"printf '\\n<<END {token} %d>>\\n' \"$__rc\"; "
+            f"printf '\\n<<END {token}>>\\n' >&2\n"
+        )
+        end_out = f"\n<<END {token} ".encode()
+        end_err = f"\n<<END {token}>>\n".encode()
+
+        with self._shell_lock:
+            try:
+                channel = self._get_shell_channel()
+                channel.sendall(script.encode())
+
+                out = bytearray()
+                err = bytearray()
+                out_done = err_done = False
+                deadline = time.monotonic() + timeout
+                while not (out_done and err_done):
+                    progressed = False
+                    if channel.recv_ready():
+                        out += channel.recv(65536)
+                        progressed = True
+                    if channel.recv_stderr_ready():
+                        err += channel.recv_stderr(65536)
+                        progressed = True
+                    out_done = out_done or (out.endswith(b">>\n") and end_out in out)
+                    err_done = err_done or err.endswith(end_err)
+                    if progressed:
+                        continue
+                    if channel.exit_status_ready():
+                        # The shell itself went away (e.g. the command ran exec)
+                        code = channel.recv_exit_status()
+                        self._close_shell()
+                        return CommandResult(
+                            stdout=out.decode(errors="replace").strip(),
+                            stderr=err.decode(errors="replace").strip(),
+                            return_code=code if code is not None else -1,
+                        )
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        # Unknown shell state; start a fresh one next time
+                        self._close_shell()
+                        return CommandResult(
+                            stdout="",
+                            stderr=f"Command did not complete within {timeout} seconds",
+                            return_code=-1,
+                        )
+                    # Sleep until the channel has data (or closes) instead of
+                    # polling, so long commands cost no CPU while they run
+                    select.select([channel], [], [], min(remaining, 1.0))
+            except Exception as e:
+                self._close_shell()
+                self._is_open = False
+                return CommandResult(stdout="", stderr=str(e), return_code=-1)
+
+        stdout, _, tail = bytes(out).rpartition(end_out)
+        stderr = bytes(err[: -len(end_err)])
+        return CommandResult(
+            stdout=stdout.decode(errors="replace").strip(),
+            stderr=stderr.decode(errors="replace").strip(),
+            return_code=int(tail[: tail.index(b">>")]),
+        )
+
+    @_counts_round_trip
+    def _execute_bytes(self, command: str, timeout: Optional[int] = None) -> Tuple[int, bytes]:
+        """
+        Execute a command and return its raw, undecoded stdout.
+
+        Bypasses Fabric's runner (and its eager decoding and I/O threads) for
+        callers that parse only a few fields out of the output. Stderr is not
+        collected, so commands should redirect it if it can be large.
+
+        Args:
+            command: The command to execute
+            timeout: Optional timeout override (uses default if not specified)
+
+        Returns:
+            Tuple of (return code, stdout bytes); (-1, b"") on failure
+        """
+        try:
+            transport = self._ensure_connection().client.get_transport()
+            channel = transport.open_session()
+            try:
+                channel.settimeout(timeout or self.command_timeout)
+                channel.exec_command(command)
+                with channel.makefile("rb") as stream:
+                    stdout = stream.read()
+                return channel.recv_exit_status(), stdout
+            finally:
+                channel.close()
+        except Exception:
+            self._is_open = False
+            return -1, b""
+
+    def _get_shell_channel(self):
+        """Return the persistent shell channel, starting ``bash -s`` once."""
+        if self._shell_channel is None or self._shell_channel.closed:
+            transport = self._ensure_connection().client.get_transport()
+            channel = transport.open_session()
+            channel.exec_command("bash -s")
+            self._shell_channel = channel
+        return self._shell_channel
+
+    def _close_shell(self) -> None:
+        """Close the persistent shell channel, if any."""
+        if self._shell_channel is not None:
+            try:
+                self._shell_channel.close()
+            except Exception:
+                pass
+            self._shell_channel = None
+
+    @_counts_round_trip
     def upload_file(self, local_path: Path, remote_path: str) -> bool:
         """
         Upload a file to the remote cluster using SFTP.
@@ -297,12 +1006,32 @@ class SSHCommunicator(Communicator):
             return False
 
         try:
-            self.connection.put(str(local_path), remote=remote_path)
+            self._get_sftp().put(str(local_path), remote_path)
             return True
         except Exception as e:
             print(f"Upload failed: {e}")
             return False
 
+    @_counts_round_trip
+    def upload_bytes(self, data: bytes, remote_path: str) -> bool:
+        """
+        Upload in-memory content as a file using SFTP, without a local file.
+
+        Args:
+            data: File content
+            remote_path: Destination path on the remote cluster
+
+        Returns:
+            True if upload was successful, False otherwise
+        """
+        try:
+            self._get_sftp().putfo(io.BytesIO(data), remote_path)
+            return True
+        except Exception as e:
+            print(f"Upload failed: {e}")
+            return False
+
+    @_counts_round_trip
     def download_file(self, remote_path: str, local_path: Path) -> bool:
         """
         Download a file from the remote cluster using SFTP.
@@ -318,12 +1047,106 @@ class SSHCommunicator(Communicator):
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            self.connection.get(remote_path, local=str(local_path))
+            self._get_sftp().get(remote_path, str(local_path))
             return True
         except Exception as e:
             print(f"Download failed: {e}")
             return False
 
+    def upload_files(
+        self, files: Iterable[Tuple[Path, str]], max_workers: int = 8
+    ) -> List[bool]:
+        """
+        Upload several files concurrently, one SFTP channel per worker.
+
+        Args:
+            files: (local_path, remote_path) pairs
+            max_workers: Maximum number of parallel transfers
+
+        Returns:
+            One success flag per pair, in input order
+        """
+        # Open the session up front so workers do not race to connect
+        self._ensure_connection()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda pair: self.upload_file(*pair), files))
+
+    def download_files(
+        self, files: Iterable[Tuple[str, Path]], max_workers: int = 8
+    ) -> List[bool]:
+        """
+        Download several files concurrently, one SFTP channel per worker.
+
+        Wall time approaches that of the slowest file rather than the sum
+        of all of them, which matters when collecting many result files.
+
+        Args:
+            files: (remote_path, local_path) pairs
+            max_workers: Maximum number of parallel transfers
+
+        Returns:
+            One success flag per pair, in input order
+        """
+        self._ensure_connection()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda pair: self.download_file(*pair), files))
+
+    @_counts_round_trip
+    def download_directory_tar(
+        self,
+        remote_dir: str,
+        local_dir: Path,
+        members: Optional[List[str]] = None,
+        compress: bool = False,
+    ) -> bool:
+        """
+        Download a remote directory as a single tar stream.
+
+        Runs ``tar -cf -`` over an exec channel and extracts the stream as it
+        arrives, so a directory of many small files costs one bulk transfer
+        instead of an SFTP open/read/close per file.
+
+        Args:
+            remote_dir: Directory on the remote cluster
+            local_dir: Local directory to extract into (created if missing)
+            members: Only these entries of remote_dir (default: all of it)
+            compress: gzip the stream, worthwhile for text such as logs
+
+        Returns:
+            True if the whole directory was received, False otherwise
+        """
+        local_dir.mkdir(parents=True, exist_ok=True)
+
+        paths = " ".join(shlex.quote(m) for m in members) if members else "."
+        flags, mode = ("-czf", "r|gz") if compress else ("-cf", "r|")
+
+        try:
+            transport = self._ensure_connection().client.get_transport()
+            channel = transport.open_session()
+            try:
+                channel.exec_command(
+                    f"tar {flags} - -C {shlex.quote(remote_dir)} -- {paths}"
+                )
+                with channel.makefile("rb") as stream:
+                    with tarfile.open(fileobj=stream, mode=mode) as archive:
+                        # The "data" filter (path traversal guard) landed in
+                        # 3.10.12; older interpreters get equivalent checks
+                        if hasattr(tarfile, "data_filter"):
+                            archive.extractall(local_dir, filter="data")
+                        else:
+                            _extract_checked(archive, local_dir)
+                exit_status = channel.recv_exit_status()
+            finally:
+                channel.close()
+            if exit_status != 0:
+                print(f"Directory download failed: tar exited with {exit_status}")
+                return False
+            return True
+        except Exception as e:
+            print(f"Directory download failed: {e}")
+            return False
+
+    @_counts_round_trip
     # def upload_directory(self, local_path: Path, remote_path: str) -> bool:
     #     """
     #     Upload a directory recursively to the remote cluster.
@@ -367,41 +1190,53 @@ class SSHCommunicator(Communicator):
             Job ID if submission was successful, None otherwise
         """
         result = self.execute_command(f"sbatch {script_path}")
+        return _parse_job_id(result)
 
-        # TODO: Are we sure that sbatch output format is consistent across all Slurm versions?
-        if result.success:
-            # Parse job ID from sbatch output (typically "Submitted batch job <job_id>")
-            parts = result.stdout.split()
-            if len(parts) >= 4 and parts[-1].isdigit():
-                return parts[-1]
-
-        return None
-
-    def get_job_status(self, job_id: str) -> Optional[str]:
+    def get_job_statuses(self, job_ids: List[str]) -> Dict[str, str]:
         """
-        Get the status of a Slurm job using squeue.
+        Get the status of several Slurm jobs with one squeue (and at most one sacct) call.
 
         Args:
-            job_id: The Slurm job ID
+            job_ids: The Slurm job IDs
 
         Returns:
-            Job status string (e.g., "PENDING", "RUNNING", "COMPLETED") or None if not found
+            Dictionary mapping job ID to status string (e.g., "PENDING", "RUNNING",
+            "COMPLETED"); jobs that could not be found are omitted
         """
-        result = self.execute_command(f"squeue -j {job_id} -h -o %T")
-
-        if result.success and result.stdout:
-            return result.stdout.strip()
-
-        # Job might have completed - check sacct
-        result = self.execute_command(f"sacct -j {job_id} -n -o State --parsable2")
-
-        if result.success and result.stdout:
-            # Return the first status (main job, not steps)
-            statuses = result.stdout.strip().split("\n")
-            if statuses:
-                return statuses[0].strip()
-
-        return None
+        job_ids = [str(job_id) for job_id in job_ids if job_id]
+        if not job_ids:
+            return {}
+
+        statuses: Dict[str, str] = {}
+
+        # squeue exits non-zero when a lone job ID has already left the queue,
+        # so parse whatever it printed rather than trusting the return code.
+        # -r prints pending array tasks one per line ("123_4") instead of
+        # folding them into "123_[1-8]"
+        _, stdout = self._execute_bytes(
+            f'squeue -r -j {",".join(job_ids)} -h -o "%i %T" 2>/dev/null'
+        )
+        for job_id, state in _SQUEUE_LINE_RE.findall(stdout):
+            statuses[job_id.decode("ascii", "replace")] = state.decode("ascii", "replace")
+
+        # Jobs that already left the queue - check sacct for all of them at once
+        missing = [job_id for job_id in job_ids if job_id not in statuses]
+        if missing:
+            # -X limits sacct to the allocation lines, dropping per-step rows
+            return_code, stdout = self._execute_bytes(
+                f"sacct -X -j {','.join(missing)} -n -o JobID,State --parsable2 2>/dev/null"
+            )
+            if return_code == 0:
+                for job_id, state in _SACCT_LINE_RE.findall(stdout):
+                    job_id = job_id.decode("ascii", "replace")
+                    # Keep the main job line, skip steps such as "123.batch"
+                    if job_id in missing and job_id not in statuses:
+                        # sacct reports e.g. "CANCELLED by 1234"; keep the state
+                        state = state.decode("ascii", "replace").split()
+                        if state:
+                            statuses[job_id] = state[0]
+
+        return statuses
 
     def cancel_job(self, job_id: str) -> bool:
         """
@@ -460,13 +1295,465 @@ class SSHCommunicator(Communicator):
     #     return None
 
 
+class AsyncSSHCommunicator(Communicator):
+    """
+    SSH communicator built on asyncssh.
+
+    One asyncssh connection multiplexes any number of channels, so commands
+    issued together (execute_many, upload_files, download_files) run
+    concurrently and cost about one round trip instead of one each. The
+    event loop lives on a private background thread: the synchronous
+    Communicator interface keeps working unchanged for the Manager, while
+    the ``*_async`` coroutines are available to async callers.
+
+    Requires the optional ``asyncssh`` package.
+    """
+
+    def __init__(
+        self,
+        target: str,
+        user: Optional[str] = None,
+        port: Optional[int] = None,
+        connect_timeout: int = 30,
+        command_timeout: int = 300,
+    ):
+        """
+        Initialize the asyncssh communicator.
+
+        Args:
+            target: SSH alias or hostname (resolved through ~/.ssh/config)
+            user: Optional username for SSH connection (if not in SSH config)
+            port: SSH port (if not in SSH config, defaults to 22)
+            connect_timeout: Timeout for establishing connection (seconds)
+            command_timeout: Default timeout for command execution (seconds)
+        """
+        if not HAS_ASYNCSSH:
+            raise ImportError(
+                "asyncssh is required for AsyncSSHCommunicator. Install with: pip install asyncssh"
+            )
+        super().__init__(target)
+        self.user = user
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.command_timeout = command_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._conn = None
+        self._sftp = None
+        # Created on the event loop by _init_loop_primitives
+        self._conn_lock: Optional[asyncio.Lock] = None
+        self._channel_slots: Optional[asyncio.Semaphore] = None
+
+    # -- event loop plumbing -------------------------------------------------
+
+    def _run(self, coro):
+        """Run a coroutine on the background event loop and wait for its result."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name=f"asyncssh-{self.target}", daemon=True
+            )
+            self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _init_loop_primitives(self) -> None:
+        """Create the connection lock and channel semaphore on the running loop."""
+        if self._conn_lock is None:
+            self._conn_lock = asyncio.Lock()
+            self._channel_slots = asyncio.Semaphore(_MAX_CONCURRENT_CHANNELS)
+
+    async def _ensure_connection_async(self):
+        """Return the live asyncssh connection, opening it only when needed."""
+        self._init_loop_primitives()
+        # Coroutines started together by gather() must share one connection
+        # instead of each opening (and leaking) their own
+        async with self._conn_lock:
+            if self._conn is None or self._conn.is_closed():
+                self._sftp = None
+                options = {"connect_timeout": self.connect_timeout}
+                if self.user:
+                    options["username"] = self.user
+                if self.port:
+                    options["port"] = self.port
+                self._conn = await asyncssh.connect(self.target, **options)
+            return self._conn
+
+    async def _get_sftp_async(self):
+        """Return the SFTP client for the current connection, opening it once."""
+        conn = await self._ensure_connection_async()
+        async with self._conn_lock:
+            if self._sftp is None:
+                self._sftp = await conn.start_sftp_client()
+            return self._sftp
+
+    async def _gather_bounded(self, coros) -> list:
+        """
+        Run coroutines concurrently, at most _MAX_CONCURRENT_CHANNELS at a time.
+
+        Each command opens a channel on the one connection, and sshd refuses
+        channels beyond its MaxSessions limit.
+
+        Args:
+            coros: Coroutines to run
+
+        Returns:
+            Their results, in input order
+        """
+        self._init_loop_primitives()
+
+        async def bounded(coro):
+            async with self._channel_slots:
+                return await coro
+
+        return list(await asyncio.gather(*(bounded(coro) for coro in coros)))
+
+    async def _close_async(self) -> None:
+        """Close the SFTP client and the connection."""
+        # The lock and semaphore belong to this loop, which is about to stop
+        self._conn_lock = None
+        self._channel_slots = None
+        if self._sftp is not None:
+            self._sftp.exit()
+            self._sftp = None
+        if self._conn is not None:
+            self._conn.close()
+            await self._conn.wait_closed()
+            self._conn = None
+
+    # -- coroutine API -------------------------------------------------------
+
+    @_counts_round_trip
+    async def execute_command_async(
+        self,
+        command: str,
+        working_dir: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> CommandResult:
+        """
+        Execute a command on the remote cluster.
+
+        Args:
+            command: The command to execute
+            working_dir: Optional working directory for command execution
+            timeout: Optional timeout override (uses default if not specified)
+
+        Returns:
+            CommandResult containing stdout, stderr, and return code
+        """
+        if working_dir:
+            command = f"cd {_quote_remote_path(working_dir)} && {command}"
+
+        try:
+            conn = await self._ensure_connection_async()
+            result = await conn.run(
+                command, check=False, timeout=timeout or self.command_timeout
+            )
+            stdout = result.stdout
+            stderr = result.stderr
+            return CommandResult(
+                stdout=stdout.strip() if stdout else "",
+                stderr=stderr.strip() if stderr else "",
+                return_code=result.exit_status if result.exit_status is not None else -1,
+            )
+        except Exception as e:
+            return CommandResult(stdout="", stderr=str(e) or type(e).__name__, return_code=-1)
+
+    @_counts_round_trip
+    async def _execute_bytes_async(
+        self, command: str, timeout: Optional[int] = None
+    ) -> Tuple[int, bytes]:
+        """Execute a command and return (return code, raw stdout bytes)."""
+        try:
+            conn = await self._ensure_connection_async()
+            result = await conn.run(
+                command, check=False, encoding=None, timeout=timeout or self.command_timeout
+            )
+            return (
+                result.exit_status if result.exit_status is not None else -1,
+                result.stdout or b"",
+            )
+        except Exception:
+            return -1, b""
+
+    def _execute_bytes(self, command: str, timeout: Optional[int] = None) -> Tuple[int, bytes]:
+        """Execute a command and return (return code, raw stdout bytes)."""
+        return self._run(self._execute_bytes_async(command, timeout))
+
+    async def execute_many_async(self, commands: List[str]) -> List[CommandResult]:
+        """
+        Execute several independent commands concurrently, one channel each.
+
+        Args:
+            commands: Commands to execute
+
+        Returns:
+            One CommandResult per command, in input order
+        """
+        return await self._gather_bounded(self.execute_command_async(c) for c in commands)
+
+    @_counts_round_trip
+    async def upload_file_async(self, local_path: Path, remote_path: str) -> bool:
+        """Upload a file using SFTP; see upload_file."""
+        if not local_path.exists():
+            return False
+
+        try:
+            sftp = await self._get_sftp_async()
+            await sftp.put(str(local_path), remote_path)
+            return True
+        except Exception as e:
+            print(f"Upload failed: {e}")
+            return False
+
+    @_counts_round_trip
+    async def upload_bytes_async(self, data: bytes, remote_path: str) -> bool:
+        """Upload in-memory content using SFTP; see upload_bytes."""
+        try:
+            sftp = await self._get_sftp_async()
+            async with sftp.open(remote_path, "wb") as f:
+                await f.write(data)
+            return True
+        except Exception as e:
+            print(f"Upload failed: {e}")
+            return False
+
+    async def submit_inline_async(self, script_content: str, script_path: str) -> Optional[str]:
+        """
+        Write an sbatch script on the cluster and submit it (see submit_inline).
+
+        Args:
+            script_content: Content of the sbatch script
+            script_path: Path to store the script at on the remote cluster
+
+        Returns:
+            Job ID if submission was successful, None otherwise
+        """
+        if len(script_content) > _INLINE_SCRIPT_MAX_CHARS:
+            if not await self.upload_bytes_async(script_content.encode(), script_path):
+                return None
+            command = f"sbatch {_quote_remote_path(script_path)}"
+        else:
+            command = _inline_submit_command(script_content, script_path)
+        return _parse_job_id(await self.execute_command_async(command))
+
+    @_counts_round_trip
+    async def download_file_async(self, remote_path: str, local_path: Path) -> bool:
+        """Download a file using SFTP; see download_file."""
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            sftp = await self._get_sftp_async()
+            # Large reads with many in flight keep the link busy instead of
+            # waiting for each block's acknowledgement
+            await sftp.get(
+                remote_path,
+                str(local_path),
+                block_size=_SFTP_BLOCK_SIZE,
+                max_requests=_SFTP_MAX_REQUESTS,
+            )
+            return True
+        except Exception as e:
+            print(f"Download failed: {e}")
+            return False
+
+    # -- Communicator interface ----------------------------------------------
+
+    def connect(self) -> bool:
+        """
+        Establish the asyncssh connection to the remote cluster.
+
+        Returns:
+            True if connection was successful, False otherwise
+        """
+        try:
+            self._run(self._ensure_connection_async())
+            return True
+        except Exception as e:
+            print(f"Connection failed: {e}")
+            return False
+
+    def disconnect(self) -> None:
+        """Close the connection and stop the background event loop."""
+        if self._loop is None:
+            return
+        try:
+            self._run(self._close_async())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+
+    def execute_command(
+        self,
+        command: str,
+        working_dir: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> CommandResult:
+        """
+        Execute a command on the remote cluster.
+
+        Args:
+            command: The command to execute
+            working_dir: Optional working directory for command execution
+            timeout: Optional timeout override (uses default if not specified)
+
+        Returns:
+            CommandResult containing stdout, stderr, and return code
+        """
+        return self._run(self.execute_command_async(command, working_dir, timeout))
+
+    def execute_many(self, commands: List[str]) -> List[CommandResult]:
+        """
+        Execute several independent commands concurrently.
+
+        Args:
+            commands: Commands to execute
+
+        Returns:
+            One CommandResult per command, in input order
+        """
+        return self._run(self.execute_many_async(commands))
+
+    def upload_file(self, local_path: Path, remote_path: str) -> bool:
+        """
+        Upload a file to the remote cluster using SFTP.
+
+        Args:
+            local_path: Path to the local file
+            remote_path: Destination path on the remote cluster
+
+        Returns:
+            True if upload was successful, False otherwise
+        """
+        return self._run(self.upload_file_async(local_path, remote_path))
+
+    def upload_bytes(self, data: bytes, remote_path: str) -> bool:
+        """
+        Upload in-memory content as a file using SFTP, without a local file.
+
+        Args:
+            data: File content
+            remote_path: Destination path on the remote cluster
+
+        Returns:
+            True if upload was successful, False otherwise
+        """
+        return self._run(self.upload_bytes_async(data, remote_path))
+
+    def download_file(self, remote_path: str, local_path: Path) -> bool:
+        """
+        Download a file from the remote cluster using SFTP.
+
+        Args:
+            remote_path: Path to the file on the remote cluster
+            local_path: Destination path on the local machine
+
+        Returns:
+            True if download was successful, False otherwise
+        """
+        return self._run(self.download_file_async(remote_path, local_path))
+
+    def upload_files(self, files: Iterable[Tuple[Path, str]]) -> List[bool]:
+        """
+        Upload several files concurrently over the shared SFTP session.
+
+        Args:
+            files: (local_path, remote_path) pairs
+
+        Returns:
+            One success flag per pair, in input order
+        """
+
+        async def upload_all():
+            return list(
+                await asyncio.gather(
+                    *(self.upload_file_async(local, remote) for local, remote in files)
+                )
+            )
+
+        return self._run(upload_all())
+
+    def submit_inline_many(self, scripts: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Write and submit several sbatch scripts concurrently, one channel each.
+
+        At most _MAX_CONCURRENT_CHANNELS submissions are in flight at once, so
+        large batches queue instead of having channels refused by sshd.
+
+        Args:
+            scripts: (script_content, script_path) pairs
+
+        Returns:
+            One job ID (or None on failure) per script, in input order
+        """
+        return self._run(
+            self._gather_bounded(
+                self.submit_inline_async(content, path) for content, path in scripts
+            )
+        )
+
+    def download_files(self, files: Iterable[Tuple[str, Path]]) -> List[bool]:
+        """
+        Download several files concurrently over the shared SFTP session.
+
+        Args:
+            files: (remote_path, local_path) pairs
+
+        Returns:
+            One success flag per pair, in input order
+        """
+
+        async def download_all():
+            return list(
+                await asyncio.gather(
+                    *(self.download_file_async(remote, local) for remote, local in files)
+                )
+            )
+
+        return self._run(download_all())
+
+    # Slurm operations only go through execute_command and
+    # _execute_bytes, so the SSH implementations (and their parsing) apply unchanged
+    submit_job = SSHCommunicator.submit_job
+    get_job_statuses = SSHCommunicator.get_job_statuses
+    cancel_job = SSHCommunicator.cancel_job
+
+
+def _extract_checked(archive: tarfile.TarFile, local_dir: Path) -> None:
+    """
+    Extract a streamed tar archive, refusing members that could escape local_dir.
+
+    Stand-in for ``extractall(filter="data")`` on interpreters without tar
+    extraction filters: only regular files and directories with relative
+    paths are accepted, and permission bits are reduced to rwxr-xr-x.
+
+    Args:
+        archive: Archive opened in stream mode (``r|``)
+        local_dir: Directory to extract into
+
+    Raises:
+        tarfile.TarError: On an absolute path, a ".." component, a link or a
+            special file
+    """
+    for member in archive:
+        parts = member.name.split("/")
+        if member.name.startswith("/") or ".." in parts:
+            raise tarfile.TarError(f"Unsafe path in archive: {member.name}")
+        if not (member.isfile() or member.isdir()):
+            raise tarfile.TarError(f"Link or special file in archive: {member.name}")
+        member.mode &= 0o755
+        archive.extract(member, local_dir)
+
+
 def create_communicator(target: str, method: str = "ssh", **kwargs) -> Communicator:
     """
     Factory function to create a communicator instance.
 
     Args:
         target: The target cluster identifier
-        method: Communication method ("ssh" for now, extensible for future methods)
+        method: Communication method ("ssh", or "async-ssh" for the asyncssh backend)
         **kwargs: Additional arguments passed to the communicator constructor
 
     Returns:
@@ -474,9 +1761,12 @@ def create_communicator(target: str, method: str = "ssh", **kwargs) -> Communica
 
     Raises:
         ValueError: If the specified method is not supported
+        ImportError: If method is "async-ssh" and asyncssh is not installed
     """
     if method == "ssh":
         return SSHCommunicator(target, **kwargs)
+    elif method == "async-ssh":
+        return AsyncSSHCommunicator(target, **kwargs)
     else:
         raise ValueError(f"Unsupported communication method: {method}")
 
@@ -18,6 +18,11 @@ from typing import List, Optional, Tuple
 from infra.communicator import SSHCommunicator
 from infra.storage import get_benchmark_summary
 
+# Slurm log file names: "{name}_{jobid}.out", and for job array tasks
+# "{prefix}-{i}_{array_jobid}_{i}.out"
+_ARRAY_LOG_RE = re.compile(r"(.+-(\d+))_(\d+_\2)\.(out|err)$")
+_LOG_RE = re.compile(r"(.+)_(\d+)\.(out|err)")
+
 
 @dataclass
 class LogEntry:
@@ -90,11 +95,11 @@ class LogManager:
                     name = os.path.basename(path)
 
                     # Extract job ID and type from filename
-                    # Format: {name}_{jobid}.out or {name}_{jobid}.err
-                    match = re.match(r"(.+)_(\d+)\.(out|err)", name)
+                    array_match = _ARRAY_LOG_RE.match(name)
+                    match = array_match or _LOG_RE.match(name)
                     if match:
                         job_name = match.group(1)
-                        job_id = match.group(2)
+                        job_id = match.group(3 if array_match else 2)
                         job_type = (
                             "service"
                             if not job_name.startswith("client-")
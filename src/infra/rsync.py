@@ -0,0 +1,81 @@
+"""
+Rsync-based bulk transfers from the cluster.
+
+One rsync process pulls a whole list of files over a single SSH session,
+instead of one SFTP round trip per file. This needs the ``rsync`` binary
+locally and on the cluster; callers fall back to SFTP when it is missing
+(see HAS_RSYNC) or when a transfer fails.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List, Optional
+
+# Whether a local rsync binary is available
+HAS_RSYNC = shutil.which("rsync") is not None
+
+
+def rsync_pull(
+    target: str,
+    remote_dir: str,
+    filenames: List[str],
+    local_dir: Path,
+    ssh_command: str = "ssh",
+    compress: bool = True,
+    compress_level: Optional[int] = 6,
+    timeout: int = 600,
+) -> bool:
+    """
+    Pull files from one remote directory into a local directory with rsync.
+
+    The file names are passed on stdin (``--files-from=-``), so the list can
+    be arbitrarily long and no remote globbing is involved.
+
+    Args:
+        target: SSH alias or hostname of the cluster
+        remote_dir: Absolute directory on the cluster holding the files
+        filenames: Names of the files relative to remote_dir
+        local_dir: Local destination directory (created if missing)
+        ssh_command: Remote shell for rsync's ``-e`` option, e.g. from
+            SSHCommunicator.ssh_command() to share its user, port and
+            ControlMaster socket
+        compress: Compress file data on the wire. Artifacts are mostly text,
+            and the link to the cluster is usually the bottleneck, not CPU.
+            rsync 3.2+ on both ends negotiates zstd/lz4 by itself
+        compress_level: Compression level (None for rsync's default)
+        timeout: Timeout for the whole transfer (seconds)
+
+    Returns:
+        True if every file was transferred, False otherwise
+    """
+    if not HAS_RSYNC:
+        return False
+    if not filenames:
+        return True
+
+    local_dir.mkdir(parents=True, exist_ok=True)
+
+    command = ["rsync", "-a", "--protect-args", "--files-from=-", "-e", ssh_command]
+    if compress:
+        command.append("--compress")
+        if compress_level is not None:
+            command.append(f"--compress-level={compress_level}")
+    command += [f"{target}:{remote_dir.rstrip('/')}/", f"{local_dir}/"]
+
+    try:
+        result = subprocess.run(
+            command,
+            input="\n".join(filenames) + "\n",
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"rsync failed: {e}")
+        return False
+
+    if result.returncode != 0:
+        print(f"rsync exited with {result.returncode}: {result.stderr.strip()}")
+        return False
+    return True
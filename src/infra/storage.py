@@ -10,12 +10,14 @@ The storage is organized by benchmark_id (token) to allow multiple benchmarks
 to run concurrently or access historical benchmark data.
 """
 
+import copy
 import csv
 import json
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 
@@ -45,6 +47,31 @@ class StorageBackend(ABC):
         """
         pass
 
+    def save_many(
+        self,
+        benchmark_id: str,
+        entity_type: str,
+        entities: List[Tuple[str, Dict[str, Any]]],
+    ) -> bool:
+        """
+        Save several entities of one type in a single batch.
+
+        Backends override this to write once instead of once per entity.
+
+        Args:
+            benchmark_id: Unique identifier for the benchmark run
+            entity_type: Type of entity (e.g., "service", "client", "monitor")
+            entities: (entity_id, data) pairs to save
+
+        Returns:
+            True if every save was successful, False otherwise
+        """
+        results = [
+            self.save(benchmark_id, entity_type, entity_id, data)
+            for entity_id, data in entities
+        ]
+        return all(results)
+
     @abstractmethod
     def load(
         self, benchmark_id: str, entity_type: str, entity_id: str
@@ -122,6 +149,54 @@ class CSVStorageBackend(StorageBackend):
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        # Saves and deletes rewrite whole files; serialize them so concurrent
+        # writers (e.g. clients deployed in parallel) do not drop each other's rows
+        self._write_lock = threading.RLock()
+        # Parsed rows per CSV file, keyed by the file's (mtime, size) so any
+        # write - from this process or another one - invalidates them; own
+        # writes also drop them explicitly, in case the mtime is coarse
+        self._rows_cache: Dict[Path, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+        self._cache_lock = threading.Lock()
+
+    def _read_rows(self, csv_path: Path) -> List[Dict[str, Any]]:
+        """
+        Read and deserialize all rows of a CSV file, memoized until it changes.
+
+        Status polling loads the same services and clients over and over;
+        this parses each file only when it was written since the last read.
+
+        Args:
+            csv_path: Path to the CSV file
+
+        Returns:
+            Deserialized rows (with "_id"); shared with the cache, so callers
+            must copy them before handing them out
+        """
+        try:
+            stat = csv_path.stat()
+        except FileNotFoundError:
+            return []
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._cache_lock:
+            cached = self._rows_cache.get(csv_path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        with open(csv_path, "r", newline="") as f:
+            rows = [
+                {k: self._deserialize_value(v) for k, v in row.items()}
+                for row in csv.DictReader(f)
+            ]
+
+        with self._cache_lock:
+            self._rows_cache[csv_path] = (key, rows)
+        return rows
+
+    def _forget_rows(self, csv_path: Path) -> None:
+        """Drop the memoized rows of a CSV file that is about to be rewritten."""
+        with self._cache_lock:
+            self._rows_cache.pop(csv_path, None)
 
     def _get_csv_path(self, benchmark_id: str, entity_type: str) -> Path:
         """Get path to CSV file for a specific benchmark and entity type."""
@@ -159,11 +234,13 @@ class CSVStorageBackend(StorageBackend):
             except (ValueError, AttributeError):
                 pass
 
-        # Try to parse as int
-        try:
-            return int(value)
-        except ValueError:
-            pass
+        # Try to parse as int; int() accepts "700_1", which is a job array
+        # task ID and must stay a string
+        if "_" not in value:
+            try:
+                return int(value)
+            except ValueError:
+                pass
 
         # Return as string
         return value
@@ -183,11 +260,45 @@ class CSVStorageBackend(StorageBackend):
         Returns:
             True if save was successful, False otherwise
         """
+        return self.save_many(benchmark_id, entity_type, [(entity_id, data)])
+
+    def save_many(
+        self,
+        benchmark_id: str,
+        entity_type: str,
+        entities: List[Tuple[str, Dict[str, Any]]],
+    ) -> bool:
+        """
+        Save several entities of one type with a single read and rewrite of the CSV.
+
+        Args:
+            benchmark_id: Unique identifier for the benchmark run
+            entity_type: Type of entity (e.g., "service", "client", "monitor")
+            entities: (entity_id, data) pairs to save
+
+        Returns:
+            True if save was successful, False otherwise
+        """
+        if not entities:
+            return True
+
+        with self._write_lock:
+            return self._save_many(benchmark_id, entity_type, entities)
+
+    def _save_many(
+        self,
+        benchmark_id: str,
+        entity_type: str,
+        entities: List[Tuple[str, Dict[str, Any]]],
+    ) -> bool:
+        """Read-modify-write the CSV for save_many(); caller holds the write lock."""
         try:
             csv_path = self._get_csv_path(benchmark_id, entity_type)
 
-            # Add entity_id to data
-            data_with_id = {"_id": entity_id, **data}
+            # Add entity_id to data (the last pair wins for a repeated ID)
+            new_data = {
+                entity_id: {"_id": entity_id, **data} for entity_id, data in entities
+            }
 
             # Read existing data
             existing_data = []
@@ -195,11 +306,11 @@ class CSVStorageBackend(StorageBackend):
                 with open(csv_path, "r", newline="") as f:
                     reader = csv.DictReader(f)
                     existing_data = [
-                        row for row in reader if row.get("_id") != entity_id
+                        row for row in reader if row.get("_id") not in new_data
                     ]
 
             # Add new/updated data
-            existing_data.append(data_with_id)
+            existing_data.extend(new_data.values())
 
             # Get all fieldnames
             all_fields = set()
@@ -208,6 +319,7 @@ class CSVStorageBackend(StorageBackend):
             fieldnames = ["_id"] + sorted([f for f in all_fields if f != "_id"])
 
             # Write CSV
+            self._forget_rows(csv_path)
             with open(csv_path, "w", newline="") as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
@@ -240,20 +352,12 @@ class CSVStorageBackend(StorageBackend):
         try:
             csv_path = self._get_csv_path(benchmark_id, entity_type)
 
-            if not csv_path.exists():
-                return None
-
-            with open(csv_path, "r", newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get("_id") == entity_id:
-                        # Remove _id and deserialize values
-                        data = {
-                            k: self._deserialize_value(v)
-                            for k, v in row.items()
-                            if k != "_id"
-                        }
-                        return data
+            for row in self._read_rows(csv_path):
+                if row.get("_id") == entity_id:
+                    # Remove _id
+                    return {
+                        k: copy.deepcopy(v) for k, v in row.items() if k != "_id"
+                    }
 
             return None
         except Exception as e:
@@ -274,18 +378,8 @@ class CSVStorageBackend(StorageBackend):
         try:
             csv_path = self._get_csv_path(benchmark_id, entity_type)
 
-            if not csv_path.exists():
-                return []
-
-            result = []
-            with open(csv_path, "r", newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Keep _id in the result for identification
-                    data = {k: self._deserialize_value(v) for k, v in row.items()}
-                    result.append(data)
-
-            return result
+            # Keep _id in the result for identification
+            return copy.deepcopy(self._read_rows(csv_path))
         except Exception as e:
             print(f"Error loading all from CSV: {e}")
             return []
@@ -302,29 +396,31 @@ class CSVStorageBackend(StorageBackend):
         Returns:
             True if deletion was successful, False otherwise
         """
-        try:
-            csv_path = self._get_csv_path(benchmark_id, entity_type)
-
-            if not csv_path.exists():
-                return False
+        with self._write_lock:
+            try:
+                csv_path = self._get_csv_path(benchmark_id, entity_type)
 
-            # Read existing data, excluding the entity to delete
-            remaining_data = []
-            with open(csv_path, "r", newline="") as f:
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames
-                remaining_data = [row for row in reader if row.get("_id") != entity_id]
+                if not csv_path.exists():
+                    return False
 
-            # Rewrite CSV without deleted entity
-            with open(csv_path, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(remaining_data)
-
-            return True
-        except Exception as e:
-            print(f"Error deleting from CSV: {e}")
-            return False
+                # Read existing data, excluding the entity to delete
+                remaining_data = []
+                with open(csv_path, "r", newline="") as f:
+                    reader = csv.DictReader(f)
+                    fieldnames = reader.fieldnames
+                    remaining_data = [row for row in reader if row.get("_id") != entity_id]
+
+                # Rewrite CSV without deleted entity
+                self._forget_rows(csv_path)
+                with open(csv_path, "w", newline="") as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    writer.writeheader()
+                    writer.writerows(remaining_data)
+
+                return True
+            except Exception as e:
+                print(f"Error deleting from CSV: {e}")
+                return False
 
     def list_benchmarks(self) -> List[str]:
         """
@@ -375,6 +471,25 @@ class StorageManager:
         """
         return self.backend.save(benchmark_id, entity_type, entity_id, data)
 
+    def save_entities(
+        self,
+        benchmark_id: str,
+        entity_type: str,
+        entities: List[Tuple[str, Dict[str, Any]]],
+    ) -> bool:
+        """
+        Save several entities of one type in a single batch.
+
+        Args:
+            benchmark_id: Benchmark identifier
+            entity_type: Entity type (e.g., "service", "client", "monitor")
+            entities: (entity_id, data) pairs to save
+
+        Returns:
+            True if successful
+        """
+        return self.backend.save_many(benchmark_id, entity_type, entities)
+
     def load_entity(
         self, benchmark_id: str, entity_type: str, entity_id: str
     ) -> Optional[Dict[str, Any]]:
@@ -11,9 +11,11 @@ Contains:
 from .reporter import generate_benchmark_report
 from .artifacts import (
     write_run_json,
+    update_run_json,
     read_run_json,
     read_summary_json,
     read_requests_jsonl,
+    iter_requests_jsonl,
     ensure_results_dir,
     ensure_reports_dir,
 )
@@ -11,10 +11,31 @@ import json
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import git
 
+# Optional fast JSON parser/serializer for requests.jsonl and run.json;
+# falls back to the json module
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+def _dumps_indented(data: Any, default=None) -> bytes:
+    """Serialize data as 2-space indented JSON, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # Non-string keys, integers beyond 64 bits, ...: leave to json
+            pass
+    return json.dumps(data, indent=2, default=default).encode()
+
 
 def get_git_commit() -> Optional[str]:
     """Get the current git commit hash."""
@@ -84,9 +105,26 @@ def write_run_json(
     }
 
     run_file = results_dir / "run.json"
-    with open(run_file, "w") as f:
-        json.dump(run_data, f, indent=2)
+    run_file.write_bytes(_dumps_indented(run_data))
+
+    return run_file
+
+
+def update_run_json(benchmark_id: str, run_data: Dict[str, Any]) -> Path:
+    """
+    Overwrite the run.json artifact of a benchmark with modified run data.
+
+    Values JSON cannot represent natively are written as strings.
+
+    Args:
+        benchmark_id: Unique benchmark identifier
+        run_data: Complete run data, as returned by read_run_json()
 
+    Returns:
+        Path to the written run.json file
+    """
+    run_file = Path("results") / benchmark_id / "run.json"
+    run_file.write_bytes(_dumps_indented(run_data, default=str))
     return run_file
 
 
@@ -128,51 +166,76 @@ def read_run_json(benchmark_id: str) -> Optional[Dict[str, Any]]:
     if not run_file.exists():
         return None
 
-    with open(run_file) as f:
-        return json.load(f)
+    return _parse_json_line(run_file.read_bytes())
 
 
-def read_requests_jsonl(benchmark_id: str) -> Optional[List[Dict[str, Any]]]:
-    """
-    Read requests.jsonl artifact for a benchmark.
-
-    Args:
-        benchmark_id: Unique benchmark identifier
-
-    Returns:
-        List of per-request dictionaries, or None if not found
-    """
+def _find_requests_files(benchmark_id: str) -> List[Path]:
+    """Return the requests JSONL file(s) of a benchmark, in read order."""
     results_dir = Path("results") / benchmark_id
     if not results_dir.exists():
-        return None
+        return []
 
     requests_file = results_dir / "requests.jsonl"
-    candidate_files: List[Path]
     if requests_file.exists():
-        candidate_files = [requests_file]
-    else:
-        candidate_files = sorted(results_dir.glob("requests_*.jsonl"))
-        if not candidate_files:
-            candidate_files = sorted(results_dir.glob("requests*.jsonl"))
+        return [requests_file]
 
+    candidate_files = sorted(results_dir.glob("requests_*.jsonl"))
     if not candidate_files:
-        return None
+        candidate_files = sorted(results_dir.glob("requests*.jsonl"))
+    return candidate_files
+
+
+def _parse_json_line(line: bytes) -> Any:
+    """Parse one JSON document (e.g. a JSONL line), using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # orjson is strict (no NaN/Infinity, 64-bit integers only);
+            # let the json module decide whether the line is really malformed
+            pass
+    return json.loads(line)
+
+
+def iter_requests_jsonl(benchmark_id: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the per-request records of a benchmark one at a time.
+
+    Unlike read_requests_jsonl, this never holds the whole file in memory,
+    which suits single-pass consumers such as aggregate_requests.
+
+    Args:
+        benchmark_id: Unique benchmark identifier
 
-    requests: List[Dict[str, Any]] = []
-    for file_path in candidate_files:
-        with open(file_path) as f:
+    Yields:
+        Per-request dictionaries (malformed lines are skipped with a warning)
+    """
+    for file_path in _find_requests_files(benchmark_id):
+        with open(file_path, "rb") as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    requests.append(json.loads(line))
-                except json.JSONDecodeError as e:
+                    yield _parse_json_line(line)
+                except ValueError as e:
                     print(
                         f"Warning: Skipping malformed JSON in {file_path.name} on line {line_num}: {e}"
                     )
                     continue
 
+
+def read_requests_jsonl(benchmark_id: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Read requests.jsonl artifact for a benchmark.
+
+    Args:
+        benchmark_id: Unique benchmark identifier
+
+    Returns:
+        List of per-request dictionaries, or None if not found
+    """
+    requests = list(iter_requests_jsonl(benchmark_id))
     return requests if requests else None
 
 
@@ -1601,9 +1601,7 @@ def benchmark_rerun(benchmark_id):
         new_id = run_benchmark_from_recipe(tmp_path)
         
         # Cleanup
-        if tmp_path.exists():
-            import os
-            os.unlink(tmp_path)
+        tmp_path.unlink(missing_ok=True)
             
         if new_id:
             return redirect(f"/benchmark/{new_id}/watch")
@@ -10,7 +10,13 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from core.aggregator import aggregate_requests, aggregate_benchmark, write_summary_json
+from core.aggregator import (
+    aggregate_requests,
+    aggregate_benchmark,
+    aggregate_many,
+    calculate_percentiles,
+    write_summary_json,
+)
 from reporting.artifacts import write_requests_jsonl, read_requests_jsonl
 
 
@@ -114,6 +120,19 @@ def test_aggregate_vllm():
     assert summary["total_requests"] == 10
     assert summary["success_rate"] == 90.0
     assert summary["service_type"] == "vllm"
+    assert "ttft_s" not in summary
+
+
+def test_aggregate_vllm_ttft():
+    """Test that streamed vLLM requests report time-to-first-token."""
+    requests = create_fixture_requests("vllm", 10)
+    for i, r in enumerate(requests):
+        r["ttft_s"] = 0.01 * (i + 1)
+    summary = aggregate_requests(requests)
+
+    # Only the 9 successful requests contribute
+    assert abs(summary["ttft_s"]["avg"] - 0.05) < 1e-9
+    assert summary["ttft_s"]["p50"] <= summary["ttft_s"]["p99"]
 
 
 def test_aggregate_ollama():
@@ -126,6 +145,29 @@ def test_aggregate_ollama():
     assert summary["service_type"] == "ollama"
 
 
+def test_calculate_percentiles_small_matches_numpy():
+    """Test that the plain-Python path for small samples matches np.percentile."""
+    import random
+    import numpy as np
+
+    rng = random.Random(7)
+    for n in (1, 2, 3, 10, 255):
+        values = [rng.random() for _ in range(n)]
+        result = calculate_percentiles(values, [0, 50, 90, 95, 99, 100])
+        expected = np.percentile(values, [0, 50, 90, 95, 99, 100])
+        assert list(result.values()) == [float(q) for q in expected]
+
+
+def test_calculate_percentiles_large_matches_numpy():
+    """Test that the partition path for large samples matches np.percentile."""
+    import numpy as np
+
+    values = np.random.default_rng(7).lognormal(size=50_000)
+    result = calculate_percentiles(values, [0, 50, 90, 95, 99, 99.9, 100])
+    expected = np.percentile(values, [0, 50, 90, 95, 99, 99.9, 100])
+    assert list(result.values()) == [float(q) for q in expected]
+
+
 def test_aggregate_empty():
     """Test aggregation with empty requests."""
     summary = aggregate_requests([])
@@ -176,6 +218,29 @@ def test_aggregate_benchmark_integration():
             os.chdir(old_cwd)
 
 
+def test_aggregate_many():
+    """Test parallel aggregation of several benchmarks, including a missing one."""
+    import os
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for benchmark_id, count in (("many-1", 10), ("many-2", 20)):
+            results_dir = Path(tmpdir) / "results" / benchmark_id
+            results_dir.mkdir(parents=True)
+            with open(results_dir / "requests.jsonl", "w") as f:
+                for req in create_fixture_requests("redis", count):
+                    f.write(json.dumps(req) + "\n")
+
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmpdir)
+            summaries = aggregate_many(["many-1", "many-missing", "many-2"], max_workers=2)
+        finally:
+            os.chdir(old_cwd)
+
+        assert [s and s["total_requests"] for s in summaries] == [10, None, 20]
+        assert (Path(tmpdir) / "results" / "many-2" / "summary.json").exists()
+
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, "-v"])
@@ -0,0 +1,196 @@
+"""
+Unit tests for the collector helpers that do not need a cluster.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import core.collector as collector
+from core.collector import (
+    MANIFEST_FILENAME,
+    _load_manifest,
+    _parse_probe,
+    _simplify_log_name,
+    _update_manifest,
+    download_logs,
+    merge_requests_jsonl,
+)
+
+
+def test_manifest_round_trip():
+    """Test that the manifest starts empty and accumulates updates."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results_dir = Path(tmpdir)
+        assert _load_manifest(results_dir) == {}
+
+        _update_manifest(results_dir, {"/wd/logs/a.out": [10, 100]})
+        _update_manifest(results_dir, {"/wd/logs/b.err": [20, 200]})
+        _update_manifest(results_dir, {"/wd/logs/a.out": [11, 101]})
+        _update_manifest(results_dir, {})
+
+        assert _load_manifest(results_dir) == {
+            "/wd/logs/a.out": [11, 101],
+            "/wd/logs/b.err": [20, 200],
+        }
+
+
+def test_manifest_corrupt_file():
+    """Test that an unreadable manifest counts as nothing collected."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results_dir = Path(tmpdir)
+        (results_dir / MANIFEST_FILENAME).write_text("{not json")
+        assert _load_manifest(results_dir) == {}
+
+
+def test_parse_probe():
+    """Test splitting the probe output into its sections."""
+    stdout = "\0".join([
+        "/home/u",
+        "---METRICS---",
+        "12 100 /home/u/wd/metrics/requests_c-1.jsonl",
+        "---LOGS---",
+        "5 101 /home/u/wd/logs/my file.out",
+        "",
+        "---HOSTS---",
+        "c-1=mel0001",
+        "",
+    ])
+    sections = _parse_probe(stdout)
+    assert sections["home"] == ["/home/u"]
+    assert sections["---METRICS---"] == ["12 100 /home/u/wd/metrics/requests_c-1.jsonl"]
+    assert sections["---LOGS---"] == ["5 101 /home/u/wd/logs/my file.out"]
+    assert sections["---HOSTS---"] == ["c-1=mel0001"]
+
+
+def test_parse_probe_empty_sections():
+    """Test that missing directories leave their sections empty."""
+    sections = _parse_probe("/home/u\0---METRICS---\0---LOGS---\0---HOSTS---\0")
+    assert sections["home"] == ["/home/u"]
+    assert sections["---METRICS---"] == []
+    assert sections["---LOGS---"] == []
+    assert sections["---HOSTS---"] == []
+
+
+def test_simplify_log_name():
+    """Test removing job IDs from service, client and job array log names."""
+    assert _simplify_log_name("redis-cache_3940121.out") == "redis-cache_service.out"
+    assert _simplify_log_name("redis-client_3940122.err") == "redis-client_client.err"
+    # Job array task: "<prefix>-<i>_<array job id>_<i>"
+    assert _simplify_log_name("client-2_3940130_2.out") == "client-2_client.out"
+    assert _simplify_log_name("client-12_3940130_12.err") == "client-12_client.err"
+    # The task index must match the prefix to count as an array task
+    assert _simplify_log_name("client-2_3940130_3.out") == "client-2_3940130_client.out"
+    assert _simplify_log_name("nounderscore.out") == "nounderscore.out"
+
+
+def _fake_download(calls):
+    """Return a download_files replacement that writes the requested files."""
+    def download_files(communicator, remote_dir, remote_files, local_dir, compress=True):
+        calls.append(list(remote_files))
+        names = []
+        for remote_file in remote_files:
+            name = Path(remote_file).name
+            (local_dir / name).write_text("log")
+            names.append(name)
+        return names
+    return download_files
+
+
+def test_download_logs_skips_unchanged(monkeypatch):
+    """Test that logs are only downloaded again when they change or go missing."""
+    calls = []
+    monkeypatch.setattr(collector, "download_files", _fake_download(calls))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results_dir = Path(tmpdir)
+        log_stats = {
+            "/wd/logs/svc_100.out": [10, 1000],
+            "/wd/logs/client-1_101_1.out": [20, 1001],
+        }
+
+        assert download_logs("b1", "/wd", results_dir, None, dict(log_stats))
+        assert calls == [list(log_stats)]
+        assert (results_dir / "logs" / "svc_service.out").exists()
+        assert (results_dir / "logs" / "client-1_client.out").exists()
+        assert _load_manifest(results_dir) == log_stats
+
+        # Nothing changed: no download
+        assert download_logs("b1", "/wd", results_dir, None, dict(log_stats))
+        assert len(calls) == 1
+
+        # A grown log is downloaded again, the other one is not
+        log_stats["/wd/logs/svc_100.out"] = [15, 1005]
+        assert download_logs("b1", "/wd", results_dir, None, dict(log_stats))
+        assert calls[-1] == ["/wd/logs/svc_100.out"]
+        assert _load_manifest(results_dir)["/wd/logs/svc_100.out"] == [15, 1005]
+
+        # A deleted local copy is downloaded again even though it is unchanged
+        (results_dir / "logs" / "client-1_client.out").unlink()
+        assert download_logs("b1", "/wd", results_dir, None, dict(log_stats))
+        assert calls[-1] == ["/wd/logs/client-1_101_1.out"]
+
+
+def test_download_logs_no_logs(monkeypatch):
+    """Test that an empty log listing reports failure without downloading."""
+    calls = []
+    monkeypatch.setattr(collector, "download_files", _fake_download(calls))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert not download_logs("b1", "/wd", Path(tmpdir), None, {})
+        assert calls == []
+
+
+def test_merge_requests_jsonl_filters_benchmark():
+    """Test merging with the byte-level fast path and the parsing fallback."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results_dir = Path(tmpdir)
+        with open(results_dir / "requests_c-1.jsonl", "w") as f:
+            # Fast path: own ID, compact and spaced separators
+            f.write('{"benchmark_id": "b1", "request_id": 1}\n')
+            f.write('{"benchmark_id":"b1","request_id":2}\n')
+            # Another benchmark
+            f.write(json.dumps({"benchmark_id": "b2", "request_id": 3}) + "\n")
+            # No benchmark_id at all
+            f.write('{"request_id": 4}\n')
+            # Blank line and missing trailing newline
+            f.write("\n")
+            f.write('  {"benchmark_id": "b1", "request_id": 5}  ')
+        with open(results_dir / "requests_c-2.jsonl", "w") as f:
+            # The key appears twice: parsed, and the outer ID decides
+            f.write(
+                json.dumps({"benchmark_id": "b2", "meta": {"benchmark_id": "b1"}})
+                + "\n"
+            )
+            # Other ID with the own one as a prefix: parsed and dropped
+            f.write('{"benchmark_id": "b1-old", "request_id": 6}\n')
+            # Malformed lines are kept
+            f.write('{"benchmark_id": "b2", broken\n')
+
+        merged = merge_requests_jsonl("b1", results_dir)
+
+        assert merged == results_dir / "requests.jsonl"
+        lines = merged.read_text().splitlines()
+        assert lines == [
+            '{"benchmark_id": "b1", "request_id": 1}',
+            '{"benchmark_id":"b1","request_id":2}',
+            '{"request_id": 4}',
+            '{"benchmark_id": "b1", "request_id": 5}',
+            '{"benchmark_id": "b2", broken',
+        ]
+        assert not list(results_dir.glob("requests_*.jsonl"))
+
+
+def test_merge_requests_jsonl_no_files():
+    """Test that merging without client files returns None."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert merge_requests_jsonl("b1", tmpdir) is None
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
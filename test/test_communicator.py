@@ -0,0 +1,239 @@
+"""
+Unit tests for SSHCommunicator code paths that can run without a cluster.
+"""
+
+import os
+import subprocess
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from infra.communicator import SSHCommunicator
+
+
+class LocalShellChannel:
+    """
+    Stand-in for a Paramiko channel whose exec_command runs locally.
+
+    Output is pumped into buffers by background threads, like Paramiko's
+    transport thread does, and a pipe becomes readable whenever something
+    arrives so the channel can be passed to select().
+    """
+
+    def __init__(self):
+        self.closed = False
+        self._proc = None
+        self._out = bytearray()
+        self._err = bytearray()
+        self._lock = threading.Lock()
+        self._pumps = []
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+
+    def exec_command(self, command):
+        self._proc = subprocess.Popen(
+            ["bash", "-c", command],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        for stream, buffer in ((self._proc.stdout, self._out), (self._proc.stderr, self._err)):
+            pump = threading.Thread(target=self._pump, args=(stream, buffer), daemon=True)
+            pump.start()
+            self._pumps.append(pump)
+
+    def _pump(self, stream, buffer):
+        while True:
+            chunk = os.read(stream.fileno(), 65536)
+            with self._lock:
+                buffer += chunk
+            os.write(self._wake_w, b"x")
+            if not chunk:
+                return
+
+    def _take(self, buffer, size):
+        try:
+            os.read(self._wake_r, 65536)
+        except BlockingIOError:
+            pass
+        with self._lock:
+            data = bytes(buffer[:size])
+            del buffer[:size]
+        return data
+
+    def fileno(self):
+        return self._wake_r
+
+    def sendall(self, data):
+        self._proc.stdin.write(data)
+        self._proc.stdin.flush()
+
+    def recv_ready(self):
+        with self._lock:
+            return bool(self._out)
+
+    def recv(self, size):
+        return self._take(self._out, size)
+
+    def recv_stderr_ready(self):
+        with self._lock:
+            return bool(self._err)
+
+    def recv_stderr(self, size):
+        return self._take(self._err, size)
+
+    def exit_status_ready(self):
+        return self._proc.poll() is not None and not any(p.is_alive() for p in self._pumps)
+
+    def recv_exit_status(self):
+        return self._proc.wait()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._proc.kill()
+            self._proc.wait()
+
+
+def make_shell_communicator():
+    """Create a persistent-shell SSHCommunicator whose channels run locally."""
+    channels = []
+
+    def open_session():
+        channel = LocalShellChannel()
+        channels.append(channel)
+        return channel
+
+    transport = SimpleNamespace(open_session=open_session)
+    connection = SimpleNamespace(client=SimpleNamespace(get_transport=lambda: transport))
+    communicator = SSHCommunicator("fake", persistent_shell=True, command_timeout=10)
+    communicator._ensure_connection = lambda: connection
+    return communicator, channels
+
+
+def test_persistent_shell_output_and_exit_code():
+    """Test that stdout, stderr and exit codes are split at the sentinels."""
+    communicator, channels = make_shell_communicator()
+    try:
+        result = communicator.execute_command("echo out; echo err >&2; printf 'no newline'")
+        assert result.stdout == "out\nno newline"
+        assert result.stderr == "err"
+        assert result.return_code == 0
+
+        result = communicator.execute_command("echo '>>'; exit 7")
+        assert result.stdout == ">>"
+        assert result.return_code == 7
+
+        assert communicator.execute_command("pwd", working_dir="/").stdout == "/"
+        # cd and variables stay inside the command's subshell
+        communicator.execute_command("cd /tmp; export FOO=1")
+        assert communicator.execute_command("pwd").stdout == os.getcwd()
+        assert communicator.execute_command("echo ${FOO:-unset}").stdout == "unset"
+
+        # Every command ran through the one shell
+        assert len(channels) == 1
+    finally:
+        communicator._close_shell()
+
+
+def test_persistent_shell_restarts_after_shell_exit():
+    """Test that a shell killed by a command is reported and replaced."""
+    communicator, channels = make_shell_communicator()
+    try:
+        result = communicator.execute_command("echo before; kill -9 $$")
+        assert result.return_code != 0
+        assert communicator._shell_channel is None
+
+        assert communicator.execute_command("echo again").stdout == "again"
+        assert len(channels) == 2
+    finally:
+        communicator._close_shell()
+
+
+def test_persistent_shell_restarts_after_timeout():
+    """Test that a timed-out command fails and the next one gets a fresh shell."""
+    communicator, channels = make_shell_communicator()
+    try:
+        result = communicator.execute_command("sleep 30", timeout=1)
+        assert result.return_code == -1
+        assert "did not complete within 1 seconds" in result.stderr
+        assert channels[0].closed
+
+        assert communicator.execute_command("echo fresh").stdout == "fresh"
+        assert len(channels) == 2
+    finally:
+        communicator._close_shell()
+
+
+def make_status_communicator(squeue_output, sacct_output=b"", sacct_code=0):
+    """Create an SSHCommunicator answering squeue and sacct with canned bytes."""
+    communicator = SSHCommunicator("fake")
+    communicator.commands = []
+
+    def execute_bytes(command, timeout=None):
+        communicator.commands.append(command)
+        if command.startswith("squeue"):
+            return 1 if not squeue_output else 0, squeue_output
+        return sacct_code, sacct_output
+
+    communicator._execute_bytes = execute_bytes
+    return communicator
+
+
+def test_job_statuses_from_squeue():
+    """Test squeue parsing, including array tasks listed one per line."""
+    communicator = make_status_communicator(
+        b"100 RUNNING\n200_1 RUNNING\n200_2 PENDING\n  200_3   PENDING  \n"
+    )
+    statuses = communicator.get_job_statuses(["100", "200_1", "200_2", "200_3", None])
+    assert statuses == {
+        "100": "RUNNING",
+        "200_1": "RUNNING",
+        "200_2": "PENDING",
+        "200_3": "PENDING",
+    }
+    # Every job was queued, so sacct was not needed
+    assert len(communicator.commands) == 1
+    assert communicator.commands[0].startswith("squeue -r -j 100,200_1,200_2,200_3 ")
+
+
+def test_job_statuses_fall_back_to_sacct():
+    """Test that jobs missing from squeue are looked up in sacct."""
+    communicator = make_status_communicator(
+        b"",
+        b"300|COMPLETED\n"
+        b"300.batch|COMPLETED\n"
+        b"300.0|FAILED\n"
+        b"301|CANCELLED by 1234\n"
+        b"302_4|TIMEOUT\n"
+        b"999|FAILED\n",
+    )
+    statuses = communicator.get_job_statuses(["300", "301", "302_4", "303"])
+    assert statuses == {"300": "COMPLETED", "301": "CANCELLED", "302_4": "TIMEOUT"}
+    assert communicator.commands[1].startswith("sacct -X -j 300,301,302_4,303 ")
+
+
+def test_job_statuses_partial_squeue():
+    """Test that sacct is only asked about the jobs squeue did not list."""
+    communicator = make_status_communicator(b"400 RUNNING\n", b"401|FAILED\n")
+    assert communicator.get_job_statuses(["400", "401"]) == {
+        "400": "RUNNING",
+        "401": "FAILED",
+    }
+    assert communicator.commands[1].startswith("sacct -X -j 401 ")
+
+
+def test_job_statuses_sacct_failure():
+    """Test that a failing sacct leaves unknown jobs out."""
+    communicator = make_status_communicator(b"", b"500|COMPLETED\n", sacct_code=1)
+    assert communicator.get_job_statuses(["500"]) == {}
+    assert communicator.get_job_statuses([]) == {}
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
@@ -7,6 +7,7 @@ These tests verify deterministic behavior and expected outcomes for:
 - KF4: Regression detection with configurable thresholds
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -138,6 +139,10 @@ class TestKF4RegressionDetection:
         # Custom threshold (20%) should PASS
         result_custom = compare_summaries(baseline, current, {"latency_pct": 20.0})
         assert result_custom["verdict"] == "PASS", "15% increase should pass with 20% threshold"
+        # Overrides go into the returned config, never into the shared defaults
+        assert result_custom["thresholds"]["latency_pct"] == 20.0
+        assert DEFAULT_REGRESSION_THRESHOLDS["latency_pct"] == 10.0
+        json.dumps(result_custom)
 
     def test_improvements_are_tracked(self):
         """Improvements should be tracked separately."""
@@ -7,13 +7,16 @@ monitors them, and persists their state.
 """
 
 import sys
+import tempfile
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from manager import Manager
-from service import Service
+from core.manager import Manager
+from infra.communicator import CommandResult
+from infra.storage import CSVStorageBackend, StorageManager
+from models.service import Service
 
 
 def example_deploy_service():
@@ -148,6 +151,189 @@ def example_manager_methods():
         print(f"  Found {len(services)} service(s)")
 
 
+class FakeCommunicator:
+    """Communicator stand-in that answers commands from canned results."""
+
+    def __init__(self, outputs=None):
+        self._connection = True
+        self.outputs = outputs or {}
+        self.commands = []
+        self.submitted = []
+        # Job ID (or None) returned by each submission, in order
+        self.submit_results = []
+
+    def connect(self):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def execute_command(self, command, **kwargs):
+        self.commands.append(command)
+        for prefix, result in self.outputs.items():
+            if command.startswith(prefix):
+                return result
+        return CommandResult("", "", 0)
+
+    def get_job_status(self, job_id):
+        return "RUNNING"
+
+    def submit_inline(self, script_content, script_path):
+        self.submitted.append((script_content, script_path))
+        return self.submit_results.pop(0)
+
+    def submit_inline_many(self, scripts):
+        return [self.submit_inline(content, path) for content, path in scripts]
+
+
+def make_manager(monkeypatch, tmpdir, communicator):
+    """Create a connected Manager on a fake communicator and temporary storage."""
+    import core.manager
+
+    monkeypatch.setattr(core.manager, "SSHCommunicator", lambda target: communicator)
+    manager = Manager(
+        target="fake",
+        benchmark_id="bench-1",
+        working_dir="/work/bench-1",
+        storage_manager=StorageManager(CSVStorageBackend(tmpdir)),
+    )
+    assert manager.connect()
+    return manager
+
+
+def test_queued_jobs_for_script_groups_array_tasks(monkeypatch):
+    """Test that pending and running array tasks map to the array's base job ID."""
+    script = "/work/bench-1/scripts/client-array.sh"
+    squeue = CommandResult(
+        "\n".join([
+            f"500 {script}",  # Pending tasks of the array (500_[3-4])
+            f"500 {script}",  # Running task 500_1, own job ID 501
+            f"500 {script}",  # Running task 500_2, own job ID 502
+            "490 /work/bench-1/scripts/other.sh",
+        ]) + "\n",
+        "",
+        0,
+    )
+    communicator = FakeCommunicator({"squeue": squeue})
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = make_manager(monkeypatch, tmpdir, communicator)
+        assert manager._queued_jobs_for_script(script) == ["500"]
+        assert manager._queued_jobs_for_script("/nowhere.sh") == []
+    assert '"%F %o"' in communicator.commands[-1]
+
+
+def test_queued_jobs_for_script_squeue_failure(monkeypatch):
+    """Test that a failing squeue is reported as unknown rather than empty."""
+    communicator = FakeCommunicator({"squeue": CommandResult("", "error", 1)})
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = make_manager(monkeypatch, tmpdir, communicator)
+        assert manager._queued_jobs_for_script("/work/x.sh") is None
+
+
+def make_service():
+    """Create a running service to deploy clients against."""
+    return Service(
+        name="redis", container_image="redis:latest", job_id="100", port=6379, hostname="mel0001"
+    )
+
+
+def test_client_array_script(monkeypatch):
+    """Test the job array header, log names and per-task client name."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = make_manager(monkeypatch, tmpdir, FakeCommunicator())
+        script = manager._create_client_sbatch_script(
+            client_name="client",
+            service_name="redis",
+            service_hostname="mel0001",
+            service_port=6379,
+            service_url="",
+            benchmark_command="run-bench",
+            array_size=3,
+        )
+    assert "#SBATCH --job-name=client\n" in script
+    assert "#SBATCH --array=1-3\n" in script
+    assert "#SBATCH --output=/work/bench-1/logs/client-%a_%A_%a.out" in script
+    assert "#SBATCH --error=/work/bench-1/logs/client-%a_%A_%a.err" in script
+    assert "client-${SLURM_ARRAY_TASK_ID}" in script
+
+
+def test_deploy_multiple_clients_as_array(monkeypatch):
+    """Test that several clients are submitted once and addressed as array tasks."""
+    communicator = FakeCommunicator()
+    communicator.submit_results = ["700"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = make_manager(monkeypatch, tmpdir, communicator)
+        clients = manager.deploy_multiple_clients(
+            "redis", "run-bench", 3, service=make_service()
+        )
+
+        assert len(communicator.submitted) == 1
+        script, script_path = communicator.submitted[0]
+        assert script_path == "/work/bench-1/scripts/client-array.sh"
+        assert "--array=1-3" in script
+        assert [(c.name, c.job_id) for c in clients] == [
+            ("client-1", "700_1"), ("client-2", "700_2"), ("client-3", "700_3")
+        ]
+        # Matches the %a_%A_%a log name Slurm writes for task 2
+        assert clients[1].log_file == "/work/bench-1/logs/client-2_700_2.out"
+        saved = manager.storage_manager.load_all_entities("bench-1", "client")
+        assert sorted(row["job_id"] for row in saved) == ["700_1", "700_2", "700_3"]
+
+
+def test_deploy_array_recovers_queued_array(monkeypatch):
+    """Test that a failed submission whose array is queued is not resubmitted."""
+    script = "/work/bench-1/scripts/client-array.sh"
+    communicator = FakeCommunicator(
+        {"squeue": CommandResult(f"710 {script}\n710 {script}\n", "", 0)}
+    )
+    communicator.submit_results = [None]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = make_manager(monkeypatch, tmpdir, communicator)
+        clients = manager.deploy_multiple_clients(
+            "redis", "run-bench", 2, service=make_service()
+        )
+    assert len(communicator.submitted) == 1
+    assert [c.job_id for c in clients] == ["710_1", "710_2"]
+
+
+def test_deploy_array_falls_back_to_individual_jobs(monkeypatch):
+    """Test that clients are submitted one by one when the array is not queued."""
+    import core.manager
+
+    monkeypatch.setattr(core.manager, "HAS_ASYNCSSH", False)
+    communicator = FakeCommunicator({"squeue": CommandResult("", "", 0)})
+    communicator.submit_results = [None, "801", None, "803"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = make_manager(monkeypatch, tmpdir, communicator)
+        clients = manager.deploy_multiple_clients(
+            "redis", "run-bench", 3, service=make_service()
+        )
+
+        assert [path for _, path in communicator.submitted] == [
+            "/work/bench-1/scripts/client-array.sh",
+            "/work/bench-1/scripts/client-1.sh",
+            "/work/bench-1/scripts/client-2.sh",
+            "/work/bench-1/scripts/client-3.sh",
+        ]
+        assert "--array" not in communicator.submitted[1][0]
+        assert [(c.name, c.job_id) for c in clients] == [("client-1", "801"), ("client-3", "803")]
+        saved = manager.storage_manager.load_all_entities("bench-1", "client")
+        assert sorted(row["_id"] for row in saved) == ["client-1", "client-3"]
+
+
+def test_deploy_array_unknown_outcome_does_not_resubmit(monkeypatch):
+    """Test that nothing is resubmitted when the queue cannot be checked."""
+    communicator = FakeCommunicator({"squeue": CommandResult("", "error", 1)})
+    communicator.submit_results = [None]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = make_manager(monkeypatch, tmpdir, communicator)
+        clients = manager.deploy_multiple_clients(
+            "redis", "run-bench", 3, service=make_service()
+        )
+    assert clients == []
+    assert len(communicator.submitted) == 1
+
+
 def main():
     """Run examples."""
     print("\n" + "=" * 60)
@@ -0,0 +1,123 @@
+"""
+Unit tests for the CSV storage backend and its row cache.
+"""
+
+import csv
+import os
+import tempfile
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from infra.storage import CSVStorageBackend, StorageManager
+
+
+def test_save_and_load():
+    """Test a save/load round trip with nested values."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        backend = CSVStorageBackend(tmpdir)
+        assert backend.save("b1", "service", "svc", {"name": "redis", "ports": [1, 2]})
+
+        assert backend.load("b1", "service", "svc") == {"name": "redis", "ports": [1, 2]}
+        assert backend.load("b1", "service", "missing") is None
+        assert backend.load_all("b1", "client") == []
+
+        # Job array task IDs are not numbers
+        backend.save("b1", "client", "c-1", {"job_id": "700_1", "port": 8080})
+        assert backend.load("b1", "client", "c-1") == {"job_id": "700_1", "port": 8080}
+
+
+def test_save_many():
+    """Test that save_many writes all entities and updates existing ones."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        backend = CSVStorageBackend(tmpdir)
+        backend.save("b1", "client", "c-0", {"name": "old"})
+
+        assert backend.save_many(
+            "b1",
+            "client",
+            [("c-0", {"name": "new"}), ("c-1", {"name": "one"}), ("c-1", {"name": "last"})],
+        )
+        assert backend.save_many("b1", "client", [])
+
+        rows = backend.load_all("b1", "client")
+        assert [(row["_id"], row["name"]) for row in rows] == [("c-0", "new"), ("c-1", "last")]
+
+
+def test_write_invalidates_cache():
+    """Test that saves and deletes are visible to the next load."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        backend = CSVStorageBackend(tmpdir)
+        backend.save("b1", "client", "c-0", {"status": "PENDING"})
+        assert backend.load("b1", "client", "c-0") == {"status": "PENDING"}
+
+        backend.save("b1", "client", "c-0", {"status": "RUNNING"})
+        assert backend.load("b1", "client", "c-0") == {"status": "RUNNING"}
+
+        backend.save("b1", "client", "c-1", {"status": "PENDING"})
+        assert len(backend.load_all("b1", "client")) == 2
+
+        assert backend.delete("b1", "client", "c-0")
+        assert backend.load("b1", "client", "c-0") is None
+        assert [row["_id"] for row in backend.load_all("b1", "client")] == ["c-1"]
+
+
+def test_external_rewrite_invalidates_cache():
+    """Test that writes from another backend or process are picked up."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reader = CSVStorageBackend(tmpdir)
+        writer = CSVStorageBackend(tmpdir)
+        writer.save("b1", "service", "svc", {"status": "PENDING"})
+        assert reader.load("b1", "service", "svc") == {"status": "PENDING"}
+
+        writer.save("b1", "service", "svc", {"status": "COMPLETED"})
+        assert reader.load("b1", "service", "svc") == {"status": "COMPLETED"}
+
+        # Same size, different content: only the mtime tells them apart
+        csv_path = Path(tmpdir) / "b1" / "service.csv"
+        stat = csv_path.stat()
+        with open(csv_path, "w", newline="") as f:
+            csv_writer = csv.writer(f)
+            csv_writer.writerow(["_id", "status"])
+            csv_writer.writerow(["svc", "CANCELLED"])
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert csv_path.stat().st_size == stat.st_size
+        assert reader.load("b1", "service", "svc") == {"status": "CANCELLED"}
+
+
+def test_loads_return_copies():
+    """Test that mutating loaded entities does not change the cached rows."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        backend = CSVStorageBackend(tmpdir)
+        backend.save("b1", "service", "svc", {"name": "redis", "ports": [1, 2]})
+
+        loaded = backend.load("b1", "service", "svc")
+        loaded["name"] = "changed"
+        loaded["ports"].append(3)
+
+        rows = backend.load_all("b1", "service")
+        rows[0]["ports"].append(4)
+        rows.append({"_id": "extra"})
+
+        assert backend.load("b1", "service", "svc") == {"name": "redis", "ports": [1, 2]}
+        assert backend.load_all("b1", "service") == [
+            {"_id": "svc", "name": "redis", "ports": [1, 2]}
+        ]
+
+
+def test_storage_manager_save_entities():
+    """Test the StorageManager facade over save_many."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = StorageManager(CSVStorageBackend(tmpdir))
+        assert manager.save_entities(
+            "b1", "client", [("c-0", {"name": "a"}), ("c-1", {"name": "b"})]
+        )
+        assert manager.load_entity("b1", "client", "c-1") == {"name": "b"}
+        assert manager.list_benchmarks() == ["b1"]
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])